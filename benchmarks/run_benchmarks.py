@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Benchmark Runner
+Times the pipeline's hot paths on synthetic corpora and stores the results as JSON
+
+Each case is timed on a corpus from synthetic_corpus.py (1k and 100k records
+by default, 1m on request) inside a scratch working directory, so the
+scripts' relative data/ paths never touch the repository's data. Script
+output is discarded and tracing is off while timing.
+
+Results are written to benchmarks/results/<commit>-<timestamp>.json and can
+be compared across commits with the compare command. Each case's time is
+also stored relative to a fixed calibration loop timed in the same process
+between the cases, which compares across machines (the full_qc_audit --perf
+gate uses the relative timings).
+
+The startup command measures each entry point's import time with
+python -X importtime in a fresh interpreter and checks it against
+STARTUP_BUDGETS.
+
+Usage:
+    python benchmarks/run_benchmarks.py run
+    python benchmarks/run_benchmarks.py run --sizes 1k 100k 1m --cases dedupe merge
+    python benchmarks/run_benchmarks.py compare benchmarks/results/A.json benchmarks/results/B.json
+    python benchmarks/run_benchmarks.py startup
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT, 'scripts')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from synthetic_corpus import CORPUS_SIZES, DEFAULT_SEED, generate_corpus, write_corpus  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+RESULTS_FORMAT_VERSION = 1
+
+DEFAULT_SIZES = ('1k', '100k')
+DEFAULT_REPEAT = 3
+
+# Slowdown factor the compare command reports as a regression
+REGRESSION_THRESHOLD = 1.2
+
+# Records in the calibration loop (about 25 ms on a typical runner)
+CALIBRATION_RECORDS = 5000
+
+# Entry point -> module its script imports at start-up (relative to scripts/)
+ENTRY_POINTS = {
+    'run_all': 'run_all',
+    'scrape_all': 'scrapers.scrape_all',
+    'qc_validator': 'qc_validator',
+    'validate_and_merge': 'validate_and_merge',
+    'generate_programs': 'generate_programs',
+    'comprehensive_qc_check': 'comprehensive_qc_check',
+    'full_qc_audit': 'full_qc_audit',
+    'local_monitor': 'local_monitor',
+    'pipeline': 'pipeline',
+}
+
+# Cold-start import budget per entry point, in seconds. Heavy dependencies
+# (pandas, jsonschema, requests, pdfplumber) are imported where they are
+# used, so none of these should load them just to start.
+STARTUP_BUDGETS = {
+    'run_all': 0.15,
+    'scrape_all': 0.15,
+    'qc_validator': 0.15,
+    'validate_and_merge': 0.1,
+    'generate_programs': 0.1,
+    'comprehensive_qc_check': 0.15,
+    'full_qc_audit': 0.25,
+    'local_monitor': 0.1,
+    'pipeline': 0.3,
+}
+STARTUP_REPEAT = 5
+
+# Heaviest direct imports listed per entry point
+STARTUP_TOP_IMPORTS = 3
+
+# ANSI color codes
+COLOR_GREEN = '\033[92m'
+COLOR_ORANGE = '\033[93m'
+COLOR_BLUE = '\033[94m'
+COLOR_RESET = '\033[0m'
+
+def log_info(msg):
+    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+
+def log_success(msg):
+    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+
+def log_warning(msg):
+    print(f"{COLOR_ORANGE}⚠️  {msg}{COLOR_RESET}")
+
+# name -> setup(records, corpus_path, workdir) returning the callable to time
+CASES = {}
+
+def case(name):
+    """Register a benchmark case"""
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+@case('keyword_scoring')
+def _keyword_scoring(records, corpus_path, workdir):
+    from global_keywords import calculate_keyword_score
+    texts = [f"{opp['title']} {opp['description']}" for opp in records]
+    return lambda: [calculate_keyword_score(text) for text in texts]
+
+@case('dedupe')
+def _dedupe(records, corpus_path, workdir):
+    from validate_and_merge import deduplicate_opportunities
+    return lambda: deduplicate_opportunities(records)
+
+@case('merge')
+def _merge(records, corpus_path, workdir):
+    from validate_and_merge import merge_opportunities
+    missing = os.path.join(workdir, 'no_existing_file.json')
+    return lambda: merge_opportunities(missing, [dict(opp) for opp in records])
+
+@case('priority_score_merge')
+def _priority_score_merge(records, corpus_path, workdir):
+    from validate_and_merge import calculate_priority_score
+    return lambda: [calculate_priority_score(opp) for opp in records]
+
+@case('priority_score_programs')
+def _priority_score_programs(records, corpus_path, workdir):
+    from generate_programs import calculate_priority_score
+    return lambda: [calculate_priority_score(opp) for opp in records]
+
+@case('schema_validation')
+def _schema_validation(records, corpus_path, workdir):
+    from qc_validator import validate_opportunities_file
+    return lambda: validate_opportunities_file(corpus_path, cache_path=None)
+
+@case('source_matrix')
+def _source_matrix(records, corpus_path, workdir):
+    from qc_validator import generate_source_verification_matrix
+    from validate_and_merge import calculate_priority_score
+    scored = [dict(opp, priorityScore=calculate_priority_score(opp)) for opp in records]
+    return lambda: generate_source_verification_matrix({'opportunities': scored})
+
+@case('generate_programs_json')
+def _generate_programs_json(records, corpus_path, workdir):
+    from generate_programs import generate_programs_json
+    return generate_programs_json
+
+@contextmanager
+def _benchmark_environment(workdir):
+    """Run in workdir with tracing off (it adds per-call overhead and writes trace files)"""
+    previous_dir, previous_trace = os.getcwd(), os.environ.get('NUVIEW_TRACE')
+    os.chdir(workdir)
+    os.environ['NUVIEW_TRACE'] = '0'
+    try:
+        yield
+    finally:
+        os.chdir(previous_dir)
+        if previous_trace is None:
+            os.environ.pop('NUVIEW_TRACE', None)
+        else:
+            os.environ['NUVIEW_TRACE'] = previous_trace
+
+def time_case(func, repeat=DEFAULT_REPEAT):
+    """
+    Time repeated calls of func with its output discarded.
+
+    Returns:
+        list: Seconds per call
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+def calibration_loop(size=CALIBRATION_RECORDS):
+    """
+    Fixed pure-Python workload (dicts, strings, JSON, sorting) used as the unit of machine speed.
+
+    It exercises the same interpreter paths as the cases, so a case's time
+    divided by this loop's time stays roughly constant across hosts.
+    """
+    records = [{'id': f"rec-{i}", 'title': f"Topographic LiDAR Survey {i % 97}", 'value': (i * 7919) % 10007}
+               for i in range(size)]
+    decoded = json.loads(json.dumps(records))
+    decoded.sort(key=lambda r: (r['value'], r['id']))
+    return sum(len(r['title'].lower().split()) for r in decoded)
+
+def peak_memory(func):
+    """
+    Peak Python heap allocation of one call of func (tracemalloc), output discarded.
+
+    Returns:
+        int: Bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with redirect_stdout(io.StringIO()):
+            func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def parse_importtime(output, module):
+    """
+    Read a module's cumulative import time from python -X importtime output.
+
+    Args:
+        output (str): The interpreter's stderr
+        module (str): Top-level module imported by the command
+
+    Returns:
+        tuple: (seconds, [(direct import, seconds), ...] heaviest first)
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(cumulative_us) / 1e6))
+
+    # Children are listed before their parent, after the previous top-level import
+    for index in range(len(rows) - 1, -1, -1):
+        depth, name, seconds = rows[index]
+        if depth == 0 and name == module:
+            children = []
+            for child_depth, child, child_seconds in reversed(rows[:index]):
+                if child_depth == 0:
+                    break
+                if child_depth == 1:
+                    children.append((child, child_seconds))
+            children.sort(key=lambda item: item[1], reverse=True)
+            return seconds, children
+    raise ValueError(f"{module} not found in importtime output")
+
+def measure_import_time(module, repeat=STARTUP_REPEAT):
+    """
+    Import a module in fresh interpreters (cwd scripts/) and keep the fastest run.
+
+    Returns:
+        tuple: (seconds, heaviest direct imports) as from parse_importtime
+    """
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                                cwd=SCRIPTS_DIR, capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed: {result.stderr.strip().splitlines()[-1]}")
+        measured = parse_importtime(result.stderr, module)
+        if best is None or measured[0] < best[0]:
+            best = measured
+    return best
+
+def measure_startup(entry_points=None, repeat=STARTUP_REPEAT):
+    """
+    Measure the import time of each entry point against its budget.
+
+    Args:
+        entry_points (iterable): Names from ENTRY_POINTS (default: all)
+        repeat (int): Fresh interpreters per entry point (the fastest counts)
+
+    Returns:
+        list: dicts with entry_point, seconds, budget, over_budget and top_imports
+    """
+    results = []
+    for name in entry_points or ENTRY_POINTS:
+        seconds, children = measure_import_time(ENTRY_POINTS[name], repeat)
+        budget = STARTUP_BUDGETS.get(name)
+        results.append({
+            'entry_point': name,
+            'seconds': seconds,
+            'budget': budget,
+            'over_budget': budget is not None and seconds > budget,
+            'top_imports': children[:STARTUP_TOP_IMPORTS],
+        })
+    return results
+
+def git_commit():
+    """Short hash of HEAD, or 'unknown' outside a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+def run_benchmarks(sizes=DEFAULT_SIZES, cases=None, repeat=DEFAULT_REPEAT, seed=DEFAULT_SEED, memory=False):
+    """
+    Run the selected cases on each corpus size.
+
+    Args:
+        sizes (iterable): Corpus sizes ('1k', '100k', '1m' or record counts)
+        cases (iterable): Case names (default: all)
+        repeat (int): Timed calls per case
+        seed (int): Corpus seed
+        memory (bool): Also record peak heap allocation (one extra, untimed call)
+
+    Returns:
+        dict: Results document (see RESULTS_FORMAT_VERSION)
+    """
+    selected = list(cases or CASES)
+    unknown = [name for name in selected if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+
+    results = []
+    calibration_timings = []
+    for size_name in sizes:
+        size = CORPUS_SIZES.get(str(size_name).lower()) or int(size_name)
+        records = generate_corpus(size, seed)
+
+        workdir = tempfile.mkdtemp(prefix='nuview-bench-')
+        try:
+            os.symlink(os.path.join(ROOT, 'schemas'), os.path.join(workdir, 'schemas'))
+            corpus_path = write_corpus(records, os.path.join(workdir, 'data', 'opportunities.json'))
+
+            with _benchmark_environment(workdir):
+                for name in selected:
+                    func = CASES[name](records, corpus_path, workdir)
+                    # Sampled between the cases, so it sees the same machine state they do
+                    calibration_timings.extend(time_case(calibration_loop, repeat))
+                    timings = time_case(func, repeat)
+                    best = min(timings)
+                    result = {
+                        'case': name,
+                        'size': size,
+                        'repeat': repeat,
+                        'min': best,
+                        'median': statistics.median(timings),
+                        'mean': statistics.fmean(timings),
+                        'records_per_second': size / best if best else None,
+                    }
+                    line = f"{name:<26} {size:>8} records  {best:>9.4f}s  ({size / best:,.0f} rec/s)"
+                    if memory:
+                        result['peak_bytes'] = peak_memory(func)
+                        line += f"  peak {result['peak_bytes'] / 1e6:.1f} MB"
+                    results.append(result)
+                    log_info(line)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    # The median of all samples is steadier than any single case's neighbours
+    calibration = statistics.median(calibration_timings) if calibration_timings else None
+    for result in results:
+        result['relative'] = result['min'] / calibration if calibration else None
+
+    return {
+        'version': RESULTS_FORMAT_VERSION,
+        'commit': git_commit(),
+        'created': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'calibration': calibration,
+        'results': results,
+    }
+
+def write_results(document, path=None):
+    """
+    Save a results document (default: benchmarks/results/<commit>-<timestamp>.json).
+
+    Returns:
+        str: The path written
+    """
+    if path is None:
+        stamp = document['created'].replace(':', '').replace('-', '')[:15]
+        path = os.path.join(RESULTS_DIR, f"{document['commit']}-{stamp}.json")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+def compare_results(base, new, threshold=REGRESSION_THRESHOLD):
+    """
+    Pair up the cases of two results documents.
+
+    Args:
+        base (dict): Earlier results document
+        new (dict): Later results document
+        threshold (float): new/base ratio above which a case counts as regressed
+
+    Returns:
+        list: (case, size, base min, new min, ratio, regressed) for cases in both
+    """
+    base_times = {(r['case'], r['size']): r['min'] for r in base['results']}
+    rows = []
+    for r in new['results']:
+        key = (r['case'], r['size'])
+        if key not in base_times:
+            continue
+        ratio = r['min'] / base_times[key] if base_times[key] else float('inf')
+        rows.append((r['case'], r['size'], base_times[key], r['min'], ratio, ratio > threshold))
+    return rows
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def main(argv=None):
+    """Run benchmarks or compare two result files"""
+    parser = argparse.ArgumentParser(description='NUVIEW pipeline benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks and save the results')
+    run_parser.add_argument('--sizes', nargs='+', default=list(DEFAULT_SIZES),
+                            help=f"Corpus sizes ({', '.join(CORPUS_SIZES)} or record counts)")
+    run_parser.add_argument('--cases', nargs='+', choices=sorted(CASES), help='Cases to run (default: all)')
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timed calls per case')
+    run_parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Corpus seed')
+    run_parser.add_argument('--memory', action='store_true', help='Also record peak heap allocation per case')
+    run_parser.add_argument('-o', '--output', help='Results path (default: benchmarks/results/)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('base', help='Earlier results file')
+    compare_parser.add_argument('new', help='Later results file')
+    compare_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                                help='Slowdown factor reported as a regression')
+
+    startup_parser = subparsers.add_parser('startup', help='Check entry point import times against their budgets')
+    startup_parser.add_argument('--entry-points', nargs='+', choices=sorted(ENTRY_POINTS),
+                                help='Entry points to measure (default: all)')
+    startup_parser.add_argument('--repeat', type=int, default=STARTUP_REPEAT,
+                                help='Fresh interpreters per entry point (the fastest counts)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'startup':
+        print(f"{'entry point':<24} {'import s':>9} {'budget s':>9}  heaviest imports")
+        results = measure_startup(args.entry_points, args.repeat)
+        for result in results:
+            top = ', '.join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in result['top_imports'])
+            line = f"{result['entry_point']:<24} {result['seconds']:>9.3f} {result['budget'] or 0:>9.3f}  {top}"
+            if result['over_budget']:
+                log_warning(line)
+            else:
+                print(line)
+
+        over = sum(1 for result in results if result['over_budget'])
+        if over:
+            log_warning(f"{over} entry point(s) over their start-up budget")
+            return 1
+        log_success("All entry points within their start-up budget")
+        return 0
+
+    if args.command == 'run':
+        document = run_benchmarks(args.sizes, args.cases, args.repeat, args.seed, args.memory)
+        log_success(f"Results saved to {write_results(document, args.output)}")
+        return 0
+
+    base, new = _load(args.base), _load(args.new)
+    print(f"{base.get('commit')} -> {new.get('commit')}")
+    print(f"{'case':<26} {'size':>8} {'base s':>10} {'new s':>10} {'ratio':>7}")
+    rows = compare_results(base, new, args.threshold)
+    for name, size, base_min, new_min, ratio, regressed in rows:
+        line = f"{name:<26} {size:>8} {base_min:>10.4f} {new_min:>10.4f} {ratio:>6.2f}x"
+        if regressed:
+            log_warning(line)
+        else:
+            print(line)
+
+    regressions = sum(1 for row in rows if row[5])
+    if regressions:
+        log_warning(f"{regressions} case(s) slower than {args.threshold}x")
+        return 1
+    log_success(f"No case slower than {args.threshold}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
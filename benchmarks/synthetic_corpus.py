@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Synthetic Opportunity Corpus
+Deterministic, multilingual opportunity records for benchmarking
+
+Records are built with BaseScraper.generate_opportunity, so they have exactly
+the shape the scrapers produce. The same (size, seed) always yields the same
+records: ids come from a seeded random generator and scrapedAt is fixed.
+A share of records repeat an earlier title and agency so deduplication has
+work to do.
+
+Usage:
+    python benchmarks/synthetic_corpus.py 100000 -o /tmp/opportunities.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+# Add scripts and scrapers directories to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+sys.path.insert(0, os.path.join(ROOT, 'scripts', 'scrapers'))
+
+from base_scraper import BaseScraper  # noqa: E402
+
+CORPUS_SIZES = {'1k': 1000, '100k': 100000, '1m': 1000000}
+DEFAULT_SEED = 42
+
+# Share of records that duplicate an earlier title/agency
+DUPLICATE_RATE = 0.05
+
+SCRAPED_AT = '2026-01-01T00:00:00Z'
+REFERENCE_DATE = date(2026, 1, 1)
+
+# (agency, pillar, country) of the synthetic sources
+SOURCES = [
+    ('USGS', 'Federal', 'USA'),
+    ('NASA', 'Federal', 'USA'),
+    ('NOAA', 'Federal', 'USA'),
+    ('ESA', 'International Space Agency', 'Europe'),
+    ('JAXA', 'International Space Agency', 'Japan'),
+    ('IGN', 'Additional International', 'France'),
+    ('BKG', 'Additional International', 'Germany'),
+    ('IBGE', 'Additional International', 'Brazil'),
+    ('INEGI', 'Additional International', 'Mexico'),
+    ('KARI', 'Additional International', 'South Korea'),
+    ('CNSA', 'International Space Agency', 'China'),
+    ('World Bank', 'Commercial', 'Global'),
+    ('NSF', 'Research', 'USA'),
+]
+
+# Title templates per language; {region} and {year} are filled in
+TITLE_TEMPLATES = [
+    "Spaceborne LiDAR Topographic Mapping of {region} {year}",
+    "3DEP QL1 Bare-Earth DEM Acquisition - {region} {year}",
+    "ICESat-2 Elevation Data Services for {region}",
+    "Levantamiento LiDAR topográfico y modelo digital de elevación - {region} {year}",
+    "Cartographie topographique par lidar satellitaire - {region} {year}",
+    "Digitales Geländemodell aus Laserscanning - {region} {year}",
+    "Levantamento topográfico com LiDAR orbital - {region} {year}",
+    "{region} 航空レーザ測量 数値標高モデル整備 {year}",
+    "{region} 激光雷达 地形测绘 数字高程模型 {year}",
+    "{region} 라이다 지형 측량 수치표고모델 {year}",
+    "Coastal Bathymetry Survey - {region} {year}",
+    "Geospatial Data as a Service Platform for {region}",
+]
+
+DESCRIPTIONS = [
+    "Large-area spaceborne LiDAR collection producing bare-earth DEM and DSM products.",
+    "Multi-year IDIQ for topographic data collection, processing and elevation services.",
+    "Adquisición de datos LiDAR para modelos digitales del terreno a escala nacional.",
+    "Acquisition de données altimétriques pour le référentiel à grande échelle.",
+    "Nearshore bathymetric survey of harbour approaches and navigation channels.",
+]
+
+REGIONS = ['Alaska', 'Andes', 'Alps', 'Sahel', 'Mekong', 'Patagonia', 'Hokkaido', 'Yunnan',
+           'Gangwon', 'Bavaria', 'Provence', 'Amazonia', 'Sonora', 'Great Lakes']
+
+CATEGORIES = ['DaaS', 'R&D', 'Platform']
+NEXT_ACTIONS = ['Submit Demo Brief', 'Capability Statement', 'Partner Outreach', 'Monitor']
+
+class _CorpusScraper(BaseScraper):
+    """Record factory: reuses the scrapers' generate_opportunity"""
+
+    def scrape(self):
+        return []
+
+def generate_corpus(size, seed=DEFAULT_SEED):
+    """
+    Generate a deterministic list of opportunity records.
+
+    Args:
+        size (int): Number of records
+        seed (int): Random seed
+
+    Returns:
+        list: Opportunity dicts in generate_opportunity shape
+    """
+    rng = random.Random(seed)
+    factories = {source: _CorpusScraper(source[0], source[1], source[2]) for source in SOURCES}
+
+    # generate_opportunity draws its id suffix from the module-level random
+    state = random.getstate()
+    random.seed(seed)
+    records = []
+    try:
+        for i in range(size):
+            source = SOURCES[rng.randrange(len(SOURCES))]
+            if records and rng.random() < DUPLICATE_RATE:
+                original = records[rng.randrange(len(records))]
+                title, source = original['title'], next(s for s in SOURCES if s[0] == original['agency'])
+            else:
+                title = rng.choice(TITLE_TEMPLATES).format(region=rng.choice(REGIONS), year=2026 + i % 5)
+                title = f"{title} #{i}"
+
+            days_until = rng.randint(1, 365)
+            amount = rng.choice([250000, 1500000, 8000000, 25000000, 120000000, 217000000])
+            agency = source[0]
+            opp = factories[source].generate_opportunity(
+                title=title,
+                agency=agency,
+                amount_usd=amount,
+                days_until=days_until,
+                category=rng.choice(CATEGORIES),
+                deadline_str=(REFERENCE_DATE + timedelta(days=days_until)).isoformat(),
+                next_action=rng.choice(NEXT_ACTIONS),
+                description=rng.choice(DESCRIPTIONS),
+                link=f"https://example.org/{agency.lower().replace(' ', '-')}/{i}",
+                agency_link=f"https://example.org/{agency.lower().replace(' ', '-')}",
+            )
+            opp['scrapedAt'] = SCRAPED_AT
+            records.append(opp)
+    finally:
+        random.setstate(state)
+    return records
+
+def write_corpus(records, path):
+    """
+    Write records as an opportunities.json document.
+
+    Returns:
+        str: The path written
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    document = {
+        'meta': {'market_val': '14.13', 'cagr': '19.43', 'updated': SCRAPED_AT, 'totalCount': len(records)},
+        'opportunities': records,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+    return path
+
+def main(argv=None):
+    """Write a synthetic opportunities.json"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic opportunity corpus')
+    parser.add_argument('size', help=f"Record count or one of {', '.join(CORPUS_SIZES)}")
+    parser.add_argument('-o', '--output', default='opportunities.json', help='Output path')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Random seed')
+    args = parser.parse_args(argv)
+
+    size = CORPUS_SIZES.get(args.size.lower()) or int(args.size)
+    write_corpus(generate_corpus(size, args.seed), args.output)
+    print(f"Wrote {size} records to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
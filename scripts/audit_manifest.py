@@ -0,0 +1,221 @@
+"""
+NUVIEW Strategic Pipeline - Audit File Manifest and Verdict Cache
+One repository walk per audit, and per-file verdicts reused across runs
+
+build_manifest walks the tree once and records every file the audit checks
+(path, kind, size, mtime). AuditCache keeps a content hash per file and the
+errors/warnings each check produced for it; a file whose hash is unchanged
+since the last run is not re-checked, its cached verdict is reported instead.
+Hashes are only recomputed when a file's size or mtime changes, so an audit
+costs time proportional to the files that actually changed.
+
+The cache lives in data/cache/qc_audit_cache.json and is keyed on the audit
+rules (the audit script and lint configuration), so editing either
+invalidates every cached verdict.
+"""
+
+import hashlib
+import json
+import os
+
+AUDIT_CACHE_FILE = 'data/cache/qc_audit_cache.json'
+AUDIT_CACHE_VERSION = 1
+
+# File suffix -> manifest kind
+FILE_KINDS = {
+    '.html': 'html',
+    '.py': 'python',
+    '.sh': 'shell',
+    '.json': 'json',
+    '.csv': 'csv',
+    '.md': 'markdown',
+}
+
+# Paths containing this marker are skipped (.git/, .github/, .gitignore, ...)
+EXCLUDED_MARKER = '.git'
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def build_manifest(root='.', excluded_dirs=()):
+    """
+    Walk the repository once and list every file the audit checks.
+
+    Args:
+        root (str): Repository root
+        excluded_dirs (iterable): Relative directories to leave out entirely
+
+    Returns:
+        dict: kind -> list of entries, each {'path', 'size', 'mtime_ns'},
+              in sorted path order
+    """
+    excluded = {os.path.normpath(d) for d in excluded_dirs}
+    manifest = {kind: [] for kind in FILE_KINDS.values()}
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if EXCLUDED_MARKER not in d and os.path.normpath(os.path.join(rel_dir, d)) not in excluded
+        )
+
+        for name in sorted(filenames):
+            kind = FILE_KINDS.get(os.path.splitext(name)[1])
+            if kind is None:
+                continue
+
+            path = os.path.normpath(os.path.join(rel_dir, name))
+            if EXCLUDED_MARKER in path:
+                continue
+
+            try:
+                stat = os.stat(os.path.join(root, path))
+            except OSError:
+                continue
+            manifest[kind].append({'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+
+    return manifest
+
+def file_sha256(path):
+    """Hash a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def rules_version(*paths):
+    """
+    Hash the files that define the audit rules.
+
+    Args:
+        paths (str): Files whose content changes audit verdicts (missing files are ignored)
+
+    Returns:
+        str: Short hash, stored with cached verdicts
+    """
+    digest = hashlib.sha256(str(AUDIT_CACHE_VERSION).encode('utf-8'))
+    for path in paths:
+        digest.update(path.encode('utf-8'))
+        if os.path.exists(path):
+            digest.update(file_sha256(path).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+class AuditCache:
+    """
+    Content hashes and per-check verdicts of audited files.
+
+    Verdicts are stored per file and per check as (errors, warnings) and are
+    returned only while the file's content hash is unchanged.
+    """
+
+    def __init__(self, path=AUDIT_CACHE_FILE, rules=None, enabled=True):
+        self.path = path
+        self.rules = rules
+        self.enabled = enabled
+        self.hashes = {}
+        self.verdicts = {}
+        self.reused = 0
+        self.checked = 0
+        self._fresh_hashes = {}
+        self._fresh_verdicts = {}
+
+        if enabled and path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('version') == AUDIT_CACHE_VERSION:
+                    self.hashes = cached.get('hashes', {})
+                    if cached.get('rules') == rules:
+                        self.verdicts = cached.get('verdicts', {})
+            except (OSError, json.JSONDecodeError, AttributeError):
+                pass
+
+    def digest(self, entry):
+        """Content hash of a manifest entry, reusing the stored hash if size and mtime match"""
+        path = entry['path']
+        if path in self._fresh_hashes:
+            return self._fresh_hashes[path]['sha256']
+
+        known = self.hashes.get(path)
+        if known and known['size'] == entry['size'] and known['mtime_ns'] == entry['mtime_ns']:
+            sha = known['sha256']
+        else:
+            sha = file_sha256(path)
+        self._fresh_hashes[path] = {'size': entry['size'], 'mtime_ns': entry['mtime_ns'], 'sha256': sha}
+        return sha
+
+    def lookup(self, entry, check):
+        """
+        Return the cached (errors, warnings) of a check on an unchanged file.
+
+        Returns:
+            tuple or None: Cached verdict, or None if the file must be checked
+        """
+        if not self.enabled:
+            return None
+
+        sha = self.digest(entry)
+        cached = self.verdicts.get(entry['path'])
+        if cached and cached.get('sha256') == sha and check in cached:
+            errors, warnings = cached[check]
+            self.store(entry, check, errors, warnings)
+            self.reused += 1
+            return errors, warnings
+        return None
+
+    def store(self, entry, check, errors, warnings):
+        """Record the verdict of a check on a file"""
+        if not self.enabled:
+            return
+        path = entry['path']
+        verdict = self._fresh_verdicts.setdefault(path, {'sha256': self.digest(entry)})
+        verdict[check] = [list(errors), list(warnings)]
+
+    def run(self, entry, check, func):
+        """
+        Return the verdict of func(path) for a file, from cache when unchanged.
+
+        Args:
+            entry (dict): Manifest entry
+            check (str): Check name (a file can have several checks)
+            func (callable): Called with the path, returns (errors, warnings)
+
+        Returns:
+            tuple: (errors, warnings, cached)
+        """
+        cached = self.lookup(entry, check)
+        if cached is not None:
+            return cached[0], cached[1], True
+
+        errors, warnings = func(entry['path'])
+        self.checked += 1
+        self.store(entry, check, errors, warnings)
+        return errors, warnings, False
+
+    def merge(self, other):
+        """
+        Fold in the hashes, verdicts and counters recorded by another copy of this cache.
+
+        Used when checks run in worker processes, each on its own copy.
+        """
+        self._fresh_hashes.update(other._fresh_hashes)
+        for path, verdict in other._fresh_verdicts.items():
+            self._fresh_verdicts.setdefault(path, {}).update(verdict)
+        self.reused += other.reused
+        self.checked += other.checked
+
+    def save(self):
+        """Persist hashes and verdicts seen in this run (files no longer present are dropped)"""
+        if not self.enabled or not self.path:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': AUDIT_CACHE_VERSION,
+                'rules': self.rules,
+                'hashes': self._fresh_hashes,
+                'verdicts': self._fresh_verdicts,
+            }, f)
+        os.replace(tmp_path, self.path)
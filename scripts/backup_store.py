@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Content-Addressed Backup Store
+Deduplicated snapshots of the data directory
+
+Files are split with content-defined chunking (gear rolling hash), every unique
+chunk is stored once under its SHA-256 and each snapshot is a small JSON manifest
+listing the chunks of every file. An unchanged file costs one manifest entry and
+an edited file only stores the chunks around the edit.
+
+Usage:
+    python scripts/backup_store.py create data --name 2025-11-23
+    python scripts/backup_store.py list
+    python scripts/backup_store.py diff 2025-11-22 2025-11-23
+    python scripts/backup_store.py restore 2025-11-23 data/opportunities.json --output /tmp/opps.json
+    python scripts/backup_store.py verify
+    python scripts/backup_store.py prune --keep 30
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import zlib
+from datetime import datetime, timezone
+
+from pipeline_log import SUCCESS, get_logger
+
+STORE_DIR = "backups/store"
+CHUNKS_SUBDIR = "chunks"
+SNAPSHOTS_SUBDIR = "snapshots"
+MANIFEST_VERSION = 1
+
+# Content-defined chunking parameters (average chunk ~8 KB)
+MIN_CHUNK_SIZE = 2 * 1024
+AVG_CHUNK_BITS = 13
+MAX_CHUNK_SIZE = 64 * 1024
+CHUNK_MASK = (1 << AVG_CHUNK_BITS) - 1
+
+# Gear table for the rolling hash; seeded so chunk boundaries are stable across runs
+_gear_rng = random.Random(0x4E55564945)
+GEAR_TABLE = [_gear_rng.getrandbits(32) for _ in range(256)]
+del _gear_rng
+
+log = get_logger('backup_store')
+
+def log_info(msg):
+    log.info(msg)
+
+def log_success(msg):
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def log_error(msg):
+    log.error(msg)
+
+def chunk_boundaries(data):
+    """
+    Split bytes into content-defined chunks.
+
+    A boundary is cut where the low bits of the gear hash are all zero, so an
+    insertion only moves the boundaries next to it and the rest of the file
+    still produces identical chunks.
+
+    Args:
+        data (bytes): File contents
+
+    Returns:
+        list: (start, end) offsets of each chunk
+    """
+    boundaries = []
+    length = len(data)
+    start = 0
+    gear = GEAR_TABLE
+
+    while start < length:
+        end = min(start + MAX_CHUNK_SIZE, length)
+        if end - start <= MIN_CHUNK_SIZE:
+            boundaries.append((start, end))
+            break
+
+        h = 0
+        cut = end
+        for pos in range(start + MIN_CHUNK_SIZE, end):
+            h = ((h << 1) + gear[data[pos]]) & 0xFFFFFFFF
+            if not h & CHUNK_MASK:
+                cut = pos + 1
+                break
+
+        boundaries.append((start, cut))
+        start = cut
+
+    return boundaries
+
+def _chunk_path(store_dir, digest):
+    return os.path.join(store_dir, CHUNKS_SUBDIR, digest[:2], digest)
+
+def _snapshot_path(store_dir, name):
+    return os.path.join(store_dir, SNAPSHOTS_SUBDIR, f"{name}.json")
+
+def _write_chunk(store_dir, digest, payload):
+    """Store a chunk if it is not already present. Returns True when new."""
+    path = _chunk_path(store_dir, digest)
+    if os.path.exists(path):
+        return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(zlib.compress(payload, 6))
+    os.replace(tmp_path, path)
+    return True
+
+def read_chunk(store_dir, digest):
+    """Read and verify a single chunk"""
+    with open(_chunk_path(store_dir, digest), 'rb') as f:
+        payload = zlib.decompress(f.read())
+
+    if hashlib.sha256(payload).hexdigest() != digest:
+        raise ValueError(f"Chunk {digest} is corrupted")
+
+    return payload
+
+def iter_files(paths):
+    """Yield regular files under the given paths in a stable order"""
+    for path in paths:
+        if os.path.isfile(path):
+            yield os.path.normpath(path)
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                yield os.path.normpath(os.path.join(root, filename))
+
+def list_snapshots(store_dir=STORE_DIR):
+    """Return snapshot names sorted oldest first"""
+    snapshot_dir = os.path.join(store_dir, SNAPSHOTS_SUBDIR)
+    if not os.path.isdir(snapshot_dir):
+        return []
+
+    return sorted(f[:-len('.json')] for f in os.listdir(snapshot_dir) if f.endswith('.json'))
+
+def load_manifest(name, store_dir=STORE_DIR):
+    """Load a snapshot manifest by name"""
+    path = _snapshot_path(store_dir, name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Snapshot not found: {name}")
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+def create_snapshot(paths, name=None, store_dir=STORE_DIR, backup_type="manual"):
+    """
+    Create a deduplicated snapshot of the given files and directories.
+
+    Files whose size and mtime match the previous snapshot are not read again,
+    and files whose content hash matches are not re-chunked, so the cost of a
+    backup follows the amount of changed data.
+
+    Args:
+        paths (list): Files or directories to back up
+        name (str): Snapshot name (defaults to today's date)
+        store_dir (str): Backup store root
+        backup_type (str): Recorded in the manifest (automated/manual)
+
+    Returns:
+        dict: The written manifest
+    """
+    now = datetime.now(timezone.utc)
+    name = name or now.strftime('%Y-%m-%d')
+
+    previous_files = {}
+    existing = list_snapshots(store_dir)
+    if existing:
+        previous_files = load_manifest(existing[-1], store_dir).get('files', {})
+    previous_by_hash = {entry['sha256']: entry for entry in previous_files.values()}
+
+    files = {}
+    stats = {"files": 0, "bytes": 0, "files_unchanged": 0, "chunks_new": 0, "bytes_new": 0}
+
+    for filepath in iter_files(paths):
+        rel_path = filepath.replace(os.sep, '/')
+        st = os.stat(filepath)
+        previous = previous_files.get(rel_path)
+        stats["files"] += 1
+        stats["bytes"] += st.st_size
+
+        # Fast path: same size and mtime as the last snapshot
+        if previous and previous['size'] == st.st_size and previous.get('mtime_ns') == st.st_mtime_ns:
+            files[rel_path] = previous
+            stats["files_unchanged"] += 1
+            continue
+
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if digest in previous_by_hash:
+            chunks = previous_by_hash[digest]['chunks']
+            stats["files_unchanged"] += 1
+        else:
+            chunks = []
+            for start, end in chunk_boundaries(data):
+                payload = data[start:end]
+                chunk_digest = hashlib.sha256(payload).hexdigest()
+                if _write_chunk(store_dir, chunk_digest, payload):
+                    stats["chunks_new"] += 1
+                    stats["bytes_new"] += len(payload)
+                chunks.append(chunk_digest)
+
+        files[rel_path] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "chunks": chunks
+        }
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "snapshot": name,
+        "created": now.isoformat().replace('+00:00', 'Z'),
+        "git_commit": _git_commit(),
+        "backup_type": backup_type,
+        "stats": stats,
+        "files": files
+    }
+
+    snapshot_path = _snapshot_path(store_dir, name)
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    # Replace atomically: the next backup loads the latest manifest as its baseline
+    tmp_path = f"{snapshot_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, snapshot_path)
+
+    return manifest
+
+def diff_snapshots(old_name, new_name, store_dir=STORE_DIR):
+    """
+    Compare two snapshots by file content hash.
+
+    Returns:
+        dict: Lists of added, removed and modified file paths
+    """
+    old_files = load_manifest(old_name, store_dir)['files']
+    new_files = load_manifest(new_name, store_dir)['files']
+
+    return {
+        "added": sorted(set(new_files) - set(old_files)),
+        "removed": sorted(set(old_files) - set(new_files)),
+        "modified": sorted(
+            path for path in set(old_files) & set(new_files)
+            if old_files[path]['sha256'] != new_files[path]['sha256']
+        )
+    }
+
+def restore_file(name, file_path, output_path=None, store_dir=STORE_DIR):
+    """
+    Restore a single file from a snapshot by reassembling its chunks.
+
+    Args:
+        name (str): Snapshot name
+        file_path (str): Path of the file as recorded in the manifest
+        output_path (str): Destination (defaults to the original path)
+
+    Returns:
+        str: Path the file was written to
+    """
+    files = load_manifest(name, store_dir)['files']
+    rel_path = os.path.normpath(file_path).replace(os.sep, '/')
+    if rel_path not in files:
+        raise FileNotFoundError(f"{rel_path} is not in snapshot {name}")
+
+    entry = files[rel_path]
+    output_path = output_path or rel_path
+    hasher = hashlib.sha256()
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_path = f"{output_path}.restore"
+    with open(tmp_path, 'wb') as f:
+        for digest in entry['chunks']:
+            payload = read_chunk(store_dir, digest)
+            hasher.update(payload)
+            f.write(payload)
+
+    if hasher.hexdigest() != entry['sha256']:
+        os.remove(tmp_path)
+        raise ValueError(f"Restored content of {rel_path} does not match the snapshot hash")
+
+    os.replace(tmp_path, output_path)
+    return output_path
+
+def verify_snapshot(name, store_dir=STORE_DIR):
+    """Check that every chunk referenced by a snapshot exists and is intact"""
+    errors = []
+    checked = set()
+
+    for rel_path, entry in load_manifest(name, store_dir)['files'].items():
+        for digest in entry['chunks']:
+            if digest in checked:
+                continue
+            checked.add(digest)
+            try:
+                read_chunk(store_dir, digest)
+            except FileNotFoundError:
+                errors.append(f"{rel_path}: missing chunk {digest}")
+            except (ValueError, zlib.error) as e:
+                errors.append(f"{rel_path}: {e}")
+
+    return errors
+
+def prune_snapshots(keep, store_dir=STORE_DIR):
+    """
+    Delete all but the newest `keep` snapshots and garbage-collect chunks
+    no longer referenced by any remaining manifest.
+
+    Returns:
+        tuple: (snapshots_removed, chunks_removed)
+    """
+    snapshots = list_snapshots(store_dir)
+    expired = snapshots[:-keep] if keep > 0 else snapshots
+
+    for name in expired:
+        os.remove(_snapshot_path(store_dir, name))
+
+    referenced = set()
+    for name in list_snapshots(store_dir):
+        for entry in load_manifest(name, store_dir)['files'].values():
+            referenced.update(entry['chunks'])
+
+    chunks_removed = 0
+    chunk_root = os.path.join(store_dir, CHUNKS_SUBDIR)
+    if os.path.isdir(chunk_root):
+        for root, _dirs, files in os.walk(chunk_root):
+            for filename in files:
+                if filename not in referenced:
+                    os.remove(os.path.join(root, filename))
+                    chunks_removed += 1
+
+    return len(expired), chunks_removed
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="NUVIEW content-addressed backup store")
+    parser.add_argument('--store', default=STORE_DIR, help=f'Backup store root (default: {STORE_DIR})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create_parser = subparsers.add_parser('create', help='Create a snapshot')
+    create_parser.add_argument('paths', nargs='*', default=['data'], help='Files or directories to back up')
+    create_parser.add_argument('--name', help='Snapshot name (default: today, YYYY-MM-DD)')
+    create_parser.add_argument('--type', default='manual', help='Backup type recorded in the manifest')
+
+    subparsers.add_parser('list', help='List snapshots')
+
+    diff_parser = subparsers.add_parser('diff', help='Compare two snapshots')
+    diff_parser.add_argument('old')
+    diff_parser.add_argument('new')
+
+    restore_parser = subparsers.add_parser('restore', help='Restore a single file')
+    restore_parser.add_argument('snapshot')
+    restore_parser.add_argument('file')
+    restore_parser.add_argument('--output', help='Destination path (default: original location)')
+
+    verify_parser = subparsers.add_parser('verify', help='Verify snapshot integrity')
+    verify_parser.add_argument('snapshot', nargs='?', help='Snapshot name (default: latest)')
+
+    prune_parser = subparsers.add_parser('prune', help='Drop old snapshots and unreferenced chunks')
+    prune_parser.add_argument('--keep', type=int, default=30, help='Number of snapshots to keep')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'create':
+            manifest = create_snapshot(args.paths, args.name, args.store, args.type)
+            stats = manifest['stats']
+            log_success(f"Snapshot {manifest['snapshot']} created: {stats['files']} files, "
+                        f"{stats['files_unchanged']} unchanged")
+            log_info(f"New chunks: {stats['chunks_new']} ({stats['bytes_new']:,} bytes of {stats['bytes']:,})")
+
+        elif args.command == 'list':
+            snapshots = list_snapshots(args.store)
+            if not snapshots:
+                log_warning("No snapshots found")
+            for name in snapshots:
+                manifest = load_manifest(name, args.store)
+                stats = manifest.get('stats', {})
+                log_info(f"{name}  {manifest.get('created', '')}  files={stats.get('files', 0)}  "
+                         f"new_bytes={stats.get('bytes_new', 0):,}")
+
+        elif args.command == 'diff':
+            changes = diff_snapshots(args.old, args.new, args.store)
+            for status, marker in (('added', '+'), ('removed', '-'), ('modified', '~')):
+                for path in changes[status]:
+                    log_info(f"{marker} {path}")
+            log_info(f"{len(changes['added'])} added, {len(changes['removed'])} removed, "
+                     f"{len(changes['modified'])} modified")
+
+        elif args.command == 'restore':
+            output = restore_file(args.snapshot, args.file, args.output, args.store)
+            log_success(f"Restored {args.file} from {args.snapshot} to {output}")
+
+        elif args.command == 'verify':
+            snapshots = list_snapshots(args.store)
+            name = args.snapshot or (snapshots[-1] if snapshots else None)
+            if not name:
+                log_error("No snapshots found")
+                return 1
+            errors = verify_snapshot(name, args.store)
+            if errors:
+                for error in errors:
+                    log_error(error)
+                return 1
+            log_success(f"Snapshot {name} verified")
+
+        elif args.command == 'prune':
+            removed, chunks_removed = prune_snapshots(args.keep, args.store)
+            log_success(f"Removed {removed} snapshots and {chunks_removed} unreferenced chunks")
+
+    except (FileNotFoundError, ValueError) as e:
+        log_error(str(e))
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
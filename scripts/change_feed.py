@@ -0,0 +1,212 @@
+"""
+NUVIEW Strategic Pipeline - Change Data Capture Feed
+Computes what changed between two sweeps of opportunities.json
+
+Records are matched on a stable key (normalized title + agency, the same key
+used for deduplication) with a hash join, and compared by a content hash that
+ignores per-sweep fields. The delta is written as NDJSON to
+data/changes/<timestamp>.ndjson, one line per added, removed or modified
+opportunity, so downstream stages can work on the delta instead of the corpus.
+The newest MAX_CHANGE_FILES deltas are kept; older ones are deleted when a
+new one is written.
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+CHANGES_DIR = "data/changes"
+MAX_CHANGE_FILES = 30
+
+# Fields regenerated on every sweep that do not represent a real change
+# (ids are randomized by BaseScraper.generate_opportunity, and deadline is
+# today plus a fixed days_until, so it moves every day for unchanged records;
+# a real deadline change shows up in daysUntilDeadline and timeline.daysUntil)
+VOLATILE_FIELDS = {'id', 'scrapedAt', 'deadline'}
+
+CHANGE_ADDED = 'added'
+CHANGE_REMOVED = 'removed'
+CHANGE_MODIFIED = 'modified'
+
+def record_key(opp):
+    """
+    Build the stable join key for an opportunity.
+
+    Args:
+        opp (dict): Opportunity record
+
+    Returns:
+        str: Short hash of the normalized title and agency
+    """
+    title = str(opp.get('title', '')).strip().lower()
+    agency = str(opp.get('agency', '')).strip().lower()
+    return hashlib.sha1(f"{title}|{agency}".encode('utf-8')).hexdigest()[:16]
+
+def content_hash(opp):
+    """Hash the record content, ignoring volatile per-sweep fields"""
+    stable = {k: v for k, v in opp.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def index_records(opportunities):
+    """
+    Build the hash-join table for a snapshot.
+
+    The first occurrence of a key wins, matching deduplicate_opportunities.
+
+    Returns:
+        dict: key -> (content_hash, record)
+    """
+    index = {}
+    for opp in opportunities:
+        key = record_key(opp)
+        if key not in index:
+            index[key] = (content_hash(opp), opp)
+    return index
+
+def diff_fields(old, new, prefix=''):
+    """
+    Field-level diff between two records.
+
+    Nested objects (timeline, funding) are compared field by field and
+    reported with dotted paths.
+
+    Returns:
+        dict: path -> {"old": value, "new": value}
+    """
+    changes = {}
+
+    for field in sorted(set(old) | set(new)):
+        if not prefix and field in VOLATILE_FIELDS:
+            continue
+
+        path = f"{prefix}{field}"
+        old_value = old.get(field)
+        new_value = new.get(field)
+
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changes.update(diff_fields(old_value, new_value, prefix=f"{path}."))
+        elif old_value != new_value or (field in old) != (field in new):
+            changes[path] = {"old": old_value, "new": new_value}
+
+    return changes
+
+def compute_changes(previous_opportunities, current_opportunities):
+    """
+    Compute the delta between two snapshots with a hash join on stable keys.
+
+    Args:
+        previous_opportunities (iterable): Opportunities from the last sweep
+        current_opportunities (iterable): Opportunities from this sweep
+
+    Returns:
+        list: Change records (dicts with 'op', 'key', 'id' and details)
+    """
+    previous = index_records(previous_opportunities)
+    current = index_records(current_opportunities)
+    changes = []
+
+    for key, (digest, record) in current.items():
+        if key not in previous:
+            changes.append({
+                "op": CHANGE_ADDED,
+                "key": key,
+                "id": record.get('id'),
+                "record": record
+            })
+            continue
+
+        old_digest, old_record = previous[key]
+        if old_digest != digest:
+            changes.append({
+                "op": CHANGE_MODIFIED,
+                "key": key,
+                "id": record.get('id'),
+                "previous_id": old_record.get('id'),
+                "fields": diff_fields(old_record, record),
+                "record": record
+            })
+
+    for key, (_digest, record) in previous.items():
+        if key not in current:
+            changes.append({
+                "op": CHANGE_REMOVED,
+                "key": key,
+                "id": record.get('id'),
+                "record": record
+            })
+
+    return changes
+
+def summarize_changes(changes):
+    """Count changes by operation"""
+    summary = {CHANGE_ADDED: 0, CHANGE_REMOVED: 0, CHANGE_MODIFIED: 0}
+    for change in changes:
+        summary[change['op']] += 1
+    return summary
+
+def write_changes(changes, timestamp, changes_dir=CHANGES_DIR):
+    """
+    Write a delta as NDJSON.
+
+    Args:
+        changes (list): Output of compute_changes
+        timestamp (datetime): Sweep time, used for the file name
+        changes_dir (str): Output directory
+
+    Returns:
+        str: Path of the written file
+    """
+    os.makedirs(changes_dir, exist_ok=True)
+    path = os.path.join(changes_dir, f"{timestamp.strftime('%Y%m%dT%H%M%SZ')}.ndjson")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for change in changes:
+            f.write(json.dumps(change, ensure_ascii=False, sort_keys=True))
+            f.write('\n')
+
+    prune_changes(changes_dir)
+    return path
+
+def prune_changes(changes_dir=CHANGES_DIR, keep=None):
+    """
+    Delete all but the newest `keep` delta files.
+
+    Returns:
+        int: Number of delta files removed
+    """
+    keep = MAX_CHANGE_FILES if keep is None else keep
+    # Names are sweep timestamps, so they sort oldest first
+    files = sorted(glob.glob(os.path.join(changes_dir, '*.ndjson')))
+    removed = 0
+    for path in files[:max(len(files) - keep, 0)]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def read_changes(path):
+    """Yield change records from an NDJSON delta file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def latest_changes_file(changes_dir=CHANGES_DIR):
+    """Return the most recent delta file, or None if no sweep has produced one"""
+    files = sorted(glob.glob(os.path.join(changes_dir, '*.ndjson')))
+    return files[-1] if files else None
+
+def load_previous_opportunities(path):
+    """Load the opportunities of the previous snapshot, or [] if there is none"""
+    if not os.path.exists(path):
+        return []
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('opportunities', [])
+    except (json.JSONDecodeError, AttributeError):
+        return []
@@ -0,0 +1,148 @@
+"""
+NUVIEW Strategic Pipeline - Columnar Matrix I/O
+Parquet and Arrow IPC copies of the priority and sources matrices
+
+The CSV matrices stay the published format (the dashboard reads them).
+Alongside each CSV a typed Parquet file and an Arrow IPC (Feather) file are
+written, and internal consumers read those through read_matrix, which falls
+back to the CSV when the binary copies are missing or older than the CSV.
+
+Parquet and Arrow output need pyarrow; without it only the CSV is written.
+"""
+
+import importlib.util
+import json
+import os
+
+# pandas loads pyarrow itself when a binary copy is read or written, so it
+# is only looked up here rather than imported
+ARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+PARQUET = 'parquet'
+ARROW = 'arrow'
+COLUMNAR_FORMATS = (PARQUET, ARROW)
+
+# Explicit dtypes per matrix; columns not listed are stored as strings
+SOURCES_MATRIX_DTYPES = {
+    'textrank': 'Int64',
+    'country': 'string',
+    'agency_name': 'string',
+    'program_name': 'string',
+    'budget_amount_usd': 'float64',
+    'nuview_priority_score': 'float64',
+    'data_access': 'string',
+    'sources': 'string',
+    'verification': 'string',
+}
+
+# Union of the generate_programs and qc/validate_and_merge layouts
+PRIORITY_MATRIX_DTYPES = {
+    'rank': 'Int64',
+    'valueUSD': 'float64',
+    'amountUSD': 'float64',
+    'priorityScore': 'float64',
+    'calculatedPriority': 'float64',
+    'daysUntil': 'Int64',
+    'daysUntilDeadline': 'Int64',
+}
+
+def columnar_paths(csv_path):
+    """
+    Return the binary companion paths of a CSV matrix.
+
+    Returns:
+        dict: format -> path (e.g. 'parquet' -> data/processed/x.parquet)
+    """
+    base, _ext = os.path.splitext(csv_path)
+    return {PARQUET: f"{base}.parquet", ARROW: f"{base}.arrow"}
+
+def _to_text(value):
+    """Render a cell as text; nested objects become JSON"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return str(value)
+
+def apply_dtypes(df, dtypes):
+    """
+    Cast a matrix to its explicit dtypes.
+
+    Numeric columns are coerced (unparseable values become null), nested
+    objects are serialized to JSON and every other column becomes 'string'.
+
+    Args:
+        df (DataFrame): Matrix as built for the CSV
+        dtypes (dict): column -> pandas dtype
+
+    Returns:
+        DataFrame: Typed copy
+    """
+    import pandas as pd
+    typed = {}
+    for column in df.columns:
+        dtype = dtypes.get(column, 'string')
+        values = df[column]
+        if dtype == 'string':
+            values = values.map(_to_text, na_action='ignore')
+        else:
+            values = pd.to_numeric(values, errors='coerce')
+        typed[column] = values.astype(dtype)
+    return pd.DataFrame(typed, index=df.index).reset_index(drop=True)
+
+def write_matrix(df, csv_path, dtypes):
+    """
+    Write a matrix as CSV plus Parquet and Arrow IPC when pyarrow is available.
+
+    Args:
+        df (DataFrame): Matrix to write
+        csv_path (str): Path of the CSV; binary copies sit next to it
+        dtypes (dict): Explicit dtypes for the binary copies
+
+    Returns:
+        list: Paths of the binary copies written (empty without pyarrow)
+    """
+    os.makedirs(os.path.dirname(csv_path) or '.', exist_ok=True)
+    df.to_csv(csv_path, index=False)
+
+    if not ARROW_AVAILABLE:
+        return []
+
+    typed = apply_dtypes(df, dtypes)
+    paths = columnar_paths(csv_path)
+    typed.to_parquet(paths[PARQUET], index=False)
+    typed.to_feather(paths[ARROW])
+    return [paths[PARQUET], paths[ARROW]]
+
+def _is_fresh(path, csv_path):
+    """A binary copy is usable if it exists and is not older than the CSV"""
+    if not os.path.exists(path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.stat(path).st_mtime_ns >= os.stat(csv_path).st_mtime_ns
+
+def read_matrix(csv_path, dtypes=None):
+    """
+    Read a matrix, preferring its typed binary copy.
+
+    Arrow IPC is tried first (cheapest to load), then Parquet,
+    then the CSV itself parsed with the explicit dtypes.
+
+    Args:
+        csv_path (str): Path of the CSV matrix
+        dtypes (dict): Explicit dtypes used when falling back to the CSV
+
+    Returns:
+        DataFrame: The matrix
+    """
+    import pandas as pd
+    if ARROW_AVAILABLE:
+        paths = columnar_paths(csv_path)
+        if _is_fresh(paths[ARROW], csv_path):
+            return pd.read_feather(paths[ARROW])
+        if _is_fresh(paths[PARQUET], csv_path):
+            return pd.read_parquet(paths[PARQUET])
+
+    df = pd.read_csv(csv_path)
+    if dtypes:
+        df = apply_dtypes(df, dtypes)
+    return df
@@ -8,87 +8,153 @@ Performs full system integrity verification including:
 - Matrix integrity validation
 """
 
-import json
 import os
 import sys
 from datetime import datetime
 
-import pandas as pd
-
 # Add scripts directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from pipeline_log import SUCCESS, get_logger
+from qc_context import QCContext
+from tracing import traced
+
+log = get_logger('comprehensive_qc_check')
+
 try:
     from validate_and_merge import calculate_priority_score
     CALC_AVAILABLE = True
 except ImportError:
     CALC_AVAILABLE = False
 
-# Color codes
-COLOR_GREEN = '\033[92m'
-COLOR_RED = '\033[91m'
-COLOR_BLUE = '\033[94m'
-COLOR_RESET = '\033[0m'
-
 # Constants
 SOURCE_VERIFIED_STATUS = 'SOURCE_VERIFIED'
+MISMATCH_FILE = 'data/processed/qc_mismatches.csv'
+MISMATCH_COLUMNS = ['check', 'id', 'title', 'agency', 'stored', 'expected']
+MISMATCH_PRINT_LIMIT = 20
+OPPORTUNITY_FRAME_COLUMNS = ['id', 'title', 'agency', 'priorityScore', 'amountUSD', 'fundingAmountUSD']
+
+def log_info(msg):
+    log.info(msg)
+
+def log_success(msg):
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def log_error(msg):
+    log.error(msg)
 
 def print_header(text):
-    print(f"\n{COLOR_BLUE}{'=' * 70}")
-    print(f"{text}")
-    print(f"{'=' * 70}{COLOR_RESET}\n")
+    log_info("")
+    log_info("=" * 70)
+    log_info(text)
+    log_info("=" * 70)
+    log_info("")
 
 def print_check(name, passed):
-    status = f"{COLOR_GREEN}✅ PASS{COLOR_RESET}" if passed else f"{COLOR_RED}❌ FAIL{COLOR_RESET}"
-    print(f"{name}: {status}")
-
-def check_index_integrity():
+    if passed:
+        log_success(f"{name}: PASS")
+    else:
+        log_error(f"{name}: FAIL")
+
+def load_opportunity_frame(ctx):
+    """
+    Build the per-opportunity columns the checks compare.
+
+    Returns:
+        DataFrame: One row per opportunity with id, title, agency, the stored
+                   priority score, both amount fields and, when the scoring
+                   module is available, the recalculated priority score
+    """
+    import pandas as pd
+    rows = []
+    for opp in ctx.opportunities:
+        row = {
+            'id': opp.get('id', 'unknown'),
+            'title': opp.get('title'),
+            'agency': opp.get('agency'),
+            'priorityScore': opp.get('priorityScore', 0),
+            'amountUSD': opp.get('amountUSD') or 0,
+            'fundingAmountUSD': (opp.get('funding') or {}).get('amountUSD') or 0,
+        }
+        if CALC_AVAILABLE:
+            row['calculatedScore'] = calculate_priority_score(opp)
+        rows.append(row)
+
+    columns = OPPORTUNITY_FRAME_COLUMNS + (['calculatedScore'] if CALC_AVAILABLE else [])
+    return pd.DataFrame(rows, columns=columns)
+
+def _mismatches(frame, mask, check, stored, expected):
+    """Build mismatch-table rows for the flagged rows of one check"""
+    import pandas as pd
+    flagged = frame.loc[mask]
+    return pd.DataFrame({
+        'check': check,
+        'id': flagged['id'],
+        'title': flagged['title'],
+        'agency': flagged['agency'],
+        'stored': flagged[stored] if stored else None,
+        'expected': flagged[expected] if expected else None,
+    }, columns=MISMATCH_COLUMNS)
+
+def print_mismatches(mismatches, limit=MISMATCH_PRINT_LIMIT):
+    """Log the first rows of a mismatch table"""
+    if mismatches.empty:
+        return
+    log_info(mismatches.head(limit).to_string(index=False))
+    if len(mismatches) > limit:
+        log_info(f"   ... {len(mismatches) - limit} more (see {MISMATCH_FILE})")
+
+def opportunity_frame(ctx):
+    """The shared opportunity frame, built once per context"""
+    return ctx.view('comprehensive_qc_check.opportunity_frame', load_opportunity_frame)
+
+def check_index_integrity(ctx):
     """Check that all indices are correctly assigned"""
     print_header("INDEX INTEGRITY CHECK")
 
-    with open('data/opportunities.json', 'r') as f:
-        data = json.load(f)
-
-    actual_count = len(data['opportunities'])
-    meta_count = data['meta']['totalCount']
+    meta = ctx.meta
+    actual_count = len(opportunity_frame(ctx))
+    meta_count = meta['totalCount']
 
-    print(f"Opportunities count: {actual_count}")
-    print(f"Meta totalCount: {meta_count}")
+    log_info(f"Opportunities count: {actual_count}")
+    log_info(f"Meta totalCount: {meta_count}")
 
     index_match = actual_count == meta_count
     print_check("Index count matches meta", index_match)
 
     return index_match
 
-def check_calculations():
+def check_calculations(ctx, mismatch_tables):
     """Verify all calculations are correct"""
     print_header("CALCULATIONS VERIFICATION")
 
-    with open('data/opportunities.json', 'r') as f:
-        opps_data = json.load(f)
+    opp_frame = opportunity_frame(ctx)
+    forecast_data = ctx.forecast
 
-    with open('data/forecast.json', 'r') as f:
-        forecast_data = json.load(f)
-
-    # Check priority scores
-    print("1. Priority Score Calculations:")
+    # Check priority scores of every opportunity in one vectorized comparison
+    log_info("1. Priority Score Calculations:")
     score_errors = 0
 
     if CALC_AVAILABLE:
-        for opp in opps_data['opportunities'][:5]:  # Check first 5
-            stored = opp.get('priorityScore', 0)
-            calculated = calculate_priority_score(opp)
-            if stored != calculated:
-                print(f"   ❌ {opp['id']}: stored={stored}, calculated={calculated}")
-                score_errors += 1
+        score_mask = opp_frame['priorityScore'] != opp_frame['calculatedScore']
+        score_errors = int(score_mask.sum())
+        score_table = _mismatches(opp_frame, score_mask, 'priority_score', 'priorityScore', 'calculatedScore')
+        mismatch_tables.append(score_table)
 
         if score_errors == 0:
-            print("   ✅ All priority scores are correctly calculated")
+            log_success("   All priority scores are correctly calculated")
+        else:
+            log_error(f"   {score_errors}/{len(opp_frame)} stored scores differ from the calculation")
+            print_mismatches(score_table)
     else:
-        print("   ⚠️  Cannot verify (calculation module unavailable)")
+        log_warning("   Cannot verify (calculation module unavailable)")
 
     # Check forecast calculations
-    print("\n2. Forecast Calculations:")
+    log_info("")
+    log_info("2. Forecast Calculations:")
     current_value = forecast_data['current_value']
     current_year = forecast_data['current_year']
     cagr_pct = forecast_data['cagr_pct']
@@ -99,93 +165,106 @@ def check_calculations():
 
     forecast_match = abs(calculated_forecast - forecast_2030) < 0.01
 
-    print(f"   Current value: ${current_value}B")
-    print(f"   CAGR: {cagr_pct}%")
-    print(f"   Calculated forecast: ${calculated_forecast:.2f}B")
-    print(f"   Stored forecast: ${forecast_2030}B")
+    log_info(f"   Current value: ${current_value}B")
+    log_info(f"   CAGR: {cagr_pct}%")
+    log_info(f"   Calculated forecast: ${calculated_forecast:.2f}B")
+    log_info(f"   Stored forecast: ${forecast_2030}B")
     print_check("   Forecast calculation correct", forecast_match)
 
     # Check value consistency within opportunities
-    print("\n3. Value Consistency (amountUSD vs funding.amountUSD):")
-    value_errors = 0
-    for opp in opps_data['opportunities']:
-        amount = opp.get('amountUSD')
-        funding_amount = opp.get('funding', {}).get('amountUSD')
-        if amount and funding_amount and amount != funding_amount:
-            value_errors += 1
+    log_info("")
+    log_info("3. Value Consistency (amountUSD vs funding.amountUSD):")
+    amount = opp_frame['amountUSD']
+    funding_amount = opp_frame['fundingAmountUSD']
+    value_mask = (amount != 0) & (funding_amount != 0) & (amount != funding_amount)
+    value_errors = int(value_mask.sum())
+    mismatch_tables.append(_mismatches(opp_frame, value_mask, 'amount_consistency', 'amountUSD', 'fundingAmountUSD'))
 
     print_check("   All amounts consistent", value_errors == 0)
     if value_errors > 0:
-        print(f"   Found {value_errors} inconsistencies")
+        log_warning(f"   Found {value_errors} inconsistencies")
 
     return score_errors == 0 and forecast_match and value_errors == 0
 
-def check_cross_references():
+def check_cross_references(ctx, mismatch_tables):
     """Verify cross-references between data structures"""
+    import pandas as pd
     print_header("CROSS-REFERENCE VALIDATION")
 
-    with open('data/opportunities.json', 'r') as f:
-        opps_data = json.load(f)
-
-    matrix_df = pd.read_csv('data/processed/sources_matrix.csv')
+    opp_frame = opportunity_frame(ctx)
+    matrix_df = ctx.sources_matrix
 
     # Check counts match
-    opps_count = len(opps_data['opportunities'])
+    opps_count = len(opp_frame)
     matrix_count = len(matrix_df)
 
-    print(f"Opportunities in JSON: {opps_count}")
-    print(f"Opportunities in matrix: {matrix_count}")
+    log_info(f"Opportunities in JSON: {opps_count}")
+    log_info(f"Opportunities in matrix: {matrix_count}")
 
     count_match = opps_count == matrix_count
     print_check("Counts match", count_match)
 
-    # Check priority scores match
-    print("\nPriority Score Cross-Reference:")
-    score_mismatches = 0
-
-    for opp in opps_data['opportunities'][:10]:  # Check first 10
-        opp_score = opp.get('priorityScore', 0)
-        matrix_row = matrix_df[
-            (matrix_df['program_name'] == opp.get('title')) &
-            (matrix_df['agency_name'] == opp.get('agency'))
-        ]
-
-        if not matrix_row.empty:
-            matrix_score = matrix_row.iloc[0]['nuview_priority_score']
-            if opp_score != matrix_score:
-                score_mismatches += 1
-
+    # Join every opportunity to its matrix row on (title, agency); the first
+    # matrix row wins for duplicate keys
+    log_info("")
+    log_info("Priority Score Cross-Reference:")
+    matrix_scores = matrix_df[['program_name', 'agency_name', 'nuview_priority_score']].drop_duplicates(
+        subset=['program_name', 'agency_name'])
+    joined = opp_frame.merge(
+        matrix_scores,
+        how='left',
+        left_on=['title', 'agency'],
+        right_on=['program_name', 'agency_name'],
+        indicator=True
+    )
+
+    missing_mask = joined['_merge'] == 'left_only'
+    score_mask = ~missing_mask & (joined['priorityScore'] != joined['nuview_priority_score'])
+    score_mismatches = int(score_mask.sum())
+    missing_rows = int(missing_mask.sum())
+
+    cross_table = pd.concat([
+        _mismatches(joined, score_mask, 'matrix_score', 'priorityScore', 'nuview_priority_score'),
+        _mismatches(joined, missing_mask, 'missing_from_matrix', 'priorityScore', None),
+    ], ignore_index=True)
+    mismatch_tables.append(cross_table)
+
+    log_info(f"Rows compared: {opps_count - missing_rows}/{opps_count}")
     print_check("Priority scores match", score_mismatches == 0)
+    print_check("Every opportunity in matrix", missing_rows == 0)
+    print_mismatches(cross_table)
 
-    return count_match and score_mismatches == 0
+    return count_match and score_mismatches == 0 and missing_rows == 0
 
-def check_matrix_integrity():
+def check_matrix_integrity(ctx):
     """Verify matrix is properly generated and indexed"""
     print_header("MATRIX INTEGRITY CHECK")
 
-    matrix_df = pd.read_csv('data/processed/sources_matrix.csv')
+    matrix_df = ctx.sources_matrix
 
     # Check textrank indexing
     min_rank = matrix_df['textrank'].min()
     max_rank = matrix_df['textrank'].max()
     expected_max = len(matrix_df)
 
-    print(f"Matrix rows: {len(matrix_df)}")
-    print(f"TextRank range: {min_rank} to {max_rank}")
-    print(f"Expected range: 1 to {expected_max}")
+    log_info(f"Matrix rows: {len(matrix_df)}")
+    log_info(f"TextRank range: {min_rank} to {max_rank}")
+    log_info(f"Expected range: 1 to {expected_max}")
 
     rank_correct = min_rank == 1 and max_rank == expected_max
     print_check("TextRank correctly indexed", rank_correct)
 
     # Check for null values
     null_count = matrix_df.isnull().sum().sum()
-    print(f"\nNull values in matrix: {null_count}")
+    log_info("")
+    log_info(f"Null values in matrix: {null_count}")
     print_check("No null values", null_count == 0)
 
     # Check source verification
     verified_count = len(matrix_df[matrix_df['verification'].str.contains(SOURCE_VERIFIED_STATUS, na=False)])
-    print("\nSource verification:")
-    print(f"  Verified opportunities: {verified_count}/{len(matrix_df)}")
+    log_info("")
+    log_info("Source verification:")
+    log_info(f"  Verified opportunities: {verified_count}/{len(matrix_df)}")
     print_check("All sources verified", verified_count == len(matrix_df))
 
     # Check matrix is sorted by priority
@@ -194,22 +273,37 @@ def check_matrix_integrity():
 
     return rank_correct and null_count == 0 and verified_count == len(matrix_df) and is_sorted
 
-def main():
-    """Run comprehensive QC check"""
-    print(f"{COLOR_BLUE}")
-    print("=" * 70)
-    print("NUVIEW STRATEGIC PIPELINE - COMPREHENSIVE QC CHECK")
-    print("=" * 70)
-    print(f"Timestamp: {datetime.now().isoformat()}")
-    print(f"{COLOR_RESET}")
+@traced('comprehensive_qc_check', run=True)
+def main(ctx=None):
+    """
+    Run comprehensive QC check
+
+    Args:
+        ctx (QCContext): Shared QC inputs; a fresh context is created if omitted
+    """
+    import pandas as pd
+    log_info("=" * 70)
+    log_info("NUVIEW STRATEGIC PIPELINE - COMPREHENSIVE QC CHECK")
+    log_info("=" * 70)
+    log_info(f"Timestamp: {datetime.now().isoformat()}")
+    log_info("")
+
+    # Each input is loaded once on the context and shared by every check
+    ctx = ctx or QCContext()
+    mismatch_tables = []
 
     results = {
-        'index_integrity': check_index_integrity(),
-        'calculations': check_calculations(),
-        'cross_references': check_cross_references(),
-        'matrix_integrity': check_matrix_integrity()
+        'index_integrity': check_index_integrity(ctx),
+        'calculations': check_calculations(ctx, mismatch_tables),
+        'cross_references': check_cross_references(ctx, mismatch_tables),
+        'matrix_integrity': check_matrix_integrity(ctx)
     }
 
+    # Every flagged row from every check, in one table
+    mismatches = pd.concat(mismatch_tables, ignore_index=True)
+    os.makedirs(os.path.dirname(MISMATCH_FILE), exist_ok=True)
+    mismatches.to_csv(MISMATCH_FILE, index=False)
+
     # Summary
     print_header("QC SUMMARY")
 
@@ -218,13 +312,14 @@ def main():
     for check_name, passed in results.items():
         print_check(check_name.replace('_', ' ').title(), passed)
 
-    print("\n" + "=" * 70)
+    log_info("")
+    log_info("=" * 70)
 
     if all_passed:
-        print(f"{COLOR_GREEN}✅ ALL QC CHECKS PASSED - SYSTEM INTEGRITY VERIFIED{COLOR_RESET}")
+        log_success("ALL QC CHECKS PASSED - SYSTEM INTEGRITY VERIFIED")
         return 0
     else:
-        print(f"{COLOR_RED}❌ SOME QC CHECKS FAILED - REVIEW REQUIRED{COLOR_RESET}")
+        log_error("SOME QC CHECKS FAILED - REVIEW REQUIRED")
         return 1
 
 if __name__ == "__main__":
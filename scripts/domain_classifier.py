@@ -0,0 +1,128 @@
+"""
+NUVIEW Strategic Pipeline - Domain Classifier
+Shared topographic / bathymetric scope classification
+
+Every stage that asks "is this topographic?" or "is this bathymetry-only?"
+uses the keyword lists here. All lists are compiled into a single matcher, so
+a text is scanned once and every flag is answered from that one pass.
+
+Usage:
+    from domain_classifier import classify, classify_batch
+
+    flags = classify(opp['title'], opp.get('description', ''))
+    if flags['out_of_scope']:
+        ...
+"""
+
+import re
+from functools import lru_cache
+
+# Keywords that mark a text as covering bathymetry / seafloor mapping
+BATHYMETRIC_KEYWORDS = ['bathymetry', 'bathymetric', 'ocean floor', 'seafloor', 'underwater mapping',
+                        'subsea', 'seabed', 'marine survey', 'hydrographic', 'ocean depth']
+
+# Keywords that mark a text as covering land topography (keeps bathymetric texts in scope)
+TOPOGRAPHIC_KEYWORDS = ['lidar', 'topographic', 'elevation', '3dep', 'dem', 'terrain', 'dtm', 'dsm',
+                        'terrestrial', 'land surface', 'above water']
+
+# Keywords that make an opportunity relevant to the NUVIEW pipeline in QC
+RELEVANCE_KEYWORDS = ['lidar', 'topographic', 'elevation', '3dep', 'dem', 'mapping', 'terrain']
+
+TOPOGRAPHIC = 'topographic'
+BATHYMETRIC = 'bathymetric'
+RELEVANT = 'relevant'
+OUT_OF_SCOPE = 'out_of_scope'
+
+KEYWORD_CATEGORIES = {
+    TOPOGRAPHIC: TOPOGRAPHIC_KEYWORDS,
+    BATHYMETRIC: BATHYMETRIC_KEYWORDS,
+    RELEVANT: RELEVANCE_KEYWORDS,
+}
+
+def _build_matcher(keyword_categories):
+    """
+    Compile all keyword lists into one matcher.
+
+    The pattern is one alternation over every keyword, ordered longest first,
+    so a match reports the longest keyword starting at that position. Any
+    shorter keyword matching at the same position is a prefix of that one,
+    so each keyword maps to the categories of all its keyword prefixes.
+
+    Returns:
+        tuple: (compiled pattern, dict keyword -> frozenset of categories)
+    """
+    categories = {}
+    for category, keywords in keyword_categories.items():
+        for keyword in keywords:
+            categories.setdefault(keyword.lower(), set()).add(category)
+
+    closed = {}
+    for keyword in categories:
+        closed[keyword] = frozenset().union(
+            *(cats for other, cats in categories.items() if keyword.startswith(other))
+        )
+
+    ordered = sorted(closed, key=lambda k: (-len(k), k))
+    pattern = re.compile('|'.join(re.escape(k) for k in ordered))
+    return pattern, closed
+
+_MATCHER, _KEYWORD_CATEGORIES = _build_matcher(KEYWORD_CATEGORIES)
+_ALL_CATEGORIES = frozenset(KEYWORD_CATEGORIES)
+
+# Scans are memoized so stages classifying the same record in one run
+# (QC relevance, the source matrix) share a single scan
+SCAN_CACHE_SIZE = 65536
+
+def _flags(found):
+    return {
+        TOPOGRAPHIC: TOPOGRAPHIC in found,
+        BATHYMETRIC: BATHYMETRIC in found,
+        RELEVANT: RELEVANT in found,
+        OUT_OF_SCOPE: BATHYMETRIC in found and TOPOGRAPHIC not in found,
+    }
+
+@lru_cache(maxsize=SCAN_CACHE_SIZE)
+def _scan(text):
+    """Return the frozenset of categories whose keywords occur in text"""
+    text = text.lower()
+    found = set()
+
+    # Resume one character after each match start (not at its end) so that
+    # keywords overlapping a previous match are still seen
+    match = _MATCHER.search(text)
+    while match is not None:
+        found |= _KEYWORD_CATEGORIES[match.group()]
+        if found == _ALL_CATEGORIES:
+            break
+        match = _MATCHER.search(text, match.start() + 1)
+
+    return frozenset(found)
+
+def classify_text(text):
+    """
+    Classify a block of text in one scan.
+
+    Args:
+        text (str): Text to classify (matching is case-insensitive)
+
+    Returns:
+        dict: Flags 'topographic', 'bathymetric', 'relevant' and
+              'out_of_scope' (bathymetric with no topographic keyword)
+    """
+    return _flags(_scan(text))
+
+def classify(title, description=''):
+    """Classify an opportunity from its title and description"""
+    return classify_text(f"{title} {description}")
+
+def classify_batch(texts):
+    """
+    Classify many texts with the shared compiled matcher.
+
+    Args:
+        texts (iterable): Strings (e.g. combined title/description per record)
+
+    Returns:
+        list: One flags dict per text, in input order
+    """
+    return [classify_text(text) for text in texts]
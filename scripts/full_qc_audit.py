@@ -9,102 +9,264 @@ Comprehensive audit including:
 - Documentation quality checks
 - Recent PR integration verification
 - Regression detection
+- Performance regressions against a committed baseline (--perf)
 """
 
+import argparse
+import csv
+import io
 import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, List, Tuple
-
-import pandas as pd
-
-# Color codes for console output
-COLOR_GREEN = '\033[92m'
-COLOR_ORANGE = '\033[93m'
-COLOR_RED = '\033[91m'
-COLOR_BLUE = '\033[94m'
-COLOR_CYAN = '\033[96m'
-COLOR_RESET = '\033[0m'
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+# Add scripts and benchmarks directories to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import comprehensive_qc_check
+import pipeline_log
+import profiling
+import qc_validator
+from audit_manifest import AUDIT_CACHE_FILE, AuditCache, build_manifest, rules_version
+from pipeline_log import SUCCESS, get_logger
+from profiling import profiled
+from qc_context import QCContext
+from tracing import add_spans, collect, span, take_spans, traced
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Files whose content changes audit verdicts (cached verdicts are dropped when they change)
+AUDIT_RULE_FILES = (__file__, 'pyproject.toml')
+
+# Python files linted with ruff
+RUFF_DIRS = ('scripts' + os.sep, 'tests' + os.sep)
+
+# Performance gate (--perf): benchmark cases timed on a synthetic corpus and
+# compared with the committed baseline. Times are compared relative to the
+# benchmark calibration loop, so the baseline holds on other hardware
+PERF_BASELINE_FILE = 'benchmarks/baseline.json'
+PERF_CASES = ('keyword_scoring', 'merge', 'schema_validation')
+PERF_CORPUS_SIZE = 2000
+PERF_REPEAT = 5
+
+# (warn, fail) ratios of measured / baseline; beyond fail the audit fails
+PERF_TIME_TOLERANCE = (1.25, 1.5)
+PERF_MEMORY_TOLERANCE = (1.1, 1.25)
+
+# Categories whose errors fail the audit even when there are only a few
+# (a failing or crashing QC validator means the published data is unchecked)
+BLOCKING_CATEGORIES = ('Data Integrity', 'Performance')
+
+log = get_logger('full_qc_audit')
 
 def log_section(title: str):
     """Log a section header"""
-    print(f"\n{COLOR_CYAN}{'=' * 80}")
-    print(f"{title}")
-    print(f"{'=' * 80}{COLOR_RESET}\n")
+    for line in ("", "=" * 80, title, "=" * 80, ""):
+        log.info(line)
 
 def log_info(msg: str):
     """Log info message"""
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg: str):
     """Log success message"""
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
 
 def log_warning(msg: str):
     """Log warning message"""
-    print(f"{COLOR_ORANGE}⚠️  {msg}{COLOR_RESET}")
+    log.warning(msg)
 
 def log_error(msg: str):
     """Log error message"""
-    print(f"{COLOR_RED}❌ {msg}{COLOR_RESET}")
-
-def validate_html_files() -> Tuple[List[str], List[str], int]:
-    """Validate HTML files for syntax and structure"""
-    log_section("HTML FILE VALIDATION")
-
+    log.error(msg)
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+])
+
+# Elements whose end tag may be omitted (closed implicitly by a parent's end tag)
+OPTIONAL_END_ELEMENTS = frozenset([
+    'html', 'head', 'body', 'p', 'li', 'dt', 'dd', 'option', 'optgroup',
+    'thead', 'tbody', 'tfoot', 'tr', 'td', 'th', 'colgroup', 'caption', 'rp', 'rt',
+])
+
+# Start tags that implicitly close an open element of the listed kinds
+IMPLIED_CLOSES = {
+    'li': {'li'}, 'dt': {'dt', 'dd'}, 'dd': {'dt', 'dd'}, 'option': {'option'},
+    'tr': {'tr', 'td', 'th'}, 'td': {'td', 'th'}, 'th': {'td', 'th'},
+    'thead': {'tbody', 'tfoot'}, 'tbody': {'thead', 'tbody', 'tfoot'}, 'tfoot': {'thead', 'tbody'},
+}
+
+# Block-level start tags that implicitly close an open <p>
+P_CLOSING_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'details', 'div', 'dl', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul',
+])
+
+HTML_READ_CHUNK = 64 * 1024
+HTML_NESTING_REPORT_LIMIT = 10
+
+# Rows per chunk when streaming CSV files
+CSV_CHUNK_ROWS = 50000
+
+class HTMLStructureParser(HTMLParser):
+    """
+    Single-pass HTML structure checker.
+
+    Tracks open elements on a stack while the document is tokenized and
+    records unbalanced or misnested tags with their line numbers, along with
+    the document features the audit requires (DOCTYPE, html/head/body, charset).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.stack = []
+        self.nesting_issues = []
+        self.has_doctype = False
+        self.has_charset = False
+        self.seen_tags = set()
+
+    def handle_decl(self, decl):
+        if decl.lower().startswith('doctype html'):
+            self.has_doctype = True
+
+    def _close_implied(self, tag):
+        """Pop open elements that this start tag closes implicitly"""
+        while self.stack:
+            open_tag = self.stack[-1][0]
+            if open_tag in IMPLIED_CLOSES.get(tag, ()) or (open_tag == 'p' and tag in P_CLOSING_TAGS):
+                self.stack.pop()
+            else:
+                break
+
+    def _note_tag(self, tag, attrs):
+        """Record the document features a tag provides"""
+        self.seen_tags.add(tag)
+        if tag == 'meta':
+            for name, value in attrs:
+                if name == 'charset' or (name == 'content' and value and 'charset=' in value.lower()):
+                    self.has_charset = True
+
+    def handle_starttag(self, tag, attrs):
+        self._note_tag(tag, attrs)
+        self._close_implied(tag)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, self.getpos()[0]))
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing syntax (<br/>, <path ... />) opens nothing
+        self._note_tag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        line = self.getpos()[0]
+        if tag in VOID_ELEMENTS:
+            return
+
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                for open_tag, open_line in self.stack[depth + 1:]:
+                    if open_tag not in OPTIONAL_END_ELEMENTS:
+                        self.nesting_issues.append(
+                            f"line {line}: </{tag}> closes <{open_tag}> opened at line {open_line} "
+                            "(misnested or unclosed)"
+                        )
+                del self.stack[depth:]
+                return
+
+        self.nesting_issues.append(f"line {line}: </{tag}> has no matching open tag")
+
+    def close(self):
+        super().close()
+        for open_tag, open_line in self.stack:
+            if open_tag not in OPTIONAL_END_ELEMENTS:
+                self.nesting_issues.append(f"line {open_line}: <{open_tag}> is never closed")
+        self.stack = []
+
+def _check_html_file(html_file: str) -> Tuple[List[str], List[str]]:
+    """Check one HTML file for syntax and structure in a single streaming pass"""
     errors = []
     warnings = []
-    files_checked = 0
-
-    html_files = list(Path('.').rglob('*.html'))
-    html_files = [f for f in html_files if '.git' not in str(f)]
-
-    log_info(f"Found {len(html_files)} HTML files")
 
-    for html_file in html_files:
-        files_checked += 1
-        log_info(f"Checking: {html_file}")
-
-        try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    try:
+        parser = HTMLStructureParser()
+        empty = True
+        with open(html_file, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(HTML_READ_CHUNK), ''):
+                if empty and chunk.strip():
+                    empty = False
+                parser.feed(chunk)
+        parser.close()
+
+        # Basic HTML validation
+        if empty:
+            errors.append(f"{html_file}: File is empty")
+            return errors, warnings
+
+        # Check for DOCTYPE
+        if not parser.has_doctype:
+            warnings.append(f"{html_file}: Missing DOCTYPE declaration")
+
+        # Check for basic HTML structure
+        if 'html' not in parser.seen_tags:
+            errors.append(f"{html_file}: Missing <html> tag")
+
+        if 'head' not in parser.seen_tags:
+            warnings.append(f"{html_file}: Missing <head> section")
+
+        if 'body' not in parser.seen_tags:
+            warnings.append(f"{html_file}: Missing <body> section")
+
+        # Check for charset declaration
+        if not parser.has_charset:
+            warnings.append(f"{html_file}: Missing charset declaration")
+
+        # Check for unbalanced and misnested tags
+        for issue in parser.nesting_issues[:HTML_NESTING_REPORT_LIMIT]:
+            warnings.append(f"{html_file}: {issue}")
+        if len(parser.nesting_issues) > HTML_NESTING_REPORT_LIMIT:
+            warnings.append(
+                f"{html_file}: ... and {len(parser.nesting_issues) - HTML_NESTING_REPORT_LIMIT} more tag nesting issues"
+            )
 
-            # Basic HTML validation
-            if not content.strip():
-                errors.append(f"{html_file}: File is empty")
-                continue
+    except UnicodeDecodeError:
+        errors.append(f"{html_file}: File encoding error")
+    except Exception as e:
+        errors.append(f"{html_file}: {str(e)}")
 
-            # Check for DOCTYPE
-            if '<!DOCTYPE html>' not in content and '<!doctype html>' not in content.lower():
-                warnings.append(f"{html_file}: Missing DOCTYPE declaration")
+    return errors, warnings
 
-            # Check for basic HTML structure
-            if '<html' not in content.lower():
-                errors.append(f"{html_file}: Missing <html> tag")
+def _run_cached(entries: List[Dict], check: str, func, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Run a per-file check over manifest entries, reusing cached verdicts of unchanged files"""
+    errors = []
+    warnings = []
 
-            if '<head' not in content.lower():
-                warnings.append(f"{html_file}: Missing <head> section")
+    for entry in entries:
+        file_errors, file_warnings, cached = cache.run(entry, check, func)
+        if not cached:
+            log_info(f"Checking: {entry['path']}")
+        errors.extend(file_errors)
+        warnings.extend(file_warnings)
 
-            if '<body' not in content.lower():
-                warnings.append(f"{html_file}: Missing <body> section")
+    return errors, warnings, len(entries)
 
-            # Check for charset declaration
-            if 'charset=' not in content.lower():
-                warnings.append(f"{html_file}: Missing charset declaration")
+def validate_html_files(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate HTML files for syntax and structure"""
+    log_section("HTML FILE VALIDATION")
 
-            # Check for unclosed tags (basic check)
-            open_tags = content.count('<div')
-            close_tags = content.count('</div>')
-            if open_tags != close_tags:
-                warnings.append(f"{html_file}: Mismatched <div> tags (open: {open_tags}, close: {close_tags})")
+    html_files = manifest['html']
+    log_info(f"Found {len(html_files)} HTML files")
 
-        except UnicodeDecodeError:
-            errors.append(f"{html_file}: File encoding error")
-        except Exception as e:
-            errors.append(f"{html_file}: {str(e)}")
+    errors, warnings, files_checked = _run_cached(html_files, 'html', _check_html_file, cache)
 
     # Report results
     if errors:
@@ -120,57 +282,104 @@ def validate_html_files() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def validate_python_files() -> Tuple[List[str], List[str], int]:
-    """Validate Python files for syntax and style using ruff"""
-    log_section("PYTHON CODE VALIDATION")
+def _check_python_syntax(py_file: str) -> Tuple[List[str], List[str]]:
+    """Compile one Python file to check its syntax"""
+    errors = []
+    try:
+        with open(py_file, 'r', encoding='utf-8') as f:
+            compile(f.read(), str(py_file), 'exec')
+    except SyntaxError as e:
+        errors.append(f"{py_file}: Syntax error at line {e.lineno}: {e.msg}")
+    except Exception as e:
+        errors.append(f"{py_file}: {str(e)}")
+    return errors, []
+
+def _classify_ruff_line(line: str, errors: List[str], warnings: List[str]):
+    """Sort a ruff output line into errors or warnings"""
+    if 'error' in line.lower() or line.startswith('E'):
+        errors.append(f"Ruff: {line}")
+    else:
+        warnings.append(f"Ruff: {line}")
 
+def run_ruff(entries: List[Dict], cache: AuditCache) -> Tuple[List[str], List[str]]:
+    """
+    Lint Python files with ruff, only running it on files changed since the last audit.
+
+    Ruff's findings are attributed to files and cached per file like the
+    other checks; unchanged files replay their cached findings.
+    """
     errors = []
     warnings = []
-    files_checked = 0
+    pending = []
 
-    # Find all Python files
-    python_files = list(Path('.').rglob('*.py'))
-    python_files = [f for f in python_files if '.git' not in str(f)]
+    for entry in entries:
+        cached = cache.lookup(entry, 'ruff')
+        if cached is None:
+            pending.append(entry)
+        else:
+            errors.extend(cached[0])
+            warnings.extend(cached[1])
+
+    if not pending:
+        return errors, warnings
+
+    log_info(f"Running ruff on {len(pending)} changed Python files...")
+    result = subprocess.run(
+        ['ruff', 'check', '--force-exclude', '--output-format=concise', *[e['path'] for e in pending]],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+
+    findings = {entry['path']: ([], []) for entry in pending}
+    for line in result.stdout.strip().split('\n'):
+        if line and not line.startswith('warning:') and not line.startswith('Found'):
+            file_findings = findings.get(os.path.normpath(line.split(':', 1)[0]))
+            if file_findings is not None:
+                _classify_ruff_line(line, *file_findings)
+            else:
+                _classify_ruff_line(line, errors, warnings)
+
+    # Exit code 2 means ruff itself failed; its (empty) findings are not cached
+    for entry in pending:
+        file_errors, file_warnings = findings[entry['path']]
+        if result.returncode in (0, 1):
+            cache.store(entry, 'ruff', file_errors, file_warnings)
+        errors.extend(file_errors)
+        warnings.extend(file_warnings)
 
+    return errors, warnings
+
+def validate_python_files(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate Python files for syntax and style using ruff"""
+    log_section("PYTHON CODE VALIDATION")
+
+    python_files = manifest['python']
     log_info(f"Found {len(python_files)} Python files")
 
-    # Check syntax for each file
-    for py_file in python_files:
-        files_checked += 1
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                compile(f.read(), str(py_file), 'exec')
-        except SyntaxError as e:
-            errors.append(f"{py_file}: Syntax error at line {e.lineno}: {e.msg}")
-        except Exception as e:
-            errors.append(f"{py_file}: {str(e)}")
+    # Check syntax for each changed file
+    errors = []
+    warnings = []
+    files_checked = len(python_files)
+    for entry in python_files:
+        file_errors, _file_warnings, _cached = cache.run(entry, 'syntax', _check_python_syntax)
+        errors.extend(file_errors)
 
     log_info(f"Syntax checked for {files_checked} Python files")
 
-    # Run ruff for style checking
+    # Run ruff for style checking (scripts/ and tests/ only)
     log_info("Running ruff for style checking...")
+    lint_files = [e for e in python_files if e['path'].startswith(RUFF_DIRS)]
     try:
-        result = subprocess.run(
-            ['ruff', 'check', 'scripts/', 'tests/', '--output-format=text'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        ruff_errors, ruff_warnings = run_ruff(lint_files, cache)
+        errors.extend(ruff_errors)
+        warnings.extend(ruff_warnings)
 
-        if result.stdout:
-            # Parse ruff output
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if line and not line.startswith('warning:') and not line.startswith('Found'):
-                    if 'error' in line.lower() or line.startswith('E'):
-                        errors.append(f"Ruff: {line}")
-                    else:
-                        warnings.append(f"Ruff: {line}")
-
-        if result.returncode == 0:
+        issues = len(ruff_errors) + len(ruff_warnings)
+        if issues == 0:
             log_success("Ruff style check passed")
         else:
-            log_warning(f"Ruff found {len([w for w in warnings if 'Ruff:' in w])} style issues")
+            log_warning(f"Ruff found {issues} style issues")
 
     except FileNotFoundError:
         warnings.append("Ruff not found - skipping style checks")
@@ -191,52 +400,82 @@ def validate_python_files() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def validate_shell_scripts() -> Tuple[List[str], List[str], int]:
-    """Validate shell scripts using shellcheck"""
-    log_section("SHELL SCRIPT VALIDATION")
+def run_shellcheck(entries: List[Dict], cache: AuditCache) -> Tuple[List[str], List[str]]:
+    """
+    Check shell scripts with one shellcheck call over every changed script.
 
+    Findings are read in gcc format (one line per finding) and attributed to
+    their script, whose verdict is cached like the other checks.
+    Raises FileNotFoundError when shellcheck is not installed.
+    """
     errors = []
     warnings = []
-    files_checked = 0
+    pending = []
 
-    # Find all shell scripts
-    shell_files = list(Path('.').rglob('*.sh'))
-    shell_files = [f for f in shell_files if '.git' not in str(f)]
+    for entry in entries:
+        cached = cache.lookup(entry, 'shell')
+        if cached is None:
+            pending.append(entry)
+        else:
+            errors.extend(cached[0])
+            warnings.extend(cached[1])
+
+    if not pending:
+        return errors, warnings
+
+    log_info(f"Running shellcheck on {len(pending)} changed shell scripts...")
+    result = subprocess.run(
+        ['shellcheck', '-f', 'gcc', *[e['path'] for e in pending]],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+
+    findings = {entry['path']: ([], []) for entry in pending}
+    for line in result.stdout.strip().split('\n'):
+        if not line.strip():
+            continue
+        sh_file = os.path.normpath(line.split(':', 1)[0])
+        file_errors, file_warnings = findings.get(sh_file, (errors, warnings))
+        if ': error:' in line:
+            file_errors.append(f"{sh_file}: {line}")
+        else:
+            file_warnings.append(f"{sh_file}: {line}")
 
-    log_info(f"Found {len(shell_files)} shell scripts")
+    # Exit codes above 1 mean shellcheck itself failed; nothing is cached then
+    for entry in pending:
+        file_errors, file_warnings = findings[entry['path']]
+        if result.returncode in (0, 1):
+            cache.store(entry, 'shell', file_errors, file_warnings)
+            if not file_errors and not file_warnings:
+                log_success(f"{entry['path']}: Passed shellcheck")
+        errors.extend(file_errors)
+        warnings.extend(file_warnings)
 
-    for sh_file in shell_files:
-        files_checked += 1
-        log_info(f"Checking: {sh_file}")
+    if result.returncode > 1:
+        warnings.append(f"shellcheck failed: {result.stderr.strip()}")
 
-        try:
-            result = subprocess.run(
-                ['shellcheck', str(sh_file)],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+    return errors, warnings
+
+def validate_shell_scripts(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate shell scripts using shellcheck"""
+    log_section("SHELL SCRIPT VALIDATION")
 
-            if result.stdout:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if 'error' in line.lower():
-                        errors.append(f"{sh_file}: {line}")
-                    elif 'warning' in line.lower():
-                        warnings.append(f"{sh_file}: {line}")
-                    elif line.strip() and not line.startswith('In ') and 'https://' not in line:
-                        warnings.append(f"{sh_file}: {line}")
-
-            if result.returncode == 0:
-                log_success(f"{sh_file}: Passed shellcheck")
-
-        except FileNotFoundError:
-            warnings.append(f"shellcheck not found - skipping {sh_file}")
-            break  # Don't check others if shellcheck is not available
-        except subprocess.TimeoutExpired:
-            warnings.append(f"{sh_file}: shellcheck timed out")
-        except Exception as e:
-            warnings.append(f"{sh_file}: {str(e)}")
+    errors = []
+    warnings = []
+
+    shell_files = manifest['shell']
+    files_checked = len(shell_files)
+    log_info(f"Found {files_checked} shell scripts")
+
+    try:
+        errors, warnings = run_shellcheck(shell_files, cache)
+    except FileNotFoundError:
+        warnings.append("shellcheck not found - skipping shell script checks")
+    except subprocess.TimeoutExpired:
+        warnings.append("shellcheck timed out")
+    except Exception as e:
+        warnings.append(f"shellcheck failed: {str(e)}")
 
     # Report results
     if not errors and warnings:
@@ -244,38 +483,36 @@ def validate_shell_scripts() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def validate_json_files() -> Tuple[List[str], List[str], int]:
-    """Validate JSON files for syntax and structure"""
-    log_section("JSON FILE VALIDATION")
-
+def _check_json_file(json_file: str) -> Tuple[List[str], List[str]]:
+    """Check one JSON file for syntax"""
     errors = []
     warnings = []
-    files_checked = 0
 
-    # Find all JSON files
-    json_files = list(Path('.').rglob('*.json'))
-    json_files = [f for f in json_files if '.git' not in str(f) and 'node_modules' not in str(f)]
+    try:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
-    log_info(f"Found {len(json_files)} JSON files")
+        # Check if empty
+        if not data:
+            warnings.append(f"{json_file}: File is empty or contains null")
+        else:
+            log_success(f"{json_file}: Valid JSON")
 
-    for json_file in json_files:
-        files_checked += 1
-        log_info(f"Checking: {json_file}")
+    except json.JSONDecodeError as e:
+        errors.append(f"{json_file}: JSON syntax error at line {e.lineno}: {e.msg}")
+    except Exception as e:
+        errors.append(f"{json_file}: {str(e)}")
 
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    return errors, warnings
 
-            # Check if empty
-            if not data:
-                warnings.append(f"{json_file}: File is empty or contains null")
-            else:
-                log_success(f"{json_file}: Valid JSON")
+def validate_json_files(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate JSON files for syntax and structure"""
+    log_section("JSON FILE VALIDATION")
 
-        except json.JSONDecodeError as e:
-            errors.append(f"{json_file}: JSON syntax error at line {e.lineno}: {e.msg}")
-        except Exception as e:
-            errors.append(f"{json_file}: {str(e)}")
+    json_files = [e for e in manifest['json'] if 'node_modules' not in e['path']]
+    log_info(f"Found {len(json_files)} JSON files")
+
+    errors, warnings, files_checked = _run_cached(json_files, 'json', _check_json_file, cache)
 
     # Report results
     if errors:
@@ -286,49 +523,84 @@ def validate_json_files() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def validate_csv_files() -> Tuple[List[str], List[str], int]:
-    """Validate CSV files for structure and integrity"""
-    log_section("CSV FILE VALIDATION")
-
+def _column_kind(values: 'pd.Series'):
+    """Broad type of a column chunk ('numeric', 'boolean' or 'text'), None if all null"""
+    import pandas as pd
+    if not values.notna().any():
+        return None
+    if pd.api.types.is_bool_dtype(values):
+        return 'boolean'
+    if pd.api.types.is_numeric_dtype(values):
+        return 'numeric'
+    return 'text'
+
+def _check_csv_file(csv_file: str) -> Tuple[List[str], List[str]]:
+    """
+    Check one CSV file for structure and integrity.
+
+    The file is read in chunks of CSV_CHUNK_ROWS rows and statistics (row and
+    null counts, the type each column takes per chunk) are accumulated, so
+    memory stays bounded however large the matrix grows.
+    """
+    import pandas as pd
     errors = []
     warnings = []
-    files_checked = 0
-
-    # Find all CSV files
-    csv_files = list(Path('.').rglob('*.csv'))
-    csv_files = [f for f in csv_files if '.git' not in str(f)]
-
-    log_info(f"Found {len(csv_files)} CSV files")
-
-    for csv_file in csv_files:
-        files_checked += 1
-        log_info(f"Checking: {csv_file}")
 
-        try:
-            df = pd.read_csv(csv_file)
-
-            # Check if empty
-            if df.empty:
-                warnings.append(f"{csv_file}: File is empty")
-                continue
+    try:
+        # Duplicate headers are checked on the raw header row, before pandas renames them
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            errors.append(f"{csv_file}: File is empty")
+            return errors, warnings
+
+        if len(set(header)) != len(header):
+            errors.append(f"{csv_file}: Contains duplicate column headers")
+
+        row_count = 0
+        null_count = 0
+        column_kinds = {}
+        for chunk in pd.read_csv(csv_file, chunksize=CSV_CHUNK_ROWS):
+            row_count += len(chunk)
+            null_count += int(chunk.isnull().sum().sum())
+            for column in chunk.columns:
+                kind = _column_kind(chunk[column])
+                if kind is not None:
+                    column_kinds.setdefault(column, set()).add(kind)
+
+        # Check if empty
+        if row_count == 0:
+            warnings.append(f"{csv_file}: File is empty")
+            return errors, warnings
+
+        # Check for null values
+        if null_count > 0:
+            warnings.append(f"{csv_file}: Contains {null_count} null values")
+
+        # Check that each column keeps one type across chunks
+        for column, kinds in column_kinds.items():
+            if len(kinds) > 1:
+                warnings.append(f"{csv_file}: Column '{column}' has inconsistent types ({', '.join(sorted(kinds))})")
+
+        log_success(f"{csv_file}: Valid CSV with {row_count} rows, {len(header)} columns")
+
+    except pd.errors.EmptyDataError:
+        errors.append(f"{csv_file}: File is empty")
+    except pd.errors.ParserError as e:
+        errors.append(f"{csv_file}: CSV parsing error: {str(e)}")
+    except Exception as e:
+        errors.append(f"{csv_file}: {str(e)}")
 
-            # Check for duplicate headers
-            if df.columns.duplicated().any():
-                errors.append(f"{csv_file}: Contains duplicate column headers")
+    return errors, warnings
 
-            # Check for null values
-            null_count = df.isnull().sum().sum()
-            if null_count > 0:
-                warnings.append(f"{csv_file}: Contains {null_count} null values")
+def validate_csv_files(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate CSV files for structure and integrity"""
+    log_section("CSV FILE VALIDATION")
 
-            log_success(f"{csv_file}: Valid CSV with {len(df)} rows, {len(df.columns)} columns")
+    csv_files = manifest['csv']
+    log_info(f"Found {len(csv_files)} CSV files")
 
-        except pd.errors.EmptyDataError:
-            errors.append(f"{csv_file}: File is empty")
-        except pd.errors.ParserError as e:
-            errors.append(f"{csv_file}: CSV parsing error: {str(e)}")
-        except Exception as e:
-            errors.append(f"{csv_file}: {str(e)}")
+    errors, warnings, files_checked = _run_cached(csv_files, 'csv', _check_csv_file, cache)
 
     # Report results
     if errors:
@@ -339,47 +611,45 @@ def validate_csv_files() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def validate_documentation() -> Tuple[List[str], List[str], int]:
-    """Validate documentation files for clarity and completeness"""
-    log_section("DOCUMENTATION VALIDATION")
-
+def _check_markdown_file(md_file: str) -> Tuple[List[str], List[str]]:
+    """Check one Markdown file for clarity and completeness"""
     errors = []
     warnings = []
-    files_checked = 0
 
-    # Find all markdown files
-    md_files = list(Path('.').rglob('*.md'))
-    md_files = [f for f in md_files if '.git' not in str(f) and 'node_modules' not in str(f)]
+    try:
+        with open(md_file, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-    log_info(f"Found {len(md_files)} Markdown files")
+        # Check if empty
+        if not content.strip():
+            warnings.append(f"{md_file}: File is empty")
+            return errors, warnings
 
-    for md_file in md_files:
-        files_checked += 1
-        log_info(f"Checking: {md_file}")
+        # Check for headers
+        if not any(line.startswith('#') for line in content.split('\n')):
+            warnings.append(f"{md_file}: Missing markdown headers")
 
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Check for minimum content length
+        if len(content) < 100:
+            warnings.append(f"{md_file}: File seems too short ({len(content)} chars)")
 
-            # Check if empty
-            if not content.strip():
-                warnings.append(f"{md_file}: File is empty")
-                continue
+        log_success(f"{md_file}: Valid ({len(content)} chars)")
 
-            # Check for headers
-            if not any(line.startswith('#') for line in content.split('\n')):
-                warnings.append(f"{md_file}: Missing markdown headers")
+    except UnicodeDecodeError:
+        errors.append(f"{md_file}: File encoding error")
+    except Exception as e:
+        errors.append(f"{md_file}: {str(e)}")
 
-            # Check for minimum content length
-            if len(content) < 100:
-                warnings.append(f"{md_file}: File seems too short ({len(content)} chars)")
+    return errors, warnings
+
+def validate_documentation(manifest: Dict, cache: AuditCache) -> Tuple[List[str], List[str], int]:
+    """Validate documentation files for clarity and completeness"""
+    log_section("DOCUMENTATION VALIDATION")
 
-            log_success(f"{md_file}: Valid ({len(content)} chars)")
+    md_files = [e for e in manifest['markdown'] if 'node_modules' not in e['path']]
+    log_info(f"Found {len(md_files)} Markdown files")
 
-        except UnicodeDecodeError:
-            errors.append(f"{md_file}: File encoding error")
-        except Exception as e:
-            errors.append(f"{md_file}: {str(e)}")
+    errors, warnings, files_checked = _run_cached(md_files, 'markdown', _check_markdown_file, cache)
 
     # Report results
     if errors:
@@ -390,52 +660,62 @@ def validate_documentation() -> Tuple[List[str], List[str], int]:
 
     return errors, warnings, files_checked
 
-def check_data_integrity() -> Tuple[List[str], List[str]]:
-    """Run existing data integrity checks"""
+# Data integrity checks: verdict name -> call with a QCContext, returning an exit code
+DATA_INTEGRITY_CHECKS = {
+    'qc_validator': lambda ctx: qc_validator.main([], ctx=ctx),
+    'comprehensive_qc_check': lambda ctx: comprehensive_qc_check.main(ctx=ctx),
+}
+
+def check_data_integrity(ctx: QCContext = None, verdicts: Dict = None) -> Tuple[List[str], List[str]]:
+    """
+    Run existing data integrity checks
+
+    Both checks run in-process on one shared QCContext, so each data file is
+    parsed once for the whole audit. Their console output is captured, as the
+    subprocess runs used to do. A check whose verdict is already known (the
+    pipeline runner ran it on the same data) is not run again.
+
+    Args:
+        ctx (QCContext): Shared QC inputs; a fresh context is created if omitted
+        verdicts (dict): Check name -> exit code, or "<Exception>: <message>" if it crashed
+    """
     log_section("DATA INTEGRITY CHECKS")
 
     errors = []
     warnings = []
-
-    # Run existing QC validator
-    log_info("Running qc_validator.py...")
-    try:
-        result = subprocess.run(
-            [sys.executable, 'scripts/qc_validator.py'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            errors.append("QC validator failed - see output above")
-        else:
-            log_success("QC validator passed")
-    except subprocess.TimeoutExpired:
-        warnings.append("QC validator timed out")
-    except Exception as e:
-        warnings.append(f"Could not run QC validator: {str(e)}")
-
-    # Run comprehensive QC check
-    log_info("Running comprehensive_qc_check.py...")
-    try:
-        result = subprocess.run(
-            [sys.executable, 'scripts/comprehensive_qc_check.py'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            # Parse the output to get specific errors
-            if 'CALCULATIONS' in result.stdout and 'FAIL' in result.stdout:
-                warnings.append("Calculation verification found inconsistencies (may need recalculation)")
-        else:
-            log_success("Comprehensive QC check passed")
-    except subprocess.TimeoutExpired:
-        warnings.append("Comprehensive QC check timed out")
-    except Exception as e:
-        warnings.append(f"Could not run comprehensive QC check: {str(e)}")
+    ctx = ctx or QCContext()
+    ctx.verdicts.update(verdicts or {})
+
+    for name, check in DATA_INTEGRITY_CHECKS.items():
+        if name in ctx.verdicts:
+            log_info(f"Using the {name}.py result from this run")
+            continue
+        log_info(f"Running {name}.py...")
+        try:
+            with redirect_stdout(io.StringIO()):
+                ctx.run_check(name, check)
+        except Exception:
+            pass  # Recorded as the verdict
+
+    # QC validator
+    verdict = ctx.verdicts['qc_validator']
+    if isinstance(verdict, str):
+        # In-process, a crash no longer shows up as a failed exit code
+        errors.append(f"QC validator crashed: {verdict}")
+    elif verdict != 0:
+        errors.append("QC validator failed - see output above")
+    else:
+        log_success("QC validator passed")
+
+    # Comprehensive QC check
+    verdict = ctx.verdicts['comprehensive_qc_check']
+    if isinstance(verdict, str):
+        errors.append(f"Comprehensive QC check crashed: {verdict}")
+    elif verdict != 0:
+        # Any failed check prints FAIL under its CALCULATIONS header
+        warnings.append("Calculation verification found inconsistencies (may need recalculation)")
+    else:
+        log_success("Comprehensive QC check passed")
 
     return errors, warnings
 
@@ -500,6 +780,85 @@ def check_recent_updates() -> Tuple[List[str], List[str]]:
 
     return errors, warnings
 
+def measure_performance() -> Dict:
+    """Run the performance gate's benchmark cases (timings and peak memory)"""
+    from run_benchmarks import run_benchmarks
+
+    with redirect_stdout(io.StringIO()):
+        return run_benchmarks(sizes=[PERF_CORPUS_SIZE], cases=PERF_CASES, repeat=PERF_REPEAT, memory=True)
+
+def _compare_to_baseline(label: str, measured: float, baseline: float, tolerance: Tuple[float, float],
+                         unit: str, scale: float, errors: List[str], warnings: List[str], precision: int = 1):
+    """File one measurement as passed, warning or error by its ratio to the baseline"""
+    ratio = measured / baseline if baseline else float('inf')
+    message = (f"{label}: {measured * scale:.{precision}f} {unit} vs baseline "
+               f"{baseline * scale:.{precision}f} {unit} ({ratio:.2f}x)")
+    if ratio > tolerance[1]:
+        errors.append(message)
+        log_error(message)
+    elif ratio > tolerance[0]:
+        warnings.append(message)
+        log_warning(message)
+    else:
+        log_success(message)
+
+def check_performance(baseline_path: str = PERF_BASELINE_FILE) -> Tuple[List[str], List[str]]:
+    """
+    Compare benchmark timings and peak memory against the committed baseline.
+
+    Timings are compared as multiples of the calibration loop timed between
+    the cases, which cancels out the speed of the machine running the audit.
+    A case slower or larger than the baseline by more than the warn ratio of
+    PERF_TIME_TOLERANCE / PERF_MEMORY_TOLERANCE is a warning; beyond the fail
+    ratio it is an error, and errors in this category fail the audit.
+    """
+    log_section("PERFORMANCE REGRESSION CHECK")
+
+    errors = []
+    warnings = []
+
+    if not os.path.exists(baseline_path):
+        warnings.append(f"No performance baseline at {baseline_path} (create it with --update-perf-baseline)")
+        log_warning(warnings[-1])
+        return errors, warnings
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['case'], r['size']): r for r in json.load(f).get('results', [])}
+
+    log_info(f"Timing {', '.join(PERF_CASES)} on {PERF_CORPUS_SIZE} synthetic records...")
+    for result in measure_performance()['results']:
+        name = result['case']
+        base = baseline.get((name, result['size']))
+        if base is None:
+            warnings.append(f"{name}: no baseline for {result['size']} records")
+            log_warning(warnings[-1])
+            continue
+
+        if 'relative' in base:
+            _compare_to_baseline(f"{name} time", result['relative'], base['relative'], PERF_TIME_TOLERANCE,
+                                 'calibration loops', 1, errors, warnings, precision=2)
+        else:
+            warnings.append(f"{name}: baseline has no calibrated timing (update it with --update-perf-baseline)")
+            log_warning(warnings[-1])
+        if 'peak_bytes' in base:
+            _compare_to_baseline(f"{name} peak memory", result['peak_bytes'], base['peak_bytes'],
+                                 PERF_MEMORY_TOLERANCE, 'MB', 1e-6, errors, warnings)
+
+    return errors, warnings
+
+def update_performance_baseline(baseline_path: str = PERF_BASELINE_FILE) -> str:
+    """Measure the performance gate's cases and save them as the new baseline"""
+    from run_benchmarks import write_results
+
+    log_section("UPDATING PERFORMANCE BASELINE")
+    path = write_results(measure_performance(), baseline_path)
+    log_success(f"Performance baseline saved to {path}")
+    return path
+
+def _blocked(all_results: Dict) -> List[str]:
+    """Blocking categories that reported errors"""
+    return [c for c in BLOCKING_CATEGORIES if all_results.get(c, {}).get('errors')]
+
 def generate_qc_report(all_results: Dict) -> str:
     """Generate comprehensive QC report"""
     log_section("GENERATING QC REPORT")
@@ -519,7 +878,7 @@ def generate_qc_report(all_results: Dict) -> str:
     if report['summary']['total_errors'] == 0:
         report['summary']['status'] = 'PASS'
         report['summary']['recommendation'] = 'All checks passed. System is ready for production.'
-    elif report['summary']['total_errors'] <= 3:
+    elif report['summary']['total_errors'] <= 3 and not _blocked(all_results):
         report['summary']['status'] = 'PASS_WITH_WARNINGS'
         report['summary']['recommendation'] = 'Minor issues detected. Review and address warnings.'
     else:
@@ -549,8 +908,7 @@ def print_summary(all_results: Dict, report_path: str):
     log_info(f"Total Errors: {total_errors}")
     log_info(f"Total Warnings: {total_warnings}")
     log_info(f"Detailed Report: {report_path}")
-
-    print()
+    log_info("")
 
     # Summary by category
     for category, results in all_results.items():
@@ -565,96 +923,171 @@ def print_summary(all_results: Dict, report_path: str):
         else:
             log_error(f"{category}: ✗ {errors} errors, {warnings} warnings ({files} files)")
 
-    print()
-    print("=" * 80)
+    log_info("")
+    log_info("=" * 80)
 
     if total_errors == 0:
         log_success("✅ QC AUDIT PASSED - All checks successful!")
-        print(f"{COLOR_GREEN}Recommendation: System is ready for production{COLOR_RESET}")
+        log_success("Recommendation: System is ready for production")
         return 0
-    elif total_errors <= 3:
+    elif total_errors <= 3 and not _blocked(all_results):
         log_warning("⚠️ QC AUDIT PASSED WITH WARNINGS")
-        print(f"{COLOR_ORANGE}Recommendation: Review and address warnings{COLOR_RESET}")
+        log_warning("Recommendation: Review and address warnings")
         return 0
     else:
         log_error("❌ QC AUDIT FAILED - Critical issues detected")
-        print(f"{COLOR_RED}Recommendation: Address errors before deployment{COLOR_RESET}")
+        log_error("Recommendation: Address errors before deployment")
         return 1
 
-def main():
-    """Run full QC audit"""
-    print(f"{COLOR_CYAN}")
-    print("=" * 80)
-    print("NUVIEW STRATEGIC PIPELINE - FULL QC AUDIT")
-    print("=" * 80)
-    print(f"Timestamp: {datetime.now().isoformat()}")
-    print(f"{COLOR_RESET}")
-
+# Audit stages in report order: (report category, check, takes manifest and cache)
+AUDIT_STAGES = [
+    ('HTML Files', validate_html_files, True),
+    ('Python Files', validate_python_files, True),
+    ('Shell Scripts', validate_shell_scripts, True),
+    ('JSON Files', validate_json_files, True),
+    ('CSV Files', validate_csv_files, True),
+    ('Documentation', validate_documentation, True),
+    ('Data Integrity', check_data_integrity, False),
+    ('Recent Updates', check_recent_updates, False),
+]
+
+# Data integrity checks rewrite data/processed outputs, so they start only
+# once the stages that audit those files have read them
+STAGE_DEPENDENCIES = {
+    'Data Integrity': ('JSON Files', 'CSV Files'),
+}
+
+def _run_check(category, check, manifest, cache, **kwargs):
+    """Run one audit stage inside a tracing span"""
+    with span(f"full_qc_audit.{check.__name__}", category=category) as stage_span:
+        result = check(manifest, cache) if cache is not None else check(**kwargs)
+        stage_span.set(files=result[2] if len(result) > 2 else 0)
+    return result
+
+def run_stage(category, check, manifest=None, cache=None, **kwargs):
+    """
+    Run one audit stage with its console output captured.
+
+    Runs in a worker process; the cache copy and the spans traced here are
+    returned so the parent can merge them.
+
+    Returns:
+        tuple: (check result, captured output, cache, spans)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), collect():
+        result = _run_check(category, check, manifest, cache, **kwargs)
+    # JSON log lines bypass stdout; write them before the worker is reused or exits
+    pipeline_log.flush()
+    return result, output.getvalue(), cache, take_spans(pid=os.getpid())
+
+def run_stages(manifest: Dict, cache: AuditCache, jobs: int, verdicts: Dict = None) -> Dict:
+    """
+    Run every audit stage, in parallel worker processes when jobs > 1.
+
+    Stage output is printed in report order once each stage finishes.
+
+    Args:
+        verdicts (dict): QC check verdicts already known, for the data integrity stage
+
+    Returns:
+        dict: Results by report category
+    """
     all_results = {}
+    stage_kwargs = {'Data Integrity': {'verdicts': verdicts}} if verdicts else {}
+
+    def record(category, result):
+        errors, warnings = result[0], result[1]
+        all_results[category] = {
+            'errors': errors,
+            'warnings': warnings,
+            'files_checked': result[2] if len(result) > 2 else 0
+        }
 
-    # HTML validation
-    html_errors, html_warnings, html_files = validate_html_files()
-    all_results['HTML Files'] = {
-        'errors': html_errors,
-        'warnings': html_warnings,
-        'files_checked': html_files
-    }
-
-    # Python validation
-    py_errors, py_warnings, py_files = validate_python_files()
-    all_results['Python Files'] = {
-        'errors': py_errors,
-        'warnings': py_warnings,
-        'files_checked': py_files
-    }
-
-    # Shell script validation
-    sh_errors, sh_warnings, sh_files = validate_shell_scripts()
-    all_results['Shell Scripts'] = {
-        'errors': sh_errors,
-        'warnings': sh_warnings,
-        'files_checked': sh_files
-    }
+    if jobs <= 1:
+        for category, check, uses_files in AUDIT_STAGES:
+            record(category, _run_check(category, check, manifest, cache if uses_files else None,
+                                        **stage_kwargs.get(category, {})))
+        return all_results
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for category, check, uses_files in AUDIT_STAGES:
+            if category not in STAGE_DEPENDENCIES:
+                args = (category, check, manifest, cache) if uses_files else (category, check)
+                futures[category] = pool.submit(run_stage, *args, **stage_kwargs.get(category, {}))
+
+        for category, check, uses_files in AUDIT_STAGES:
+            if category in STAGE_DEPENDENCIES:
+                wait([futures[name] for name in STAGE_DEPENDENCIES[category]])
+                args = (category, check, manifest, cache) if uses_files else (category, check)
+                futures[category] = pool.submit(run_stage, *args, **stage_kwargs.get(category, {}))
+
+        for category, _check, _uses_files in AUDIT_STAGES:
+            result, output, stage_cache, spans = futures[category].result()
+            print(output, end='')
+            if stage_cache is not None:
+                cache.merge(stage_cache)
+            add_spans(spans)
+            record(category, result)
+
+    return all_results
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Full QC audit of the NUVIEW Strategic Pipeline')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Re-check every file, ignoring and not updating {AUDIT_CACHE_FILE}')
+    parser.add_argument('--jobs', type=int, default=min(len(AUDIT_STAGES), os.cpu_count() or 1),
+                        help='Worker processes for the audit stages (1 runs them in sequence)')
+    parser.add_argument('--perf', action='store_true',
+                        help=f'Also check benchmark timings and peak memory against {PERF_BASELINE_FILE}')
+    parser.add_argument('--update-perf-baseline', action='store_true',
+                        help=f'Measure the performance cases, write {PERF_BASELINE_FILE} and exit')
+    profiling.add_profile_argument(parser)
+    return parser.parse_args(argv)
+
+@traced('full_qc_audit', run=True)
+@profiled('full_qc_audit')
+def main(argv=None, ctx=None):
+    """
+    Run full QC audit
+
+    Args:
+        argv (list): Command line arguments (defaults to sys.argv)
+        ctx (QCContext): Shared data of a pipeline run; the verdicts of the QC
+                         checks already run on it are reused, not re-run
+    """
+    args = parse_args(argv)
+    if args.profile:
+        # Stages in worker processes are not profiled; use --jobs 1 to see them
+        profiling.start('full_qc_audit', args.profile)
+
+    if args.update_perf_baseline:
+        update_performance_baseline()
+        return 0
 
-    # JSON validation
-    json_errors, json_warnings, json_files = validate_json_files()
-    all_results['JSON Files'] = {
-        'errors': json_errors,
-        'warnings': json_warnings,
-        'files_checked': json_files
-    }
+    log_info("=" * 80)
+    log_info("NUVIEW STRATEGIC PIPELINE - FULL QC AUDIT")
+    log_info("=" * 80)
+    log_info(f"Timestamp: {datetime.now().isoformat()}")
+    log_info("")
 
-    # CSV validation
-    csv_errors, csv_warnings, csv_files = validate_csv_files()
-    all_results['CSV Files'] = {
-        'errors': csv_errors,
-        'warnings': csv_warnings,
-        'files_checked': csv_files
-    }
+    # One directory scan feeds every file check
+    manifest = build_manifest('.', excluded_dirs=[os.path.dirname(AUDIT_CACHE_FILE)])
+    cache = AuditCache(AUDIT_CACHE_FILE, rules=rules_version(*AUDIT_RULE_FILES), enabled=not args.no_cache)
 
-    # Documentation validation
-    doc_errors, doc_warnings, doc_files = validate_documentation()
-    all_results['Documentation'] = {
-        'errors': doc_errors,
-        'warnings': doc_warnings,
-        'files_checked': doc_files
-    }
+    # Only the verdicts cross into the worker process, not the datasets
+    all_results = run_stages(manifest, cache, args.jobs, verdicts=dict(ctx.verdicts) if ctx else None)
 
-    # Data integrity checks
-    data_errors, data_warnings = check_data_integrity()
-    all_results['Data Integrity'] = {
-        'errors': data_errors,
-        'warnings': data_warnings,
-        'files_checked': 0
-    }
+    # Timed on its own, after the other stages, so they do not skew it
+    if args.perf:
+        errors, warnings = _run_check('Performance', check_performance, None, None)
+        all_results['Performance'] = {'errors': errors, 'warnings': warnings, 'files_checked': 0}
 
-    # Recent updates check
-    update_errors, update_warnings = check_recent_updates()
-    all_results['Recent Updates'] = {
-        'errors': update_errors,
-        'warnings': update_warnings,
-        'files_checked': 0
-    }
+    cache.save()
+    if cache.enabled:
+        log_info(f"Audit cache: {cache.reused} verdicts reused, {cache.checked} files checked")
 
     # Generate report
     report_path = generate_qc_report(all_results)
@@ -5,18 +5,25 @@ This enables fully automated dashboard updates without manual code intervention
 Also generates priority_matrix.csv with priority scoring
 """
 
+import argparse
 import json
 import os
 import sys
 from datetime import datetime, timezone
 
-import pandas as pd
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
 
-# Color codes for console output
-COLOR_GREEN = '\033[92m'
-COLOR_BLUE = '\033[94m'
-COLOR_RED = '\033[91m'
-COLOR_RESET = '\033[0m'
+import memory_profile
+import profiling
+from columnar_io import PRIORITY_MATRIX_DTYPES, write_matrix
+from memory_profile import checkpoint, memory_profiled
+from opportunity_stream import iter_opportunities
+from pipeline_log import SUCCESS, get_logger
+from profiling import profiled
+from tracing import annotate, traced
+
+log = get_logger('generate_programs')
 
 # Keyword sets for categorization
 SPACE_KEYWORDS = {'space', 'satellite', 'orbital'}
@@ -45,13 +52,13 @@ CATEGORY_SCORES = {
 SOURCE_VERIFIED_SCORE = 10
 
 def log_info(msg):
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg):
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
 
 def log_error(msg):
-    print(f"{COLOR_RED}❌ {msg}{COLOR_RESET}")
+    log.error(msg)
 
 def contains_keywords(text, keywords):
     """Check if text contains any of the specified keywords"""
@@ -198,10 +205,24 @@ def convert_opportunity_to_program(opp):
 
     return program
 
-def generate_programs_json():
+@traced('generate_programs', run=True)
+@memory_profiled('generate_programs')
+@profiled('generate_programs')
+def generate_programs_json(profile_memory=False, profile=None, ctx=None):
     """
     Main function to generate programs.json from opportunities.json
+
+    Args:
+        profile_memory (bool): Write a tracemalloc report of each stage (see memory_profile.py)
+        profile (str): Profiling mode ('cpu') for a .pstats and collapsed-stack profile (see profiling.py)
+        ctx (QCContext): Shared datasets when run in-process by the pipeline runner
     """
+    import pandas as pd
+    if profile_memory:
+        memory_profile.start('generate_programs')
+    if profile:
+        profiling.start('generate_programs', profile)
+
     log_info("Starting programs.json generation from opportunities.json")
     log_info("=" * 70)
 
@@ -211,17 +232,8 @@ def generate_programs_json():
         log_error(f"Input file not found: {opportunities_file}")
         return False
 
-    try:
-        with open(opportunities_file, 'r', encoding='utf-8') as f:
-            opps_data = json.load(f)
-    except json.JSONDecodeError as e:
-        log_error(f"Invalid JSON in {opportunities_file}: {e}")
-        return False
-
-    opportunities = opps_data.get('opportunities', [])
-    log_info(f"Loaded {len(opportunities)} opportunities from {opportunities_file}")
-
-    # Categorize opportunities into program types
+    # Categorize opportunities into program types, streaming the input so
+    # only the (smaller) program records are held in memory
     categorized = {
         'funding': [],
         'lidar': [],
@@ -229,10 +241,20 @@ def generate_programs_json():
         'platform': []
     }
 
-    for opp in opportunities:
-        bucket = categorize_opportunity(opp)
-        program = convert_opportunity_to_program(opp)
-        categorized[bucket].append(program)
+    loaded = 0
+    try:
+        records = ctx.opportunities if ctx is not None else iter_opportunities(opportunities_file)
+        for opp in records:
+            bucket = categorize_opportunity(opp)
+            program = convert_opportunity_to_program(opp)
+            categorized[bucket].append(program)
+            loaded += 1
+    except json.JSONDecodeError as e:
+        log_error(f"Invalid JSON in {opportunities_file}: {e}")
+        return False
+
+    log_info(f"Loaded {loaded} opportunities from {opportunities_file}")
+    checkpoint('categorize')
 
     # Sort each category by value (descending)
     for category in categorized:
@@ -270,15 +292,19 @@ def generate_programs_json():
             'nextAction': program['nextAction']
         })
 
-    # Save priority matrix as CSV
+    # Save priority matrix as CSV (plus Parquet/Arrow copies when available)
     priority_matrix_path = os.path.join(output_dir, 'priority_matrix.csv')
     try:
         df = pd.DataFrame(priority_matrix)
-        df.to_csv(priority_matrix_path, index=False)
+        columnar = write_matrix(df, priority_matrix_path, PRIORITY_MATRIX_DTYPES)
         log_success(f"Successfully generated {priority_matrix_path}")
+        for path in columnar:
+            log_info(f"Columnar copy written to {path}")
     except Exception as e:
         log_error(f"Failed to write {priority_matrix_path}: {e}")
 
+    checkpoint('priority_matrix')
+
     # Count programs
     total_programs = sum(len(programs) for programs in categorized.values())
 
@@ -309,6 +335,7 @@ def generate_programs_json():
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(programs_data, f, indent=2, ensure_ascii=False)
         log_success(f"Successfully generated {output_file}")
+        annotate(records=loaded, programs=total_programs, bytes=os.path.getsize(output_file))
         log_info("")
         log_info("=" * 70)
         log_success("programs.json generation complete!")
@@ -319,5 +346,10 @@ def generate_programs_json():
         return False
 
 if __name__ == "__main__":
-    success = generate_programs_json()
+    parser = argparse.ArgumentParser(description='Generate programs.json from opportunities.json')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Write per-stage tracemalloc snapshots and peak RSS to data/metrics')
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args()
+    success = generate_programs_json(profile_memory=args.profile_memory, profile=args.profile)
     sys.exit(0 if success else 1)
@@ -25,33 +25,46 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+import profiling
+from metrics import MetricsRegistry, write_textfile
+from pipeline_log import SUCCESS, get_logger
+from profiling import profiled
+
 # Configuration
 SIGNAL_FILE = "data/signals/scrape_trigger.json"
 CHECK_INTERVAL = 60  # seconds between checks in watch mode
 REPO_ROOT = Path(__file__).parent.parent.absolute()
 
-# ANSI color codes
-COLOR_GREEN = '\033[92m'
-COLOR_BLUE = '\033[94m'
-COLOR_YELLOW = '\033[93m'
-COLOR_RED = '\033[91m'
-COLOR_RESET = '\033[0m'
+# Monitor metrics, written to <metrics dir>/local_monitor.prom after every check
+MONITOR_METRICS = MetricsRegistry()
+CHECKS = MONITOR_METRICS.counter('nuview_monitor_checks_total', 'Trigger checks performed')
+TRIGGERS = MONITOR_METRICS.counter('nuview_monitor_triggers_total', 'Triggers processed by result', ['result'])
+SCRAPES = MONITOR_METRICS.counter('nuview_monitor_scrapes_total', 'Local scrapes run by result', ['result'])
+SCRAPE_DURATION = MONITOR_METRICS.gauge('nuview_monitor_last_scrape_duration_seconds',
+                                        'Wall time of the last local scrape')
+GIT_FAILURES = MONITOR_METRICS.counter('nuview_monitor_git_failures_total', 'Failed git operations', ['operation'])
+LAST_CHECK = MONITOR_METRICS.gauge('nuview_monitor_last_check_timestamp_seconds', 'Unix time of the last check')
+
+log = get_logger('local_monitor')
 
 def log_info(msg):
     """Log info message"""
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg):
     """Log success message"""
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
 
 def log_warning(msg):
     """Log warning message"""
-    print(f"{COLOR_YELLOW}⚠️  {msg}{COLOR_RESET}")
+    log.warning(msg)
 
 def log_error(msg):
     """Log error message"""
-    print(f"{COLOR_RED}❌ {msg}{COLOR_RESET}")
+    log.error(msg)
 
 def run_command(cmd, cwd=None):
     """Run a shell command and return output"""
@@ -68,12 +81,20 @@ def run_command(cmd, cwd=None):
     except subprocess.CalledProcessError as e:
         return None, e.stderr.strip()
 
+def write_metrics():
+    """Write the monitor metrics for the node exporter textfile collector"""
+    try:
+        write_textfile(MONITOR_METRICS, 'local_monitor')
+    except OSError as e:
+        log_warning(f"Could not write monitor metrics: {e}")
+
 def git_pull():
     """Pull latest changes from remote"""
     log_info("Pulling latest changes from remote...")
     stdout, stderr = run_command("git pull origin main")
     if stderr:
         log_error(f"Git pull failed: {stderr}")
+        GIT_FAILURES.inc(operation='pull')
         return False
     log_success("Repository updated")
     return True
@@ -81,6 +102,8 @@ def git_pull():
 def check_for_trigger():
     """Check if there's a pending scrape trigger"""
     signal_path = REPO_ROOT / SIGNAL_FILE
+    CHECKS.inc()
+    LAST_CHECK.set(time.time())
 
     if not signal_path.exists():
         return None
@@ -112,13 +135,18 @@ def execute_scrape():
         return False
 
     log_info(f"Running: python {scrape_script}")
+    started = time.monotonic()
     stdout, stderr = run_command(f"python3 {scrape_script}")
+    SCRAPE_DURATION.set(time.monotonic() - started)
 
     # Check if scrape failed (stderr will be set by CalledProcessError)
     if stderr is not None:
         log_error(f"Scrape failed: {stderr}")
+        SCRAPES.inc(result='failed')
         return False
 
+    SCRAPES.inc(result='success')
+
     if stdout:
         print(stdout)
 
@@ -173,6 +201,7 @@ def git_commit_and_push(message):
     if stderr and "nothing to commit" not in stderr:
         if stderr:
             log_error(f"Git commit failed: {stderr}")
+            GIT_FAILURES.inc(operation='commit')
             return False
 
     # Get current branch
@@ -188,6 +217,7 @@ def git_commit_and_push(message):
     stdout, stderr = run_command(f"git push origin {current_branch}")
     if stderr is not None:
         log_error(f"Git push failed: {stderr}")
+        GIT_FAILURES.inc(operation='push')
         return False
 
     log_success("Changes pushed to remote repository")
@@ -217,13 +247,16 @@ def process_trigger(trigger_data):
             log_success("=" * 60)
             log_success("🎉 SCRAPE PROCESS COMPLETED SUCCESSFULLY")
             log_success("=" * 60)
+            TRIGGERS.inc(result='success')
             return True
         else:
             log_error("Failed to push changes to remote")
             update_signal_status('failed', 'Failed to push changes')
+            TRIGGERS.inc(result='failed')
             return False
     else:
         log_error("Scraping process failed")
+        TRIGGERS.inc(result='failed')
         update_signal_status('failed', 'Scraping process encountered errors')
 
         # Still try to push the failed status
@@ -244,6 +277,7 @@ def watch_mode():
             # Pull latest changes
             if not git_pull():
                 log_warning("Failed to pull changes, will retry next cycle")
+                write_metrics()
                 time.sleep(CHECK_INTERVAL)
                 continue
 
@@ -255,6 +289,7 @@ def watch_mode():
             else:
                 log_info(f"No pending triggers found. Checking again in {CHECK_INTERVAL}s...")
 
+            write_metrics()
             time.sleep(CHECK_INTERVAL)
 
     except KeyboardInterrupt:
@@ -303,6 +338,7 @@ def force_scrape_mode():
         log_error("Scraping failed")
         sys.exit(1)
 
+@profiled('local_monitor')
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -331,20 +367,28 @@ Examples:
         action='store_true',
         help='Force scrape without checking for trigger'
     )
+    profiling.add_profile_argument(parser)
 
     args = parser.parse_args()
 
     # Change to repo root
     os.chdir(REPO_ROOT)
 
-    # Determine mode
-    if args.check_once:
-        check_once_mode()
-    elif args.scrape:
-        force_scrape_mode()
-    else:
-        # Default to watch mode
-        watch_mode()
+    # Written to data/metrics/profiles when the monitor exits
+    if args.profile:
+        profiling.start('local_monitor', args.profile)
+
+    # Determine mode (metrics are written however the mode exits)
+    try:
+        if args.check_once:
+            check_once_mode()
+        elif args.scrape:
+            force_scrape_mode()
+        else:
+            # Default to watch mode
+            watch_mode()
+    finally:
+        write_metrics()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Memory Profiling
+tracemalloc snapshots at stage boundaries, with per-stage allocation diffs
+
+Entry points are decorated with @memory_profiled(name) and call checkpoint()
+between their stages. Profiling is off unless the entry point is run with
+--profile-memory (which calls start()) or NUVIEW_PROFILE_MEMORY=1 is set;
+while off, checkpoint() returns immediately.
+
+At each checkpoint a snapshot is taken and compared with the previous one.
+The report records, per stage:
+- traced Python heap at the end of the stage, and its peak during the stage;
+- the process's peak RSS so far;
+- the top allocation sites by growth since the previous checkpoint.
+
+When the entry point returns, the report is printed and written to
+data/metrics/memory-<run>.json. Entry points called from a profiled entry
+point (qc_validator inside full_qc_audit) add their checkpoints to the outer
+report.
+
+Usage:
+    python scripts/qc_validator.py --profile-memory
+    NUVIEW_PROFILE_MEMORY=1 python scripts/run_all.py
+    python scripts/memory_profile.py summary data/metrics/memory-<run>.json
+"""
+
+import argparse
+import functools
+import json
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+MEMORY_REPORT_DIR = 'data/metrics'
+MEMORY_PROFILE_ENV = 'NUVIEW_PROFILE_MEMORY'
+MEMORY_REPORT_VERSION = 1
+
+# Allocation sites listed per stage
+TOP_ALLOCATIONS = 10
+
+# Stack depth recorded per allocation (1 groups by source line)
+TRACEMALLOC_FRAMES = 1
+
+# Allocations made by the profiler (including the source lines it reads for
+# the report) and the import machinery are not reported
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+_active = None
+
+def profiling_requested():
+    """True when NUVIEW_PROFILE_MEMORY is set to 1/true/on"""
+    return os.environ.get(MEMORY_PROFILE_ENV, '').lower() in ('1', 'true', 'on', 'yes')
+
+def peak_rss_bytes():
+    """Peak resident set size of this process so far (None where unavailable)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class _MemoryProfile:
+    """Checkpoints of one profiled run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.time()
+        self.stages = []
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        self._snapshot = self._take_snapshot()
+
+    @staticmethod
+    def _take_snapshot():
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    def checkpoint(self, label):
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        snapshot = self._take_snapshot()
+
+        top = []
+        for stat in snapshot.compare_to(self._snapshot, 'lineno')[:TOP_ALLOCATIONS]:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            top.append({
+                'location': f"{frame.filename}:{frame.lineno}",
+                'code': linecache.getline(frame.filename, frame.lineno).strip(),
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+                'size': stat.size,
+            })
+
+        self._snapshot = snapshot
+        self.stages.append({
+            'stage': label,
+            'elapsed': time.time() - self.started,
+            'traced_bytes': current,
+            'traced_peak_bytes': peak,
+            'rss_peak_bytes': peak_rss_bytes(),
+            'top_allocations': top,
+        })
+
+    def finish(self):
+        self._snapshot = None
+        if self._started_tracing:
+            tracemalloc.stop()
+        return {
+            'version': MEMORY_REPORT_VERSION,
+            'run': self.name,
+            'started': datetime.fromtimestamp(self.started, timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'stages': self.stages,
+        }
+
+def start(name):
+    """
+    Start profiling a run (no-op if one is already being profiled).
+
+    Args:
+        name (str): Run name used in the report file name
+
+    Returns:
+        bool: True if this call started the profile
+    """
+    global _active
+    if _active is not None:
+        return False
+    _active = _MemoryProfile(name)
+    return True
+
+def checkpoint(label):
+    """Record the end of a stage (no-op unless profiling)"""
+    if _active is not None:
+        _active.checkpoint(label)
+
+def stop(report_dir=None):
+    """
+    Finish the active profile, print it and write the report.
+
+    Returns:
+        str: Path of the report, or None if nothing was profiled
+    """
+    global _active
+    if _active is None:
+        return None
+
+    _active.checkpoint('end')
+    report = _active.finish()
+    _active = None
+
+    print_report(report)
+    report_dir = report_dir or MEMORY_REPORT_DIR
+    started = report['started'].replace('-', '').replace(':', '')[:15]
+    path = os.path.join(report_dir, f"memory-{report['run']}-{started}Z-{os.getpid()}.json")
+    try:
+        os.makedirs(report_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    except OSError:
+        return None
+    print(f"Memory profile written to {path}")
+    return path
+
+def memory_profiled(name):
+    """
+    Decorate an entry point: profile it when requested, and write the report when it returns.
+
+    Profiling starts here if NUVIEW_PROFILE_MEMORY is set, or inside the call
+    when the entry point calls start() for its --profile-memory flag.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            outer = _active is not None
+            if not outer and profiling_requested():
+                start(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if not outer:
+                    stop()
+        return wrapper
+    return decorator
+
+def _mb(value):
+    return '-' if value is None else f"{value / 1e6:.1f}"
+
+def print_report(report):
+    """Print stage memory use and the largest allocation sites per stage"""
+    print(f"Memory profile: {report['run']}")
+    print(f"{'stage':<36} {'heap MB':>9} {'peak MB':>9} {'RSS peak MB':>12}")
+    for stage in report['stages']:
+        print(f"{stage['stage']:<36} {_mb(stage['traced_bytes']):>9} "
+              f"{_mb(stage['traced_peak_bytes']):>9} {_mb(stage['rss_peak_bytes']):>12}")
+    for stage in report['stages']:
+        if stage['top_allocations']:
+            print(f"\n{stage['stage']}: top allocations")
+            for alloc in stage['top_allocations'][:5]:
+                print(f"  +{alloc['size_diff'] / 1e6:8.2f} MB  {alloc['location']}  {alloc['code'][:60]}")
+
+def main(argv=None):
+    """Print a memory report"""
+    parser = argparse.ArgumentParser(description='Inspect memory profiles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summary_parser = subparsers.add_parser('summary', help='Print memory per stage')
+    summary_parser.add_argument('report', help='Path to a memory-<run>.json file')
+    args = parser.parse_args(argv)
+
+    with open(args.report, 'r', encoding='utf-8') as f:
+        print_report(json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
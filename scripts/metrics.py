@@ -0,0 +1,213 @@
+"""
+NUVIEW Strategic Pipeline - Prometheus Metrics
+Counters, gauges and histograms exported as Prometheus textfile-collector files
+
+Each process keeps its metrics in a MetricsRegistry and writes them with
+write_textfile() to <metrics dir>/<name>.prom. The file is replaced
+atomically, so a node exporter started with
+--collector.textfile.directory=<metrics dir> never reads a partial file.
+The directory is data/metrics unless NUVIEW_METRICS_DIR is set.
+
+The scraper fleet metrics (latency, records and bytes emitted, errors) live
+in SCRAPER_METRICS and are written by scrape_all.run_pipeline to
+scraper_fleet.prom. The sweep's scrapers build their records without HTTP
+requests, so there are no fetch-level series (status codes, cache hits,
+retries) to export.
+
+Usage:
+    from metrics import SCRAPER_RECORDS, SCRAPER_METRICS, write_textfile
+
+    SCRAPER_RECORDS.inc(len(opportunities), scraper=scraper.name)
+    write_textfile(SCRAPER_METRICS, 'scraper_fleet')
+"""
+
+import math
+import os
+import threading
+
+METRICS_DIR = 'data/metrics'
+METRICS_DIR_ENV = 'NUVIEW_METRICS_DIR'
+
+# Scraper latency buckets, in seconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+def metrics_dir():
+    """Directory the .prom files are written to"""
+    return os.environ.get(METRICS_DIR_ENV) or METRICS_DIR
+
+def _format_value(value):
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    pairs.extend(f'{n}="{_escape(v)}"' for n, v in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class _Metric:
+    """Shared label handling; samples are keyed by the tuple of label values"""
+
+    metric_type = None
+
+    def __init__(self, name, documentation, labelnames=(), lock=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = lock or threading.Lock()
+        self._samples = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels):
+        """Current value of one labelled sample (0 if never set)"""
+        with self._lock:
+            return self._samples.get(self._key(labels), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            for key in sorted(self._samples):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(self._samples[key])}")
+        return lines
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    metric_type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    metric_type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS, lock=None):
+        super().__init__(name, documentation, labelnames, lock)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._samples.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._samples[key] = (counts, total + value)
+
+    def value(self, **labels):
+        """(bucket counts, sum) of one labelled sample"""
+        with self._lock:
+            return self._samples.get(self._key(labels), ([0] * len(self.buckets), 0.0))
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            for key in sorted(self._samples):
+                counts, total = self._samples[key]
+                for bound, count in zip(self.buckets, counts):
+                    labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {counts[-1]}")
+        return lines
+
+class MetricsRegistry:
+    """A named set of metrics rendered together into one textfile"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames, self._lock))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames, self._lock))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets, self._lock))
+
+    def render(self):
+        """Render every metric in Prometheus text exposition format"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return '\n'.join(lines) + '\n'
+
+def write_textfile(registry, name, directory=None):
+    """
+    Atomically write a registry to <directory>/<name>.prom.
+
+    Args:
+        registry (MetricsRegistry): Metrics to write
+        name (str): File name without the .prom suffix
+        directory (str): Target directory (defaults to metrics_dir())
+
+    Returns:
+        str: Path of the written file
+    """
+    directory = directory or metrics_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.prom")
+
+    # The collector only reads *.prom, so the temporary name is never picked up
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(registry.render())
+    os.replace(tmp_path, path)
+    return path
+
+# Scraper fleet metrics, written by scrape_all.run_pipeline
+SCRAPER_METRICS = MetricsRegistry()
+
+SCRAPER_DURATION = SCRAPER_METRICS.histogram(
+    'nuview_scraper_duration_seconds', 'Wall time of one scraper run', ['scraper'])
+SCRAPER_RECORDS = SCRAPER_METRICS.counter(
+    'nuview_scraper_records_total', 'Opportunities emitted by a scraper', ['scraper'])
+SCRAPER_ERRORS = SCRAPER_METRICS.counter(
+    'nuview_scraper_errors_total', 'Scraper runs that raised an error', ['scraper'])
+SCRAPER_BYTES = SCRAPER_METRICS.counter(
+    'nuview_scraper_bytes_total', 'Bytes of JSON records emitted by a scraper', ['scraper'])
+SWEEP_DURATION = SCRAPER_METRICS.gauge(
+    'nuview_sweep_duration_seconds', 'Wall time of the last full sweep')
+SWEEP_OPPORTUNITIES = SCRAPER_METRICS.gauge(
+    'nuview_sweep_opportunities', 'Opportunities written by the last sweep')
+SWEEP_LAST_SUCCESS = SCRAPER_METRICS.gauge(
+    'nuview_sweep_last_success_timestamp_seconds', 'Unix time the last sweep finished')
@@ -0,0 +1,283 @@
+"""
+NUVIEW Strategic Pipeline - Streaming Opportunities Reader
+Reads opportunities.json one record at a time with bounded memory
+
+The top-level object is scanned incrementally: the 'opportunities' array is
+decoded item by item from a sliding text buffer, and every other field is
+either decoded whole or, when the caller does not ask for it, skipped without
+being held. Each value's end is found in one pass that tracks bracket depth
+and string state, and the value is then decoded once, so a large field (such
+as a history kept in the same document) costs linear time. Memory use is one
+read chunk plus the current record, regardless of how many records the file
+holds.
+
+Usage:
+    from opportunity_stream import iter_opportunities, read_meta
+
+    meta = read_meta('data/opportunities.json')
+    for opp in iter_opportunities('data/opportunities.json'):
+        ...
+"""
+
+import json
+import re
+
+STREAM_KEY = 'opportunities'
+CHUNK_SIZE = 64 * 1024
+
+# Longest single record buffered before giving up; a truncated or corrupt
+# array fails here instead of buffering the rest of the file
+MAX_RECORD_SIZE = 8 * 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+# A whole string (group 1 is the closing quote, empty if the buffer ends first) or a bracket
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*("?)|[\[\]{}]', re.S)
+_SCALAR_END = re.compile(r'[\s,\]}]')
+
+# Event kinds produced by iter_document
+EVENT_FIELD = 'field'
+EVENT_ARRAY = 'array'
+EVENT_ITEM = 'item'
+
+class _TextBuffer:
+    """Sliding window over a text file for incremental JSON decoding"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=None):
+        """Read another chunk (of size characters if given), dropping already consumed text"""
+        data = self.f.read(size or self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def fill_ahead(self):
+        """Read at least as much again as is held, so a long value is re-read O(log n) times"""
+        return self.fill(max(self.chunk_size, len(self.buf) - self.pos))
+
+    def decode(self, max_size=None):
+        """
+        Decode the next complete JSON value, reading more input as needed.
+
+        A failed attempt doubles the text held before retrying, so decoding a
+        value costs time linear in its length.
+
+        Raises:
+            json.JSONDecodeError: If the value is invalid, or runs past
+                max_size characters
+        """
+        self.peek()
+        while True:
+            # A number or literal may continue in the next chunk until a delimiter is buffered
+            # ('-2.5e' would otherwise decode as -2.5)
+            if self.buf[self.pos:self.pos + 1] not in ('{', '[', '"') and not self.eof and \
+                    _SCALAR_END.search(self.buf, self.pos) is None:
+                self.fill()
+                continue
+
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if max_size is not None and len(self.buf) - self.pos > max_size:
+                    raise json.JSONDecodeError(
+                        f"Value longer than {max_size} characters", self.buf, self.pos) from None
+                if self.eof or not self.fill_ahead():
+                    raise
+                continue
+
+            self.pos = end
+            return value
+
+    def skip(self):
+        """
+        Consume the next JSON value without decoding or holding it.
+
+        The value's end is found by tracking bracket depth outside strings,
+        dropping text as it is passed. Skipped values are not validated.
+        """
+        self.peek()
+        delimited = self.buf[self.pos:self.pos + 1] in ('{', '[', '"')
+        depth = 0
+
+        while True:
+            buf = self.buf
+            end = None
+            if delimited:
+                for match in _TOKEN.finditer(buf, self.pos):
+                    token = match.group()
+                    if token[0] == '"':
+                        if not match.group(1):
+                            # The string runs past the buffer; rescan it after the next read
+                            self.pos = match.start()
+                            break
+                    elif token in '[{':
+                        depth += 1
+                    else:
+                        depth -= 1
+                    if depth == 0:
+                        end = match.end()
+                        break
+                else:
+                    self.pos = len(buf)
+            else:
+                match = _SCALAR_END.search(buf, self.pos)
+                if match is not None:
+                    self.pos = match.start()
+                    return
+                self.pos = len(buf)
+
+            if end is not None:
+                self.pos = end
+                return
+            if not self.fill_ahead():
+                if delimited:
+                    raise json.JSONDecodeError("Unterminated value", self.buf, self.pos)
+                return
+
+def iter_document(path, stream_key=STREAM_KEY, chunk_size=CHUNK_SIZE, fields=None,
+                  max_record_size=MAX_RECORD_SIZE):
+    """
+    Scan a JSON document's top-level object as a stream of events.
+
+    Args:
+        path (str): JSON file
+        stream_key (str): Top-level array streamed item by item
+        chunk_size (int): Characters read at a time
+        fields (iterable): Ordinary top-level fields to decode; others are
+            skipped without being held (None decodes every field)
+        max_record_size (int): Longest single array item, in characters
+
+    Yields:
+        tuple: (EVENT_FIELD, key, value) for ordinary top-level fields,
+               (EVENT_ARRAY, stream_key, None) when the streamed array starts,
+               (EVENT_ITEM, index, item) for each element of that array
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON, or a single
+            array item runs past max_record_size characters
+    """
+    fields = None if fields is None else set(fields)
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = _TextBuffer(f, chunk_size)
+        buf.expect('{')
+
+        if buf.peek() == '}':
+            buf.pos += 1
+            return
+
+        while True:
+            key = buf.decode()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", buf.buf, buf.pos)
+            buf.expect(':')
+
+            if key == stream_key and buf.peek() == '[':
+                buf.pos += 1
+                yield EVENT_ARRAY, key, None
+
+                index = 0
+                if buf.peek() == ']':
+                    buf.pos += 1
+                else:
+                    while True:
+                        yield EVENT_ITEM, index, buf.decode(max_record_size)
+                        index += 1
+                        separator = buf.peek()
+                        buf.pos += 1
+                        if separator == ']':
+                            break
+                        if separator != ',':
+                            raise json.JSONDecodeError("Expecting ',' delimiter", buf.buf, buf.pos - 1)
+            elif fields is None or key in fields:
+                yield EVENT_FIELD, key, buf.decode()
+            else:
+                buf.skip()
+
+            separator = buf.peek()
+            buf.pos += 1
+            if separator == '}':
+                break
+            if separator != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf.buf, buf.pos - 1)
+
+        if buf.peek():
+            raise json.JSONDecodeError("Extra data", buf.buf, buf.pos)
+
+def iter_opportunities(path, chunk_size=CHUNK_SIZE):
+    """Yield opportunity records one at a time"""
+    for event, _key, value in iter_document(path, chunk_size=chunk_size, fields=()):
+        if event == EVENT_ITEM:
+            yield value
+
+def read_meta(path, chunk_size=CHUNK_SIZE):
+    """
+    Return the 'meta' block of an opportunities file (None if absent).
+
+    Stops reading as soon as 'meta' is found; if it comes after the
+    opportunities array the records are skipped, not kept.
+    """
+    for event, key, value in iter_document(path, chunk_size=chunk_size, fields=('meta',)):
+        if event == EVENT_FIELD and key == 'meta':
+            return value
+    return None
+
+def load_document(path, chunk_size=CHUNK_SIZE):
+    """
+    Parse a whole opportunities file, like json.load without holding its text.
+
+    Only one read chunk of the file is in memory at a time alongside the
+    parsed values, so callers that need every record (to sort or rewrite
+    them) pay for the records alone.
+    """
+    document = {}
+    for event, key, value in iter_document(path, chunk_size=chunk_size):
+        if event == EVENT_FIELD:
+            document[key] = value
+        elif event == EVENT_ARRAY:
+            document[key] = []
+        else:
+            document[STREAM_KEY].append(value)
+    return document
+
+class OpportunityStream:
+    """
+    Re-iterable view of the records in an opportunities file.
+
+    Each iteration re-opens the file and streams it, so the object can stand
+    in for data['opportunities'] wherever records are only iterated.
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return iter_opportunities(self.path, self.chunk_size)
+
+    def __repr__(self):
+        return f"OpportunityStream({self.path!r})"
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Pipeline Runner
+Runs every pipeline stage in one process as a dependency DAG
+
+The stages are the scripts of the daily chain, called in-process:
+
+    scrape_all -> validate_and_merge -> qc_validator ---------> comprehensive_qc_check -> full_qc_audit
+                                    \\-> qc_validate_and_merge -> generate_programs ------/
+
+One interpreter imports pandas and the stage modules once, and the stages
+share one QCContext: the sweep and the merge hand their opportunities to it
+directly, so later stages read them from memory instead of re-parsing
+data/opportunities.json. Every stage still writes its usual files.
+full_qc_audit takes the qc_validator and comprehensive_qc_check verdicts
+from the context rather than running those checks again.
+
+Stages whose dependencies have finished run at the same time on threads
+(--jobs, 1 runs them in chain order on the main thread, as does any profiled
+run so per-stage figures do not mix). While stages run concurrently, each
+line they print is prefixed with the stage name. A stage whose dependency
+failed is skipped; the others still run. Advisory stages
+(comprehensive_qc_check, which full_qc_audit reports as warnings) never
+block later stages or fail the run.
+
+--from starts at a stage and runs everything downstream of it; --until stops
+after a stage and runs everything upstream of it. Stages left out are taken
+as done, with their outputs read from disk.
+
+Usage:
+    python scripts/pipeline.py
+    python scripts/pipeline.py --from qc_validator
+    python scripts/pipeline.py --until generate_programs --jobs 1
+    python scripts/pipeline.py --from validate_and_merge --until comprehensive_qc_check --list
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+import comprehensive_qc_check  # noqa: E402
+import full_qc_audit  # noqa: E402
+import generate_programs  # noqa: E402
+import memory_profile  # noqa: E402
+import profiling  # noqa: E402
+import qc_validator  # noqa: E402
+import validate_and_merge  # noqa: E402
+from memory_profile import memory_profiled  # noqa: E402
+from pipeline_log import SUCCESS, get_logger  # noqa: E402
+from profiling import profiled  # noqa: E402
+from qc.validate_and_merge import validate_and_merge as build_priority_matrix  # noqa: E402
+from qc_context import QCContext  # noqa: E402
+from scrapers.scrape_all import run_pipeline as run_sweep  # noqa: E402
+from tracing import span, traced  # noqa: E402
+
+# Stages run at the same time
+DEFAULT_JOBS = 4
+
+PASSED = 'passed'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+log = get_logger('pipeline')
+
+def log_info(msg):
+    log.info(msg)
+
+def log_success(msg):
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def log_error(msg):
+    log.error(msg)
+
+def _scrape_all(ctx):
+    document = run_sweep()
+    ctx.provide(meta=document['meta'], opportunities=document['opportunities'])
+    return True
+
+def _validate_and_merge(ctx):
+    return validate_and_merge.main([], ctx=ctx) == 0
+
+def _qc_validator(ctx):
+    # Verdicts recorded on ctx are reused by full_qc_audit instead of re-running the check
+    return ctx.run_check('qc_validator', lambda ctx: qc_validator.main([], ctx=ctx)) == 0
+
+def _qc_validate_and_merge(ctx):
+    build_priority_matrix(ctx)
+    return True
+
+def _generate_programs(ctx):
+    return generate_programs.generate_programs_json(ctx=ctx)
+
+def _comprehensive_qc_check(ctx):
+    return ctx.run_check('comprehensive_qc_check', lambda ctx: comprehensive_qc_check.main(ctx=ctx)) == 0
+
+def _full_qc_audit(ctx):
+    return full_qc_audit.main([], ctx=ctx) == 0
+
+# Stage name -> callable(ctx) returning True on success, in chain order
+STAGES = {
+    'scrape_all': _scrape_all,
+    'validate_and_merge': _validate_and_merge,
+    'qc_validator': _qc_validator,
+    'qc_validate_and_merge': _qc_validate_and_merge,
+    'generate_programs': _generate_programs,
+    'comprehensive_qc_check': _comprehensive_qc_check,
+    'full_qc_audit': _full_qc_audit,
+}
+
+# Stage -> stages that must pass (or, for advisory ones, finish) before it starts
+STAGE_DEPENDENCIES = {
+    'scrape_all': (),
+    'validate_and_merge': ('scrape_all',),
+    'qc_validator': ('validate_and_merge',),
+    'qc_validate_and_merge': ('validate_and_merge',),
+    # Both write data/processed/priority_matrix.csv; generate_programs' copy is the published one
+    'generate_programs': ('qc_validate_and_merge',),
+    # Reads the sources matrix qc_validator writes
+    'comprehensive_qc_check': ('qc_validator',),
+    # Audits every output
+    'full_qc_audit': ('comprehensive_qc_check', 'generate_programs'),
+}
+
+# Stages whose failure is reported but does not skip later stages or fail the run
+ADVISORY_STAGES = ('comprehensive_qc_check',)
+
+class _StageOutput:
+    """sys.stdout stand-in that prefixes each line a stage thread prints with the stage name"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    def register(self, name):
+        self._stages[threading.get_ident()] = [name, '']
+
+    def unregister(self):
+        name, pending = self._stages.pop(threading.get_ident())
+        if pending:
+            self._emit(name, [pending])
+
+    def _emit(self, name, lines):
+        with self._lock:
+            self.stream.write(''.join(f"[{name}] {line}\n" for line in lines))
+
+    def write(self, text):
+        state = self._stages.get(threading.get_ident())
+        if state is None:
+            return self.stream.write(text)
+        lines = (state[1] + text).split('\n')
+        state[1] = lines.pop()
+        if lines:
+            self._emit(state[0], lines)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _reachable(name, edges):
+    seen = set()
+    todo = [name]
+    while todo:
+        current = todo.pop()
+        if current not in seen:
+            seen.add(current)
+            todo.extend(edges.get(current, ()))
+    return seen
+
+def select_stages(start=None, until=None, dependencies=None):
+    """
+    Stages to run for --from/--until, in chain order.
+
+    Args:
+        start (str): Keep this stage and every stage downstream of it
+        until (str): Keep this stage and every stage upstream of it
+        dependencies (dict): Stage -> prerequisite stages (default: STAGE_DEPENDENCIES)
+
+    Returns:
+        list: Selected stage names (empty if start is not upstream of until)
+    """
+    dependencies = dependencies or STAGE_DEPENDENCIES
+    selected = set(dependencies)
+    if start:
+        dependents = {name: [other for other, deps in dependencies.items() if name in deps]
+                      for name in dependencies}
+        selected &= _reachable(start, dependents)
+    if until:
+        selected &= _reachable(until, dependencies)
+    return [name for name in dependencies if name in selected]
+
+def _run_stage(name, stage, ctx, output):
+    """Run one stage; exceptions count as failure"""
+    started = time.perf_counter()
+    if output is not None:
+        output.register(name)
+    try:
+        with span(f"pipeline.{name}"):
+            passed = bool(stage(ctx))
+    except Exception as e:
+        log_error(f"{name} raised {type(e).__name__}: {e}")
+        passed = False
+    finally:
+        if output is not None:
+            output.unregister()
+    return passed, time.perf_counter() - started
+
+def run_stages(stages, ctx, jobs=DEFAULT_JOBS, dependencies=None):
+    """
+    Run stages as a DAG: each starts once its selected dependencies have passed.
+
+    Dependencies that are not in `stages` count as done. A stage whose
+    dependency failed (unless it is advisory) or was skipped is skipped.
+
+    Args:
+        stages (dict): Stage name -> callable(ctx) returning True on success, in chain order
+        ctx (QCContext): Datasets shared by the stages
+        jobs (int): Stages run at the same time (1 runs them in order on this thread)
+        dependencies (dict): Stage -> prerequisite stages (default: STAGE_DEPENDENCIES)
+
+    Returns:
+        dict: Stage name -> {'status': 'passed'/'failed'/'skipped', 'seconds': float}, in chain order
+    """
+    dependencies = dependencies or STAGE_DEPENDENCIES
+    results = {}
+    pending = list(stages)
+
+    def blocked(name):
+        for dep in dependencies.get(name, ()):
+            status = results.get(dep, {}).get('status')
+            if status == SKIPPED or (status == FAILED and dep not in ADVISORY_STAGES):
+                return True
+        return False
+
+    def ready(name):
+        return all(dep in results for dep in dependencies.get(name, ()) if dep in stages)
+
+    def record(name, passed, seconds):
+        results[name] = {'status': PASSED if passed else FAILED, 'seconds': seconds}
+        if passed:
+            log_success(f"Stage {name} passed in {seconds:.2f}s")
+        else:
+            log_error(f"Stage {name} failed after {seconds:.2f}s")
+
+    def skip(name):
+        results[name] = {'status': SKIPPED, 'seconds': 0.0}
+        log_warning(f"Stage {name} skipped: a stage it depends on did not pass")
+
+    if jobs <= 1:
+        for name in pending:
+            if blocked(name):
+                skip(name)
+            else:
+                record(name, *_run_stage(name, stages[name], ctx, None))
+        return results
+
+    output = _StageOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    if blocked(name):
+                        pending.remove(name)
+                        skip(name)
+                    elif ready(name) and len(running) < jobs:
+                        pending.remove(name)
+                        log_info(f"Starting stage {name}")
+                        running[pool.submit(_run_stage, name, stages[name], ctx, output)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(running.pop(future), *future.result())
+    finally:
+        sys.stdout = output.stream
+
+    return {name: results[name] for name in stages if name in results}
+
+def print_summary(results):
+    """Log each stage's status and duration"""
+    log_info("=" * 60)
+    log_info("PIPELINE SUMMARY")
+    log_info(f"{'stage':<26} {'status':<8} {'seconds':>8}")
+    for name, result in results.items():
+        log_info(f"{name:<26} {result['status']:<8} {result['seconds']:>8.2f}")
+    log_info("=" * 60)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Run the NUVIEW pipeline stages in one process')
+    parser.add_argument('--from', dest='start', choices=list(STAGES),
+                        help='First stage; it and everything downstream of it run')
+    parser.add_argument('--until', choices=list(STAGES),
+                        help='Last stage; it and everything upstream of it run')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help='Stages run at the same time (1 runs them in chain order; '
+                             'profiling always runs them one at a time)')
+    parser.add_argument('--list', action='store_true',
+                        help='Print the selected stages and their dependencies, then exit')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Write per-stage tracemalloc snapshots and peak RSS to data/metrics')
+    profiling.add_profile_argument(parser)
+    return parser.parse_args(argv)
+
+@traced('pipeline', run=True)
+@memory_profiled('pipeline')
+@profiled('pipeline')
+def main(argv=None):
+    """Run the selected stages and print a summary"""
+    args = parse_args(argv)
+    selected = select_stages(args.start, args.until)
+    if not selected:
+        log_error(f"No stage is both downstream of {args.start} and upstream of {args.until}")
+        return 2
+
+    if args.list:
+        for name in selected:
+            deps = [dep for dep in STAGE_DEPENDENCIES[name] if dep in selected]
+            print(f"{name:<26} after: {', '.join(deps) or '-'}")
+        return 0
+
+    if args.profile_memory:
+        memory_profile.start('pipeline')
+    if args.profile:
+        profiling.start('pipeline', args.profile)
+
+    # Profiler state is process-wide: concurrent stages would mix their
+    # checkpoints and peaks, and cProfile only sees the main thread
+    profiled_run = (args.profile_memory or args.profile
+                    or memory_profile.profiling_requested() or profiling.requested_mode())
+    if profiled_run and args.jobs > 1:
+        log_warning("Profiling: running the stages one at a time (--jobs 1)")
+        args.jobs = 1
+
+    log_info("=" * 60)
+    log_info("NUVIEW STRATEGIC PIPELINE - RUNNER")
+    log_info(f"Stages: {', '.join(selected)}")
+    log_info("=" * 60)
+
+    started = time.perf_counter()
+    results = run_stages({name: STAGES[name] for name in selected}, QCContext(), args.jobs)
+    print_summary(results)
+
+    advisory = [name for name, result in results.items() if name in ADVISORY_STAGES and result['status'] == FAILED]
+    if all(result['status'] == PASSED or name in advisory for name, result in results.items()):
+        if advisory:
+            log_warning(f"Advisory stage(s) reported problems: {', '.join(advisory)}")
+        log_success(f"Pipeline complete in {time.perf_counter() - started:.2f}s")
+        return 0
+    log_error("Pipeline finished with failed or skipped stages")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+NUVIEW Strategic Pipeline - Shared Logging
+Colored console or JSON-lines output, level filtering and aggregated repeats
+
+Scripts log through get_logger() instead of printing. Two output formats:
+- console (default): the colored one-line format used across the pipeline,
+  written synchronously to stdout so it interleaves with print() output;
+- json: one JSON object per line ({ts, level, logger, msg, ...fields}),
+  written through a QueueHandler so a background thread does the
+  (block-buffered) I/O and large runs are not held up by log output.
+
+Messages that repeat once per record (duplicates removed, per-record QC
+warnings) are logged with log_repeated(): the first AGGREGATE_SAMPLE of each
+kind are shown, the rest are only counted, and flush_repeated() logs one
+"... and N more" line per kind.
+
+Environment:
+    NUVIEW_LOG_FORMAT   console | json
+    NUVIEW_LOG_LEVEL    DEBUG | INFO | WARNING | ERROR (default INFO)
+    NUVIEW_LOG_FILE     Write JSON lines to this file instead of stdout
+
+Usage:
+    from pipeline_log import get_logger, log_repeated, flush_repeated
+
+    log = get_logger('validate_and_merge')
+    log.info("Merging opportunities...")
+    log_repeated(log, 'duplicate', f"Duplicate removed: {title}")
+    flush_repeated()
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+
+LOG_FORMAT_ENV = 'NUVIEW_LOG_FORMAT'
+LOG_LEVEL_ENV = 'NUVIEW_LOG_LEVEL'
+LOG_FILE_ENV = 'NUVIEW_LOG_FILE'
+
+ROOT_LOGGER = 'nuview'
+
+# Between INFO and WARNING, rendered with the green check mark
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+# Repeated messages shown per kind before the rest are only counted
+AGGREGATE_SAMPLE = 5
+
+# Write buffer of the JSON-lines stream
+LOG_BUFFER_SIZE = 64 * 1024
+
+# ANSI color codes and prefixes per level
+COLOR_GREEN = '\033[92m'
+COLOR_ORANGE = '\033[93m'
+COLOR_RED = '\033[91m'
+COLOR_BLUE = '\033[94m'
+COLOR_RESET = '\033[0m'
+
+CONSOLE_STYLES = {
+    logging.DEBUG: (COLOR_BLUE, 'ℹ️  '),
+    logging.INFO: (COLOR_BLUE, 'ℹ️  '),
+    SUCCESS: (COLOR_GREEN, '✅ '),
+    logging.WARNING: (COLOR_ORANGE, '⚠️  '),
+    logging.ERROR: (COLOR_RED, '❌ '),
+    logging.CRITICAL: (COLOR_RED, '❌ '),
+}
+
+_lock = threading.RLock()
+_configured_pid = None
+_listener = None
+_aggregates = {}
+
+class ConsoleFormatter(logging.Formatter):
+    """The pipeline's colored console line"""
+
+    def format(self, record):
+        color, prefix = CONSOLE_STYLES.get(record.levelno, (COLOR_BLUE, ''))
+        return f"{color}{prefix}{record.getMessage()}{COLOR_RESET}"
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record; fields passed with extra={'fields': {...}} are included"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is at emit time (so redirect_stdout captures it)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def log_format():
+    """'json' or 'console', from NUVIEW_LOG_FORMAT"""
+    return 'json' if os.environ.get(LOG_FORMAT_ENV, '').lower() == 'json' else 'console'
+
+def _json_stream():
+    path = os.environ.get(LOG_FILE_ENV)
+    if path:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        return open(path, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+    return open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=LOG_BUFFER_SIZE, closefd=False)
+
+def configure(level=None, fmt=None):
+    """
+    Set up the pipeline's log handlers (idempotent per process).
+
+    Args:
+        level (str or int): Minimum level (defaults to NUVIEW_LOG_LEVEL or INFO)
+        fmt (str): 'console' or 'json' (defaults to NUVIEW_LOG_FORMAT)
+
+    Returns:
+        logging.Logger: The pipeline's root logger
+    """
+    global _configured_pid, _listener
+
+    root = logging.getLogger(ROOT_LOGGER)
+    with _lock:
+        if _configured_pid == os.getpid() and level is None and fmt is None:
+            return root
+
+        _stop_listener()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+
+        level = level or os.environ.get(LOG_LEVEL_ENV, 'INFO')
+        root.setLevel(level.upper() if isinstance(level, str) else level)
+        root.propagate = False
+
+        if (fmt or log_format()) == 'json':
+            target = logging.StreamHandler(_json_stream())
+            target.setFormatter(JSONFormatter())
+            # Records are queued and written by a background thread
+            _listener = logging.handlers.QueueListener(queue.SimpleQueue(), target)
+            _listener.start()
+            root.addHandler(logging.handlers.QueueHandler(_listener.queue))
+        else:
+            handler = _StdoutHandler()
+            handler.setFormatter(ConsoleFormatter())
+            root.addHandler(handler)
+
+        _configured_pid = os.getpid()
+    return root
+
+def _stop_listener():
+    global _listener
+    if _listener is not None and _configured_pid == os.getpid():
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+            handler.stream.close()
+    _listener = None
+
+def get_logger(name):
+    """A logger under the pipeline's root (configured on first use)"""
+    configure()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+def log_repeated(logger, kind, msg, level=logging.WARNING, **fields):
+    """
+    Log a message that repeats per record, showing only the first few of each kind.
+
+    Args:
+        logger (logging.Logger): Logger to write to
+        kind (str): Aggregation key (e.g. 'Duplicate removed')
+        msg (str): The message
+        level (int): Log level
+        fields: Extra structured fields for JSON output
+    """
+    with _lock:
+        key = (logger.name, kind, level)
+        count = _aggregates.get(key, 0) + 1
+        _aggregates[key] = count
+    if count <= AGGREGATE_SAMPLE:
+        logger.log(level, msg, extra={'fields': dict(fields, kind=kind)})
+
+def flush_repeated():
+    """
+    Log one summary line per kind whose repeats were suppressed, and reset the counts.
+
+    Returns:
+        dict: kind -> total occurrences since the last flush
+    """
+    with _lock:
+        aggregates = dict(_aggregates)
+        _aggregates.clear()
+
+    totals = {}
+    for (name, kind, level), count in sorted(aggregates.items()):
+        totals[kind] = totals.get(kind, 0) + count
+        if count > AGGREGATE_SAMPLE:
+            logging.getLogger(name).log(
+                level, f"{kind}: ... and {count - AGGREGATE_SAMPLE} more ({count} total)",
+                extra={'fields': {'kind': kind, 'count': count}})
+    return totals
+
+def flush():
+    """Write out queued JSON lines now; the background writer keeps running"""
+    with _lock:
+        if _listener is not None and _configured_pid == os.getpid():
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.flush()
+            _listener.start()
+
+def shutdown():
+    """Write pending summaries and drain the background writer"""
+    flush_repeated()
+    with _lock:
+        _stop_listener()
+
+def _after_fork_in_child():
+    # The background writer thread does not survive fork: start a fresh one
+    global _lock, _listener
+    _lock = threading.RLock()
+    _listener = None
+    if _configured_pid is not None:
+        configure()
+
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - CPU Profiling
+cProfile statistics and sampled collapsed stacks for any pipeline entry point
+
+Every entry point accepts --profile cpu, and NUVIEW_PROFILE=cpu turns
+profiling on for all of them. A profiled run writes two files to
+data/metrics/profiles/:
+- <run>.pstats: cProfile statistics of the entry point's thread, for
+  `python -m pstats`, snakeviz or gprof2dot;
+- <run>.collapsed: stacks sampled from every thread (scraper workers
+  included) every SAMPLE_INTERVAL seconds, one "frame;frame;frame count"
+  line per stack, for flamegraph.pl, speedscope or inferno.
+
+Entry points are decorated with @profiled(name); one called from a profiled
+entry point (run_pipeline inside run_all) is part of the outer profile.
+Stages that run in worker processes (full_qc_audit's default) are only seen
+as waits; run the audit with --jobs 1 to profile its checks.
+
+Usage:
+    python scripts/qc_validator.py --profile cpu
+    NUVIEW_PROFILE=cpu python scripts/run_all.py
+    python scripts/profiling.py top data/metrics/profiles/<run>.pstats
+"""
+
+import argparse
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+PROFILE_DIR = 'data/metrics/profiles'
+PROFILE_ENV = 'NUVIEW_PROFILE'
+PROFILE_MODES = ('cpu',)
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = 0.005
+
+# Functions printed when a profile finishes
+TOP_FUNCTIONS = 15
+
+_active = None
+
+def requested_mode():
+    """Profiling mode from NUVIEW_PROFILE ('cpu'), or None"""
+    mode = os.environ.get(PROFILE_ENV, '').lower()
+    return mode if mode in PROFILE_MODES else None
+
+def add_profile_argument(parser):
+    """Add the uniform --profile option to an entry point's argument parser"""
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help=f'Profile this run and write .pstats and collapsed stacks to {PROFILE_DIR}')
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ',')
+
+class StackSampler(threading.Thread):
+    """Samples the stacks of all other threads into collapsed-stack counts"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(name='nuview-profiler', daemon=True)
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}").replace(';', ','))
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+class _CPUProfile:
+    """cProfile plus stack sampler for one run"""
+
+    def __init__(self, name):
+        import cProfile
+
+        self.name = name
+        self.started = time.time()
+        self.sampler = StackSampler()
+        self.profiler = cProfile.Profile()
+        self.sampler.start()
+        self.profiler.enable()
+
+    def finish(self, profile_dir):
+        self.profiler.disable()
+        self.sampler.stop()
+
+        started = datetime.fromtimestamp(self.started, timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        base = os.path.join(profile_dir, f"{self.name}-{started}-{os.getpid()}")
+        os.makedirs(profile_dir, exist_ok=True)
+
+        self.profiler.dump_stats(f"{base}.pstats")
+        with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.sampler.stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return base
+
+def start(name, mode='cpu'):
+    """
+    Start profiling a run (no-op if one is already being profiled).
+
+    Args:
+        name (str): Run name used in the output file names
+        mode (str): Profiling mode ('cpu')
+
+    Returns:
+        bool: True if this call started the profile
+    """
+    global _active
+    if _active is not None or mode not in PROFILE_MODES:
+        return False
+    _active = _CPUProfile(name)
+    return True
+
+def stop(profile_dir=None):
+    """
+    Finish the active profile, write its files and print the top functions.
+
+    Returns:
+        str: Output path without extension, or None if nothing was profiled
+    """
+    global _active
+    if _active is None:
+        return None
+
+    profile, _active = _active, None
+    try:
+        base = profile.finish(profile_dir or PROFILE_DIR)
+    except OSError as e:
+        print(f"Could not write profile: {e}")
+        return None
+
+    print_top(f"{base}.pstats")
+    print(f"Profile written to {base}.pstats and {base}.collapsed")
+    return base
+
+def profiled(name):
+    """
+    Decorate an entry point: profile it when requested, and write the profile when it returns.
+
+    Profiling starts here if NUVIEW_PROFILE is set, or inside the call when
+    the entry point calls start() for its --profile option.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            outer = _active is not None
+            if not outer and requested_mode():
+                start(name, requested_mode())
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if not outer:
+                    stop()
+        return wrapper
+    return decorator
+
+def print_top(pstats_path, limit=TOP_FUNCTIONS):
+    """Print the functions with the most cumulative time"""
+    import pstats
+
+    stats = pstats.Stats(pstats_path, stream=sys.stdout)
+    stats.strip_dirs().sort_stats('cumulative').print_stats(limit)
+
+def main(argv=None):
+    """Print the top functions of a saved profile"""
+    parser = argparse.ArgumentParser(description='Inspect pipeline CPU profiles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    top_parser = subparsers.add_parser('top', help='Print the functions with the most cumulative time')
+    top_parser.add_argument('pstats', help='Path to a .pstats file')
+    top_parser.add_argument('-n', '--limit', type=int, default=TOP_FUNCTIONS, help='Functions to print')
+    args = parser.parse_args(argv)
+
+    print_top(args.pstats, args.limit)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,28 @@ import math
 import os
 import sys
 
-import pandas as pd
-
 # Add parent directory to path to import from scripts/
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from columnar_io import PRIORITY_MATRIX_DTYPES, write_matrix
+from pipeline_log import SUCCESS, get_logger
+
+log = get_logger('qc_validate_and_merge')
+
+
+def log_info(msg):
+    log.info(msg)
+
+def log_success(msg):
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def log_error(msg):
+    log.error(msg)
+
+
 def calculate_priority(budget, num_keywords, data_access, confidence):
     """
     Calculate priority score based on budget, keywords, data access, and confidence.
@@ -46,12 +63,18 @@ def calculate_priority(budget, num_keywords, data_access, confidence):
 
 # Function to source data for priority matrix
 
-def source_data():
-    """Load opportunities data from JSON file"""
+def source_data(ctx=None):
+    """Load opportunities data from JSON file (or from the shared QCContext when given)"""
+    import pandas as pd
     opportunities_file = 'data/opportunities.json'
 
+    if ctx is not None:
+        df = pd.DataFrame(ctx.opportunities)
+        log_success(f"Loaded {len(df)} opportunities from the shared pipeline data")
+        return df
+
     if not os.path.exists(opportunities_file):
-        print(f"⚠️  Warning: {opportunities_file} not found")
+        log_warning(f"{opportunities_file} not found")
         return pd.DataFrame()
 
     try:
@@ -60,10 +83,10 @@ def source_data():
 
         opportunities = data.get('opportunities', [])
         df = pd.DataFrame(opportunities)
-        print(f"✅ Loaded {len(df)} opportunities from {opportunities_file}")
+        log_success(f"Loaded {len(df)} opportunities from {opportunities_file}")
         return df
     except Exception as e:
-        print(f"❌ Error loading data: {e}")
+        log_error(f"Error loading data: {e}")
         return pd.DataFrame()
 
 # Function to verify DataFrame according to NUVIEW v3.2 protocol
@@ -71,14 +94,14 @@ def source_data():
 def verify_dataframe(df):
     """Verify and enrich DataFrame with priority calculations"""
     if df.empty:
-        print("⚠️  DataFrame is empty, skipping verification")
+        log_warning("DataFrame is empty, skipping verification")
         return df
 
     verified_df = df.copy()
 
     # Add priority calculation if not present
     if 'calculatedPriority' not in verified_df.columns:
-        print("📊 Calculating priorities...")
+        log_info("📊 Calculating priorities...")
 
         def calc_row_priority(row):
             budget = row.get('amountUSD', 0)
@@ -104,7 +127,7 @@ def verify_dataframe(df):
             return calculate_priority(budget, num_keywords, data_access, confidence)
 
         verified_df['calculatedPriority'] = verified_df.apply(calc_row_priority, axis=1)
-        print(f"✅ Calculated priorities for {len(verified_df)} opportunities")
+        log_success(f"Calculated priorities for {len(verified_df)} opportunities")
 
     return verified_df
 
@@ -113,23 +136,28 @@ def verify_dataframe(df):
 def handle_sources():
     """Handle fallback and source logic"""
     # Logic for handling sources
-    print("✅ Source handling completed")
+    log_success("Source handling completed")
     pass
 
 # Main function to validate and merge data
 
-def validate_and_merge():
-    """Main validation and merge workflow"""
-    print("=" * 80)
-    print("NUVIEW TOPOGRAPHIC PIPELINE - QC VALIDATE AND MERGE")
-    print("=" * 80)
-    print()
+def validate_and_merge(ctx=None):
+    """
+    Main validation and merge workflow
+
+    Args:
+        ctx (QCContext): Shared datasets when run in-process by the pipeline runner
+    """
+    log_info("=" * 80)
+    log_info("NUVIEW TOPOGRAPHIC PIPELINE - QC VALIDATE AND MERGE")
+    log_info("=" * 80)
+    log_info("")
 
     # Source the data
-    data = source_data()
+    data = source_data(ctx)
 
     if data.empty:
-        print("⚠️  No data to process")
+        log_warning("No data to process")
         return
 
     # Verify data in DataFrame
@@ -149,20 +177,22 @@ def validate_and_merge():
     # Ensure output directory exists
     os.makedirs('data/processed', exist_ok=True)
 
-    # Save to CSV
+    # Save to CSV, with typed Parquet/Arrow copies for internal consumers
     output_csv = 'data/processed/priority_matrix.csv'
-    output.to_csv(output_csv, index=False)
-    print(f"✅ Saved priority matrix to {output_csv}")
+    columnar = write_matrix(output, output_csv, PRIORITY_MATRIX_DTYPES)
+    log_success(f"Saved priority matrix to {output_csv}")
+    for path in columnar:
+        log_success(f"Saved columnar copy to {path}")
 
     # Also save as JSON
     output_json = 'data/processed/opportunities_validated.json'
     output.to_json(output_json, orient='records', indent=2)
-    print(f"✅ Saved validated opportunities to {output_json}")
+    log_success(f"Saved validated opportunities to {output_json}")
 
-    print()
-    print("=" * 80)
-    print("✅ Validation and merge completed successfully")
-    print("=" * 80)
+    log_info("")
+    log_info("=" * 80)
+    log_success("Validation and merge completed successfully")
+    log_info("=" * 80)
 
 if __name__ == '__main__':
     validate_and_merge()
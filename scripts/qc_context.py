@@ -0,0 +1,135 @@
+"""
+NUVIEW Strategic Pipeline - Shared QC Context
+Loads each QC input once and hands the parsed views to every check
+
+A QCContext is created once per QC run and passed to qc_validator,
+comprehensive_qc_check and full_qc_audit. Every artifact is parsed lazily on
+first use and cached on the context; derived views (DataFrames built by a
+particular check) are memoized with view(). A stage that rewrites an artifact
+calls invalidate() so later stages re-read it, or provide() to hand them the
+new contents directly (the pipeline runner passes datasets between stages
+this way). Checks run through run_check() leave their verdict on the
+context, so full_qc_audit does not run them a second time.
+
+Usage:
+    from qc_context import QCContext
+
+    ctx = QCContext()
+    qc_validator.main([], ctx=ctx)
+    comprehensive_qc_check.main(ctx=ctx)
+"""
+
+import json
+import os
+import sys
+from functools import cached_property
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+from columnar_io import SOURCES_MATRIX_DTYPES, read_matrix
+from opportunity_stream import iter_opportunities, read_meta
+
+OPPORTUNITIES_FILE = 'data/opportunities.json'
+FORECAST_FILE = 'data/forecast.json'
+SOURCES_MATRIX_FILE = 'data/processed/sources_matrix.csv'
+
+ARTIFACTS = ('meta', 'opportunities', 'forecast', 'sources_matrix')
+
+class QCContext:
+    """Lazily loaded, cached QC inputs shared by all checks in one run"""
+
+    def __init__(self, opportunities_path=OPPORTUNITIES_FILE, forecast_path=FORECAST_FILE,
+                 sources_matrix_path=SOURCES_MATRIX_FILE):
+        self.opportunities_path = opportunities_path
+        self.forecast_path = forecast_path
+        self.sources_matrix_path = sources_matrix_path
+        self._views = {}
+        # Check name -> exit code, or "<Exception>: <message>" if it crashed
+        self.verdicts = {}
+
+    @cached_property
+    def meta(self):
+        """The 'meta' block of opportunities.json"""
+        return read_meta(self.opportunities_path)
+
+    @cached_property
+    def opportunities(self):
+        """All opportunity records, parsed once"""
+        return list(iter_opportunities(self.opportunities_path))
+
+    @cached_property
+    def forecast(self):
+        """Parsed forecast.json"""
+        with open(self.forecast_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @cached_property
+    def sources_matrix(self):
+        """The source verification matrix (typed binary copy when available)"""
+        return read_matrix(self.sources_matrix_path, SOURCES_MATRIX_DTYPES)
+
+    def view(self, name, build):
+        """
+        Return a derived view, building it on first use.
+
+        Args:
+            name (str): Cache key for the view
+            build (callable): Called with the context to build the view
+
+        Returns:
+            The cached result of build(self)
+        """
+        if name not in self._views:
+            self._views[name] = build(self)
+        return self._views[name]
+
+    def provide(self, **artifacts):
+        """
+        Set artifacts a stage produced in memory, so later stages skip re-reading them.
+
+        Derived views and check verdicts are dropped, since they may depend on
+        any artifact.
+
+        Args:
+            artifacts: Artifact values by name (e.g. meta=..., opportunities=[...])
+        """
+        unknown = set(artifacts) - set(ARTIFACTS)
+        if unknown:
+            raise ValueError(f"Unknown QC artifact(s): {', '.join(sorted(unknown))}")
+        for name, value in artifacts.items():
+            self.__dict__[name] = value
+        self._views.clear()
+        self.verdicts.clear()
+
+    def run_check(self, name, check):
+        """
+        Run a QC check on this context and record its verdict.
+
+        Args:
+            name (str): Check name ('qc_validator', 'comprehensive_qc_check')
+            check (callable): Called with the context, returning an exit code
+
+        Returns:
+            int: The check's exit code (exceptions are recorded, then re-raised)
+        """
+        try:
+            self.verdicts[name] = check(self)
+        except Exception as e:
+            self.verdicts[name] = f"{type(e).__name__}: {e}"
+            raise
+        return self.verdicts[name]
+
+    def invalidate(self, *names):
+        """
+        Drop cached artifacts so they are re-read on next use.
+
+        Derived views are always dropped, since they may depend on any artifact.
+
+        Args:
+            names (str): Artifact names ('meta', 'opportunities', 'forecast',
+                         'sources_matrix'); none means all of them
+        """
+        for name in names or ARTIFACTS:
+            self.__dict__.pop(name, None)
+        self._views.clear()
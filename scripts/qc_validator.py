@@ -6,13 +6,27 @@ Generates source verification matrix (sources_matrix.csv)
 Uses JSON Schema for schema validation
 """
 
+import argparse
+import hashlib
 import json
 import os
+import re
 import sys
 from datetime import datetime, timezone
 
-import pandas as pd
-from jsonschema import Draft7Validator
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+import memory_profile
+import profiling
+from columnar_io import SOURCES_MATRIX_DTYPES, write_matrix
+from domain_classifier import OUT_OF_SCOPE, RELEVANT, classify, classify_batch
+from memory_profile import checkpoint, memory_profiled
+from metrics import MetricsRegistry, write_textfile
+from opportunity_stream import EVENT_ARRAY, EVENT_FIELD, OpportunityStream, iter_document
+from pipeline_log import SUCCESS, flush_repeated, get_logger, log_repeated
+from profiling import profiled
+from tracing import annotate, traced
 
 # Required fields for opportunities
 REQUIRED_OPP_FIELDS = ['id', 'title', 'agency', 'pillar', 'category', 'forecast_value',
@@ -22,34 +36,121 @@ REQUIRED_FUNDING_FIELDS = ['amountUSD']
 VALID_CATEGORIES = ['DaaS', 'R&D', 'Platform']
 VALID_URGENCIES = ['urgent', 'near', 'future']
 
-# NUVIEW color codes for console output
-COLOR_GREEN = '\033[92m'  # Success
-COLOR_ORANGE = '\033[93m' # Warning
-COLOR_RED = '\033[91m'    # Error
-COLOR_BLUE = '\033[94m'   # Info
-COLOR_RESET = '\033[0m'
+# Schema validation; parsed schemas and compiled validators are cached per process
+SCHEMA_PATH = 'schemas/opportunities.json'
+SCHEMA_MAX_ERRORS = int(os.environ.get('NUVIEW_QC_MAX_SCHEMA_ERRORS', '1000'))
+_SCHEMA_CACHE = {}
+_VALIDATOR_CACHE = {}
+
+# Per-record verdict cache; bump QC_RULES_VERSION when check_opportunity changes
+QC_CACHE_FILE = 'data/cache/qc_cache.json'
+QC_RULES_VERSION = 2
+INDEX_PLACEHOLDER = '{idx}'
+# Fields regenerated on every sweep (random id digits, scrape time, rolling
+# deadline); the cache key keeps only their shape and messages hold
+# '{<field>}' placeholders, so unchanged records reuse verdicts across sweeps
+VOLATILE_FIELDS = ('id', 'scrapedAt', 'deadline')
+ID_PLACEHOLDER = '{id}'
+
+# Source verification matrix lookups
+COUNTRY_MAP = {
+    'Federal': 'USA',
+    'Commercial': 'USA',
+    'State': 'USA',
+    'USGS': 'USA',
+    'NASA': 'USA',
+    'NGA': 'USA',
+    'DIU': 'USA',
+    'USDA Forest Service': 'USA',
+    'JAXA': 'Japan',
+    'ISRO': 'India',
+    'DLR': 'Germany',
+    'ESA': 'Europe',
+    'EU Commission': 'Europe',
+    'UKSA': 'UK',
+    'CSA': 'Canada',
+    'CNSA': 'China'
+}
+# Substring tests for descriptive pillars, checked in order
+PILLAR_COUNTRY_KEYWORDS = [
+    (('japan',), 'Japan'),
+    (('india',), 'India'),
+    (('germany', 'german'), 'Germany'),
+    (('europe', 'eu'), 'Europe'),
+    (('uk', 'britain'), 'UK'),
+    (('canada',), 'Canada'),
+    (('china',), 'China'),
+]
+# Opportunity fields read for the matrix, with the default for a missing key
+MATRIX_INPUT_FIELDS = {
+    'id': 'unknown',
+    'agency': 'Unknown',
+    'title': 'Unknown',
+    'amountUSD': 0,
+    'priorityScore': 0,
+    'category': 'Unknown',
+    'pillar': '',
+    'description': '',
+    'link': '',
+    'budgetSourceLink': '',
+    'agencyLink': '',
+}
+SOURCE_LINK_FIELDS = ['link', 'budgetSourceLink', 'agencyLink']
+# Per-row matrix warnings shown before summarizing the rest
+MATRIX_WARNING_SAMPLE = 10
+
+# Prometheus textfile written after each QC run (see metrics.py)
+QC_METRICS_NAME = 'qc'
+
+# QC error type by message prefix; anything else is 'invalid_value'
+QC_ERROR_TYPES = [
+    ('Schema validation', 'schema'),
+    ('Schema not loaded', 'schema'),
+    ('File not found', 'missing_file'),
+    ('Invalid JSON', 'invalid_json'),
+    ('Missing', 'missing_field'),
+]
+# Per-record messages start with "Opportunity <idx> (<id>): "
+RECORD_PREFIX = re.compile(r'^Opportunity [^:]*: ')
+
+log = get_logger('qc_validator')
 
 def log_info(msg):
     """Log info message in NUVIEW blue"""
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg):
     """Log success message in NUVIEW green"""
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
 
 def log_warning(msg):
     """Log warning message in NUVIEW orange"""
-    print(f"{COLOR_ORANGE}⚠️  {msg}{COLOR_RESET}")
+    log.warning(msg)
 
 def log_error(msg):
     """Log error message in NUVIEW red"""
-    print(f"{COLOR_RED}❌ {msg}{COLOR_RESET}")
+    log.error(msg)
+
+def load_schema(schema_path=SCHEMA_PATH):
+    """
+    Load and return the JSON schema.
+
+    Parsed schemas are cached by path and modification time, so repeated
+    calls do not re-read the file unless it changed.
+    """
+    try:
+        mtime = os.stat(schema_path).st_mtime_ns
+    except FileNotFoundError:
+        log_error(f"Schema file not found: {schema_path}")
+        return None
+
+    cached = _SCHEMA_CACHE.get(schema_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
 
-def load_schema(schema_path='schemas/opportunities.json'):
-    """Load and return the JSON schema"""
     try:
         with open(schema_path, 'r') as f:
-            return json.load(f)
+            schema = json.load(f)
     except FileNotFoundError:
         log_error(f"Schema file not found: {schema_path}")
         return None
@@ -57,8 +158,75 @@ def load_schema(schema_path='schemas/opportunities.json'):
         log_error(f"Invalid JSON in schema file: {str(e)}")
         return None
 
-def validate_with_schema(data, schema):
-    """Validate data against JSON schema and return errors"""
+    _SCHEMA_CACHE[schema_path] = (mtime, schema)
+    return schema
+
+def get_schema_validators(schema):
+    """
+    Return compiled (document, item) validators for a schema.
+
+    The document validator checks everything except the opportunities array
+    items; the item validator checks a single opportunity. Both are built
+    once per schema object and reused.
+
+    Returns:
+        tuple: (document_validator, item_validator or None)
+    """
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached and cached[0] is schema:
+        return cached[1], cached[2]
+
+    from jsonschema import Draft7Validator
+
+    document_validator = Draft7Validator(schema)
+    item_schema = schema.get('properties', {}).get('opportunities', {}).get('items')
+    item_validator = Draft7Validator(item_schema) if item_schema else None
+
+    _VALIDATOR_CACHE[id(schema)] = (schema, document_validator, item_validator)
+    return document_validator, item_validator
+
+def _format_schema_error(error, prefix=()):
+    path_parts = [str(p) for p in prefix] + [str(p) for p in error.path]
+    path = '.'.join(path_parts) if path_parts else 'root'
+    return f"Schema validation error at '{path}': {error.message}"
+
+def iter_schema_errors(data, schema):
+    """
+    Lazily yield schema error messages for an opportunities document.
+
+    The document is validated without its opportunities array, then each
+    opportunity is validated on its own. data['opportunities'] may be any
+    iterable, including a stream, so nothing beyond the current item needs
+    to be held in memory.
+    """
+    document_validator, item_validator = get_schema_validators(schema)
+    opportunities = data.get('opportunities') if isinstance(data, dict) else None
+
+    if item_validator is None or opportunities is None or isinstance(opportunities, (dict, str)):
+        for error in sorted(document_validator.iter_errors(data), key=lambda e: e.path):
+            yield _format_schema_error(error)
+        return
+
+    document = dict(data, opportunities=[])
+    for error in sorted(document_validator.iter_errors(document), key=lambda e: e.path):
+        yield _format_schema_error(error)
+
+    for idx, opp in enumerate(opportunities):
+        for error in sorted(item_validator.iter_errors(opp), key=lambda e: e.path):
+            yield _format_schema_error(error, prefix=('opportunities', idx))
+
+def validate_with_schema(data, schema, max_errors=None):
+    """
+    Validate data against JSON schema and return errors.
+
+    Args:
+        data (dict): Document to validate ('opportunities' may be an iterable)
+        schema (dict): JSON schema
+        max_errors (int): Stop after this many errors (None for no limit)
+
+    Returns:
+        list: Error messages
+    """
     errors = []
 
     if not schema:
@@ -66,20 +234,180 @@ def validate_with_schema(data, schema):
         return errors
 
     try:
-        # Use Draft7Validator for better error messages
-        validator = Draft7Validator(schema)
-        schema_errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-
-        for error in schema_errors:
-            path = '.'.join(str(p) for p in error.path) if error.path else 'root'
-            errors.append(f"Schema validation error at '{path}': {error.message}")
+        for message in iter_schema_errors(data, schema):
+            if max_errors and len(errors) >= max_errors:
+                errors.append(schema_cap_message(max_errors))
+                break
+            errors.append(message)
     except Exception as e:
         errors.append(f"Schema validation exception: {str(e)}")
 
     return errors
 
-def validate_opportunities_file(filepath):
-    """Validate opportunities.json structure and content using JSON Schema"""
+def schema_cap_message(max_errors):
+    """Message recorded when schema validation stops early"""
+    return f"Schema validation stopped after {max_errors} errors (limit reached)"
+
+def schema_version(schema):
+    """
+    Identify the schema and QC rules a cached verdict was produced with.
+
+    Returns:
+        str: Hash of the schema document and QC_RULES_VERSION
+    """
+    encoded = json.dumps(schema, sort_keys=True) if schema else 'no-schema'
+    return hashlib.sha256(f"{QC_RULES_VERSION}|{encoded}".encode('utf-8')).hexdigest()[:16]
+
+def _shape(value):
+    """Reduce a volatile value to what validation sees: every digit is alike"""
+    return re.sub(r'\d', '0', value) if isinstance(value, str) else value
+
+def record_hash(opp):
+    """Hash the content of an opportunity record, keeping only the shape of volatile fields"""
+    if isinstance(opp, dict):
+        opp = {k: _shape(v) if k in VOLATILE_FIELDS else v for k, v in opp.items()}
+    encoded = json.dumps(opp, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def fill_placeholders(message, position, opp):
+    """Put a record's position and volatile values back into a cached message"""
+    message = message.replace(INDEX_PLACEHOLDER, position)
+    for field in VOLATILE_FIELDS:
+        if field in opp:
+            message = message.replace(f"{{{field}}}", str(opp[field]))
+    return message
+
+def load_qc_cache(cache_path, version):
+    """
+    Load cached per-record verdicts.
+
+    Returns an empty cache when the file is missing, unreadable or was
+    written for a different schema/rules version.
+    """
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if cache.get('version') != version:
+        return {}
+
+    return cache.get('records', {})
+
+def save_qc_cache(cache_path, version, records):
+    """Persist per-record verdicts (only records seen in this run are kept)"""
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": version, "records": records}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log_warning(f"Could not save QC cache: {str(e)}")
+
+def check_opportunity(opp, item_validator=None):
+    """
+    Run schema and field checks on a single opportunity.
+
+    Messages contain INDEX_PLACEHOLDER instead of the record position, and
+    '{<field>}' placeholders instead of VOLATILE_FIELDS values, so a verdict
+    can be cached by content and reused when the record moves or is re-scraped
+    (see fill_placeholders).
+
+    Args:
+        opp (dict): Opportunity record
+        item_validator: Validator for the opportunities item schema (optional)
+
+    Returns:
+        tuple: (errors, warnings)
+    """
+    errors = []
+    warnings = []
+    idx = INDEX_PLACEHOLDER
+
+    if not isinstance(opp, dict):
+        errors.append(f"Opportunity {idx}: Record must be an object")
+        return errors, warnings
+
+    opp_id = ID_PLACEHOLDER if 'id' in opp else 'unknown'
+
+    # Schema validation of the record
+    if item_validator is not None:
+        for error in sorted(item_validator.iter_errors(opp), key=lambda e: e.path):
+            message = _format_schema_error(error, prefix=('opportunities', idx))
+            field = error.path[0] if error.path else None
+            if field in VOLATILE_FIELDS and isinstance(opp[field], str):
+                message = message.replace(opp[field], f"{{{field}}}")
+            errors.append(message)
+
+    # Check required fields
+    for field in REQUIRED_OPP_FIELDS:
+        if field not in opp:
+            errors.append(f"Opportunity {idx}: Missing required field '{field}'")
+
+    # Validate category
+    if 'category' in opp and opp['category'] not in VALID_CATEGORIES:
+        warnings.append(f"Opportunity {idx} ({opp_id}): Invalid category '{opp['category']}' (expected: {VALID_CATEGORIES})")
+
+    # Validate timeline
+    if 'timeline' in opp:
+        timeline = opp['timeline']
+        for field in REQUIRED_TIMELINE_FIELDS:
+            if field not in timeline:
+                errors.append(f"Opportunity {idx} ({opp_id}): Missing timeline.{field}")
+
+        if 'urgency' in timeline and timeline['urgency'] not in VALID_URGENCIES:
+            errors.append(f"Opportunity {idx} ({opp_id}): Invalid urgency '{timeline['urgency']}' (expected: {VALID_URGENCIES})")
+
+    # Validate funding
+    if 'funding' in opp:
+        funding = opp['funding']
+        for field in REQUIRED_FUNDING_FIELDS:
+            if field not in funding:
+                errors.append(f"Opportunity {idx} ({opp_id}): Missing funding.{field}")
+
+        if 'amountUSD' in funding and not isinstance(funding['amountUSD'], (int, float)):
+            errors.append(f"Opportunity {idx} ({opp_id}): funding.amountUSD must be numeric")
+
+    # Check for topographic/LiDAR relevance
+    if 'title' in opp:
+        if not classify(opp['title'], opp.get('description', ''))[RELEVANT]:
+            # Check category as well
+            if opp.get('category') != 'DaaS':
+                title = opp.get('title', 'Unknown Title')
+                warnings.append(f"Opportunity '{title}' ({opp_id}): May not be topographic-related (no relevant keywords found in title or description)")
+
+    return errors, warnings
+
+@traced('qc.validate_opportunities_file')
+def validate_opportunities_file(filepath, cache_path=QC_CACHE_FILE, max_schema_errors=SCHEMA_MAX_ERRORS):
+    """
+    Validate opportunities.json structure and content using JSON Schema.
+
+    The file is streamed record by record, so memory stays bounded regardless
+    of corpus size. Per-record verdicts are cached by record content hash and
+    schema version, so only new or modified records are validated; the full
+    error and warning lists are reassembled from cached and fresh results.
+
+    Once a schema error beyond max_schema_errors is seen, remaining records
+    skip schema validation (their field checks still run, and those
+    partial verdicts are not cached).
+
+    Args:
+        filepath (str): Path to opportunities.json
+        cache_path (str): QC cache location, or None to validate everything
+        max_schema_errors (int): Schema error cap (None or 0 for no limit)
+
+    Returns:
+        tuple: (errors, warnings, data) where data['opportunities'] is an
+        OpportunityStream that re-reads the records from the file
+    """
     errors = []
     warnings = []
 
@@ -89,18 +417,77 @@ def validate_opportunities_file(filepath):
         errors.append(f"File not found: {filepath}")
         return errors, warnings, None
 
+    schema = load_schema()
+    item_validator = get_schema_validators(schema)[1] if schema else None
+    version = schema_version(schema)
+    cached = load_qc_cache(cache_path, version)
+
+    # Stream the file: records are validated (or looked up in the cache) one at
+    # a time, everything else at the top level is collected into `document`
+    log_info("Validating against JSON Schema...")
+    document = {}
+    fresh = {}
+    reused = 0
+    count = 0
+    has_array = False
+    record_errors = []
+    record_schema_errors = []
+    schema_capped = False
+
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        for event, key, value in iter_document(filepath):
+            if event == EVENT_FIELD:
+                document[key] = value
+                continue
+            if event == EVENT_ARRAY:
+                has_array = True
+                continue
+
+            idx, opp = key, value
+            count += 1
+            digest = record_hash(opp)
+            verdict = fresh.get(digest)
+            if verdict is None and digest in cached:
+                verdict = fresh[digest] = cached[digest]
+            if verdict is not None:
+                reused += 1
+            elif schema_capped and item_validator is not None:
+                verdict = check_opportunity(opp, None)
+            else:
+                verdict = check_opportunity(opp, item_validator)
+                fresh[digest] = verdict
+
+            opp_errors, opp_warnings = verdict
+            position = str(idx)
+            for message in opp_errors:
+                if message.startswith('Schema validation error'):
+                    if schema_capped:
+                        continue
+                    if max_schema_errors and len(record_schema_errors) >= max_schema_errors:
+                        # An error past the cap was seen, so the list really is truncated
+                        schema_capped = True
+                        continue
+                    record_schema_errors.append(fill_placeholders(message, position, opp))
+                else:
+                    record_errors.append(fill_placeholders(message, position, opp))
+            warnings.extend(fill_placeholders(message, position, opp) for message in opp_warnings)
     except json.JSONDecodeError as e:
         errors.append(f"Invalid JSON in {filepath}: {str(e)}")
-        return errors, warnings, None
+        return errors, [], None
 
-    # Load and validate against JSON Schema
-    log_info("Validating against JSON Schema...")
-    schema = load_schema()
+    # Document-level schema validation (records were validated above)
     if schema:
-        schema_errors = validate_with_schema(data, schema)
+        schema_errors = validate_with_schema(dict(document, opportunities=[]) if has_array else document,
+                                             schema, max_schema_errors)
+        if max_schema_errors:
+            # Same rule as validate_with_schema: only say so when errors were dropped
+            cap_message = schema_cap_message(max_schema_errors)
+            truncated = schema_capped or cap_message in schema_errors
+            schema_errors = [e for e in schema_errors if e != cap_message] + record_schema_errors
+            if truncated or len(schema_errors) > max_schema_errors:
+                schema_errors = schema_errors[:max_schema_errors] + [cap_message]
+        else:
+            schema_errors.extend(record_schema_errors)
         errors.extend(schema_errors)
         if schema_errors:
             log_warning(f"JSON Schema validation found {len(schema_errors)} error(s)")
@@ -108,76 +495,40 @@ def validate_opportunities_file(filepath):
             log_success("JSON Schema validation passed")
 
     # Check meta section
-    if 'meta' not in data:
+    if 'meta' not in document:
         errors.append("Missing 'meta' section")
     else:
-        meta = data['meta']
+        meta = document['meta']
         for field in ['market_val', 'cagr', 'updated', 'totalCount']:
             if field not in meta:
                 errors.append(f"Missing meta.{field}")
 
     # Check opportunities array
-    if 'opportunities' not in data:
-        errors.append("Missing 'opportunities' array")
-        return errors, warnings, data
+    if not has_array:
+        if 'opportunities' not in document:
+            errors.append("Missing 'opportunities' array")
+        else:
+            errors.append("'opportunities' must be an array")
+        return errors, warnings, document
 
-    opportunities = data['opportunities']
+    if count == 0:
+        warnings.insert(0, "No opportunities found (empty array)")
 
-    if not isinstance(opportunities, list):
-        errors.append("'opportunities' must be an array")
-        return errors, warnings, data
+    if cache_path:
+        save_qc_cache(cache_path, version, fresh)
+        log_info(f"QC cache: {reused} record verdict(s) reused, {count - reused} validated")
 
-    if len(opportunities) == 0:
-        warnings.append("No opportunities found (empty array)")
+    annotate(records=count, bytes=os.path.getsize(filepath), reused=reused)
 
-    # Validate each opportunity
-    for idx, opp in enumerate(opportunities):
-        # Check required fields
-        for field in REQUIRED_OPP_FIELDS:
-            if field not in opp:
-                errors.append(f"Opportunity {idx}: Missing required field '{field}'")
-
-        # Validate category
-        if 'category' in opp and opp['category'] not in VALID_CATEGORIES:
-            warnings.append(f"Opportunity {idx} ({opp.get('id', 'unknown')}): Invalid category '{opp['category']}' (expected: {VALID_CATEGORIES})")
-
-        # Validate timeline
-        if 'timeline' in opp:
-            timeline = opp['timeline']
-            for field in REQUIRED_TIMELINE_FIELDS:
-                if field not in timeline:
-                    errors.append(f"Opportunity {idx} ({opp.get('id', 'unknown')}): Missing timeline.{field}")
-
-            if 'urgency' in timeline and timeline['urgency'] not in VALID_URGENCIES:
-                errors.append(f"Opportunity {idx} ({opp.get('id', 'unknown')}): Invalid urgency '{timeline['urgency']}' (expected: {VALID_URGENCIES})")
-
-        # Validate funding
-        if 'funding' in opp:
-            funding = opp['funding']
-            for field in REQUIRED_FUNDING_FIELDS:
-                if field not in funding:
-                    errors.append(f"Opportunity {idx} ({opp.get('id', 'unknown')}): Missing funding.{field}")
-
-            if 'amountUSD' in funding and not isinstance(funding['amountUSD'], (int, float)):
-                errors.append(f"Opportunity {idx} ({opp.get('id', 'unknown')}): funding.amountUSD must be numeric")
-
-        # Check for topographic/LiDAR relevance
-        if 'title' in opp:
-            title_lower = opp['title'].lower()
-            description_lower = opp.get('description', '').lower()
-            combined_text = f"{title_lower} {description_lower}"
-            topographic_keywords = ['lidar', 'topographic', 'elevation', '3dep', 'dem', 'mapping', 'terrain']
-            if not any(keyword in combined_text for keyword in topographic_keywords):
-                # Check category as well
-                if opp.get('category') != 'DaaS':
-                    title = opp.get('title', 'Unknown Title')
-                    opp_id = opp.get('id', 'unknown')
-                    warnings.append(f"Opportunity '{title}' ({opp_id}): May not be topographic-related (no relevant keywords found in title or description)")
+    errors.extend(record_errors)
+
+    # Records are not kept in memory; consumers re-stream them from the file
+    data = dict(document, opportunities=OpportunityStream(filepath))
 
     # Validate meta.totalCount matches actual count
     if 'meta' in data and 'totalCount' in data['meta']:
-        if data['meta']['totalCount'] != len(opportunities):
-            errors.append(f"meta.totalCount ({data['meta']['totalCount']}) doesn't match actual count ({len(opportunities)})")
+        if data['meta']['totalCount'] != count:
+            errors.append(f"meta.totalCount ({data['meta']['totalCount']}) doesn't match actual count ({count})")
 
     return errors, warnings, data
 
@@ -230,70 +581,27 @@ def validate_forecast_file(filepath):
 
 def extract_country_from_pillar(pillar, agency):
     """Extract country from pillar or agency name"""
-    country_map = {
-        'Federal': 'USA',
-        'Commercial': 'USA',
-        'State': 'USA',
-        'USGS': 'USA',
-        'NASA': 'USA',
-        'NGA': 'USA',
-        'DIU': 'USA',
-        'USDA Forest Service': 'USA',
-        'JAXA': 'Japan',
-        'ISRO': 'India',
-        'DLR': 'Germany',
-        'ESA': 'Europe',
-        'EU Commission': 'Europe',
-        'UKSA': 'UK',
-        'CSA': 'Canada',
-        'CNSA': 'China'
-    }
-
     # Try agency first
-    if agency in country_map:
-        return country_map[agency]
+    if agency in COUNTRY_MAP:
+        return COUNTRY_MAP[agency]
 
     # Try pillar
-    if pillar in country_map:
-        return country_map[pillar]
+    if pillar in COUNTRY_MAP:
+        return COUNTRY_MAP[pillar]
 
     # Try to extract from pillar if it's descriptive
     pillar_lower = pillar.lower() if pillar else ''
-    if 'japan' in pillar_lower:
-        return 'Japan'
-    elif 'india' in pillar_lower:
-        return 'India'
-    elif 'germany' in pillar_lower or 'german' in pillar_lower:
-        return 'Germany'
-    elif 'europe' in pillar_lower or 'eu' in pillar_lower:
-        return 'Europe'
-    elif 'uk' in pillar_lower or 'britain' in pillar_lower:
-        return 'UK'
-    elif 'canada' in pillar_lower:
-        return 'Canada'
-    elif 'china' in pillar_lower:
-        return 'China'
+    for keywords, country in PILLAR_COUNTRY_KEYWORDS:
+        if any(keyword in pillar_lower for keyword in keywords):
+            return country
 
     # Default to Global if unknown
     return 'Global'
 
 def is_bathymetry_only(title, description):
     """Check if the opportunity is bathymetry-only (out of scope)"""
-    bathymetry_keywords = ['bathymetry', 'bathymetric', 'ocean floor', 'seafloor', 'underwater mapping',
-                           'subsea', 'seabed', 'marine survey', 'hydrographic', 'ocean depth']
-    topographic_keywords = ['lidar', 'topographic', 'elevation', '3dep', 'dem', 'terrain', 'dtm', 'dsm',
-                           'terrestrial', 'land surface', 'above water']
-
-    text = f"{title} {description}".lower()
-
-    # Check if bathymetry keywords present
-    has_bathymetry = any(keyword in text for keyword in bathymetry_keywords)
-
-    # Check if topographic keywords present
-    has_topographic = any(keyword in text for keyword in topographic_keywords)
-
     # It's bathymetry-only if it has bathymetry keywords but no topographic keywords
-    return has_bathymetry and not has_topographic
+    return classify(title, description)[OUT_OF_SCOPE]
 
 def validate_source(url):
     """Validate if a source URL is valid and not a placeholder"""
@@ -306,88 +614,108 @@ def validate_source(url):
 
     return False
 
+def _matrix_frame(opportunities):
+    """Load the fields the matrix needs into a DataFrame in one pass"""
+    import pandas as pd
+    records = opportunities if isinstance(opportunities, list) else list(opportunities)
+    frame = pd.DataFrame(records, columns=list(MATRIX_INPUT_FIELDS))
+
+    for field, default in MATRIX_INPUT_FIELDS.items():
+        column = frame[field]
+        if not column.isna().any():
+            continue
+        column = column.fillna(default)
+        # Missing keys turn integer columns into floats; restore them
+        if column.dtype.kind == 'f' and (column % 1 == 0).all():
+            column = column.astype('int64')
+        frame[field] = column
+
+    return frame
+
+def _country_column(agency, pillar):
+    """Vectorized extract_country_from_pillar using a per-pillar lookup table"""
+    country = agency.map(COUNTRY_MAP)
+    country = country.fillna(pillar.map(COUNTRY_MAP))
+
+    # Descriptive pillars repeat heavily, so resolve each distinct value once
+    unresolved = country.isna()
+    pillar_lookup = {p: extract_country_from_pillar(p, None) for p in pillar[unresolved].unique()}
+    return country.fillna(pillar[unresolved].map(pillar_lookup))
+
+def _valid_source_mask(urls):
+    """Vectorized validate_source: True where the URL is a real http(s) link"""
+    return urls.where(urls.map(lambda url: isinstance(url, str)), '').str.startswith(('http://', 'https://'))
+
+def _sources_column(frame):
+    """Join the valid source links of each row with '; ' (or NO_SOURCE)"""
+    import pandas as pd
+    sources = pd.Series('', index=frame.index, dtype=object)
+    for column in SOURCE_LINK_FIELDS:
+        valid = _valid_source_mask(frame[column])
+        separator = pd.Series('', index=frame.index, dtype=object).mask(valid & (sources != ''), '; ')
+        sources = sources + separator + frame[column].where(valid, '')
+    return sources
+
+def _bathymetry_only_mask(titles, descriptions):
+    """Batch is_bathymetry_only over the combined title/description text"""
+    import pandas as pd
+    text = titles.astype(str) + ' ' + descriptions.astype(str)
+    flags = classify_batch(text)
+    return pd.Series([f[OUT_OF_SCOPE] for f in flags], index=titles.index, dtype=bool)
+
+def _log_flagged_rows(message, frame, mask):
+    """Log a warning for the first few flagged rows and a count for the rest"""
+    flagged = frame.loc[mask, ['title', 'id']]
+    for title, opp_id in flagged.head(MATRIX_WARNING_SAMPLE).itertuples(index=False):
+        log_warning(f"{message}: {title} ({opp_id})")
+    if len(flagged) > MATRIX_WARNING_SAMPLE:
+        log_warning(f"{message}: ... and {len(flagged) - MATRIX_WARNING_SAMPLE} more")
+
+@traced('qc.generate_source_verification_matrix')
 def generate_source_verification_matrix(opportunities_data):
     """
     Generate source verification matrix from opportunities data
+
+    Built column-wise: the records are loaded into a DataFrame once and
+    country, sources and bathymetry flags are derived with vectorized
+    operations rather than per-row Python calls.
+
     Returns: pandas DataFrame with verification matrix
     """
+    import pandas as pd
     log_info("Generating source verification matrix...")
 
     if not opportunities_data or 'opportunities' not in opportunities_data:
         log_error("No opportunities data available for matrix generation")
         return None, 0, 0
 
-    opportunities = opportunities_data['opportunities']
-    matrix_rows = []
-    missing_sources_count = 0
-    bathymetry_flagged_count = 0
-
-    for idx, opp in enumerate(opportunities):
-        # Extract base fields
-        agency_name = opp.get('agency', 'Unknown')
-        program_name = opp.get('title', 'Unknown')
-        budget_amount_usd = opp.get('amountUSD', 0)
-        nuview_priority_score = opp.get('priorityScore', 0)
-        data_access = opp.get('category', 'Unknown')
-        pillar = opp.get('pillar', '')
-        description = opp.get('description', '')
-
-        # Extract country
-        country = extract_country_from_pillar(pillar, agency_name)
-
-        # Collect all sources
-        link = opp.get('link', '')
-        budget_source_link = opp.get('budgetSourceLink', '')
-        agency_link = opp.get('agencyLink', '')
-
-        # Build sources string
-        valid_sources = []
-        if validate_source(link):
-            valid_sources.append(link)
-        if validate_source(budget_source_link):
-            valid_sources.append(budget_source_link)
-        if validate_source(agency_link):
-            valid_sources.append(agency_link)
-
-        sources_str = '; '.join(valid_sources) if valid_sources else 'NO_SOURCE'
-
-        # Check if bathymetry-only
-        is_bathy_only = is_bathymetry_only(program_name, description)
-
-        # Build verification note
-        verification_notes = []
-
-        if not valid_sources:
-            verification_notes.append('MISSING_SOURCE')
-            missing_sources_count += 1
-            log_warning(f"Missing source for opportunity: {program_name} ({opp.get('id', 'unknown')})")
-        else:
-            verification_notes.append('SOURCE_VERIFIED')
-
-        if is_bathy_only:
-            verification_notes.append('BATHYMETRY_ONLY_FLAGGED')
-            bathymetry_flagged_count += 1
-            log_warning(f"Bathymetry-only flagged: {program_name} ({opp.get('id', 'unknown')})")
-
-        verification = ', '.join(verification_notes) if verification_notes else 'VERIFIED'
-
-        # Create row
-        row = {
-            'textrank': idx + 1,  # Initial rank, will be re-sorted by priority
-            'country': country,
-            'agency_name': agency_name,
-            'program_name': program_name,
-            'budget_amount_usd': budget_amount_usd,
-            'nuview_priority_score': nuview_priority_score,
-            'data_access': data_access,
-            'sources': sources_str,
-            'verification': verification
-        }
-
-        matrix_rows.append(row)
-
-    # Create DataFrame
-    df = pd.DataFrame(matrix_rows)
+    frame = _matrix_frame(opportunities_data['opportunities'])
+    annotate(records=len(frame))
+
+    sources = _sources_column(frame)
+    missing = sources == ''
+    bathy_only = _bathymetry_only_mask(frame['title'], frame['description'])
+    missing_sources_count = int(missing.sum())
+    bathymetry_flagged_count = int(bathy_only.sum())
+
+    _log_flagged_rows("Missing source for opportunity", frame, missing)
+    _log_flagged_rows("Bathymetry-only flagged", frame, bathy_only)
+
+    # Build verification note
+    verification = pd.Series('SOURCE_VERIFIED', index=frame.index, dtype=object).mask(missing, 'MISSING_SOURCE')
+    verification = verification.mask(bathy_only, verification + ', BATHYMETRY_ONLY_FLAGGED')
+
+    df = pd.DataFrame({
+        'textrank': range(1, len(frame) + 1),  # Initial rank, will be re-sorted by priority
+        'country': _country_column(frame['agency'], frame['pillar']),
+        'agency_name': frame['agency'],
+        'program_name': frame['title'],
+        'budget_amount_usd': frame['amountUSD'],
+        'nuview_priority_score': frame['priorityScore'],
+        'data_access': frame['category'],
+        'sources': sources.mask(missing, 'NO_SOURCE'),
+        'verification': verification
+    })
 
     # Sort by priority score (descending) and re-assign textrank
     df = df.sort_values(by='nuview_priority_score', ascending=False).reset_index(drop=True)
@@ -415,16 +743,58 @@ def generate_source_verification_matrix(opportunities_data):
     return df, missing_sources_count, bathymetry_flagged_count
 
 def export_source_matrix(df, output_path='data/processed/sources_matrix.csv'):
-    """Export source verification matrix to CSV"""
+    """Export source verification matrix to CSV (plus Parquet/Arrow copies when available)"""
     try:
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df.to_csv(output_path, index=False)
+        columnar = write_matrix(df, output_path, SOURCES_MATRIX_DTYPES)
         log_success(f"Source matrix exported to {output_path}")
+        for path in columnar:
+            log_info(f"Columnar copy written to {path}")
         return True
     except Exception as e:
         log_error(f"Failed to export source matrix: {str(e)}")
         return False
 
+def qc_error_type(message):
+    """Classify a QC error message for the metrics export"""
+    text = RECORD_PREFIX.sub('', message, count=1)
+    for prefix, error_type in QC_ERROR_TYPES:
+        if text.startswith(prefix):
+            return error_type
+    return 'invalid_value'
+
+def export_qc_metrics(opp_errors, opp_warnings, forecast_errors, forecast_warnings, qc_pass, matrix_stats=None):
+    """
+    Write QC results as a Prometheus textfile (qc.prom).
+
+    Returns:
+        str: Path of the written file, or None if it could not be written
+    """
+    registry = MetricsRegistry()
+    errors = registry.gauge('nuview_qc_errors', 'QC errors in the last run by file and type', ['file', 'type'])
+    warnings = registry.gauge('nuview_qc_warnings', 'QC warnings in the last run by file', ['file'])
+    passed = registry.gauge('nuview_qc_pass', '1 if the last QC run passed, else 0')
+    missing_sources = registry.gauge('nuview_qc_missing_sources', 'Opportunities without a source link')
+    bathymetry_flagged = registry.gauge('nuview_qc_bathymetry_flagged', 'Opportunities flagged as bathymetry-only')
+    last_run = registry.gauge('nuview_qc_last_run_timestamp_seconds', 'Unix time of the last QC run')
+
+    for file_name, file_errors, file_warnings in [('opportunities', opp_errors, opp_warnings),
+                                                  ('forecast', forecast_errors, forecast_warnings)]:
+        for message in file_errors:
+            errors.inc(file=file_name, type=qc_error_type(message))
+        warnings.set(len(file_warnings), file=file_name)
+
+    passed.set(1 if qc_pass else 0)
+    if matrix_stats:
+        missing_sources.set(matrix_stats['missing_sources'])
+        bathymetry_flagged.set(matrix_stats['bathymetry_flagged'])
+    last_run.set(datetime.now(timezone.utc).timestamp())
+
+    try:
+        return write_textfile(registry, QC_METRICS_NAME)
+    except OSError as e:
+        log_warning(f"Could not write QC metrics: {e}")
+        return None
+
 def generate_qc_report(opp_errors, opp_warnings, forecast_errors, forecast_warnings, matrix_export_status=None, matrix_stats=None):
     """Generate QC report JSON"""
     total_errors = len(opp_errors) + len(forecast_errors)
@@ -462,17 +832,51 @@ def generate_qc_report(opp_errors, opp_warnings, forecast_errors, forecast_warni
 
     return report, qc_pass
 
-def main():
-    """Main QC validation logic"""
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="NUVIEW topographic pipeline QC validation")
+    parser.add_argument('--max-schema-errors', type=int, default=SCHEMA_MAX_ERRORS,
+                        help='Stop schema validation after this many errors, 0 for no limit '
+                             f'(default: {SCHEMA_MAX_ERRORS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Validate every record instead of reusing cached verdicts')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Write per-stage tracemalloc snapshots and peak RSS to data/metrics')
+    profiling.add_profile_argument(parser)
+    return parser.parse_args(argv)
+
+@traced('qc_validator', run=True)
+@memory_profiled('qc_validator')
+@profiled('qc_validator')
+def main(argv=None, ctx=None):
+    """
+    Main QC validation logic
+
+    Args:
+        argv (list): Command line arguments (defaults to sys.argv)
+        ctx (QCContext): Shared QC inputs when run in-process by another stage
+    """
+    args = parse_args(argv)
+    if args.profile_memory:
+        memory_profile.start('qc_validator')
+    if args.profile:
+        profiling.start('qc_validator', args.profile)
+
     log_info("=" * 60)
     log_info("NUVIEW TOPOGRAPHIC PIPELINE - QC VALIDATION")
     log_info("=" * 60)
 
     # Validate opportunities.json
-    opp_errors, opp_warnings, opp_data = validate_opportunities_file('data/opportunities.json')
+    opp_errors, opp_warnings, opp_data = validate_opportunities_file(
+        'data/opportunities.json',
+        cache_path=None if args.no_cache else QC_CACHE_FILE,
+        max_schema_errors=args.max_schema_errors
+    )
+    checkpoint('qc.validate_opportunities')
 
     # Validate forecast.json
     forecast_errors, forecast_warnings, forecast_data = validate_forecast_file('data/forecast.json')
+    checkpoint('qc.validate_forecast')
 
     # Generate source verification matrix
     log_info("")
@@ -484,10 +888,17 @@ def main():
     matrix_stats = None
 
     if opp_data and 'opportunities' in opp_data:
+        if ctx is not None:
+            # Build from the shared parsed records instead of re-streaming the file
+            opp_data = dict(opp_data, opportunities=ctx.opportunities)
         matrix_df, missing_sources, bathymetry_flagged = generate_source_verification_matrix(opp_data)
+        checkpoint('qc.generate_source_matrix')
 
         if matrix_df is not None:
             matrix_export_status = export_source_matrix(matrix_df)
+            checkpoint('qc.export_source_matrix')
+            if ctx is not None:
+                ctx.invalidate('sources_matrix')
 
             # Collect statistics
             matrix_stats = {
@@ -512,6 +923,10 @@ def main():
     log_info("")
     log_info("=" * 60)
     log_info(f"QC report saved to {report_path}")
+    metrics_path = export_qc_metrics(opp_errors, opp_warnings, forecast_errors, forecast_warnings,
+                                     qc_pass, matrix_stats)
+    if metrics_path:
+        log_info(f"QC metrics saved to {metrics_path}")
     log_info("")
 
     # Display results
@@ -525,7 +940,8 @@ def main():
     if opp_warnings:
         log_warning(f"Opportunities validation: {len(opp_warnings)} warning(s)")
         for warn in opp_warnings:
-            log_warning(f"  • {warn}")
+            log_repeated(log, f"Opportunities {qc_error_type(warn)}", f"  • {warn}")
+        flush_repeated()
 
     log_info("")
 
@@ -539,7 +955,8 @@ def main():
     if forecast_warnings:
         log_warning(f"Forecast validation: {len(forecast_warnings)} warning(s)")
         for warn in forecast_warnings:
-            log_warning(f"  • {warn}")
+            log_repeated(log, f"Forecast {qc_error_type(warn)}", f"  • {warn}")
+        flush_repeated()
 
     log_info("")
 
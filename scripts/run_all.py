@@ -2,19 +2,32 @@
 """
 NUVIEW Strategic Pipeline - Run All Scrapers
 Convenience script to run all scrapers and display results
-Usage: python scripts/run_all.py
+Usage: python scripts/run_all.py [--profile cpu]
 """
 
+import argparse
 import os
 import sys
 
 # Add scripts directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+import profiling  # noqa: E402
+from profiling import profiled  # noqa: E402
+
 # Import and run the scraper pipeline
-from scrapers.scrape_all import run_pipeline
+from scrapers.scrape_all import run_pipeline  # noqa: E402
+
+
+@profiled('run_all')
+def main(argv=None):
+    """Run the scraper pipeline and print where its outputs are"""
+    parser = argparse.ArgumentParser(description='Run all NUVIEW scrapers')
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    if args.profile:
+        profiling.start('run_all', args.profile)
 
-if __name__ == "__main__":
     print("=" * 80)
     print("NUVIEW STRATEGIC PIPELINE - RUN ALL SCRAPERS")
     print("=" * 80)
@@ -32,3 +45,6 @@ if __name__ == "__main__":
     print("- Check data/forecast.json for market forecast")
     print("- Expected: ~128 opportunities from 68 scrapers")
     print("=" * 80)
+
+if __name__ == "__main__":
+    main()
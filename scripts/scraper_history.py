@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Scraper Run History
+Per-scraper latency and yield across sweeps, with regression detection
+
+scraper_stats.json only describes the latest sweep. Every sweep also appends
+one row per scraper (duration, records, bytes, error) to a SQLite store at
+data/history/scraper_history.sqlite, keeping the most recent
+HISTORY_RUNS_PER_SCRAPER runs of each scraper.
+
+The history is used in two ways:
+- the report command compares each scraper's recent runs against its
+  earlier baseline and flags p95 latency or yield regressions;
+- expected_durations() gives scrape_all a per-scraper runtime estimate so
+  the slowest sources are started first.
+
+Usage:
+    python scripts/scraper_history.py report
+    python scripts/scraper_history.py report --recent 5 --window 30 --threshold 1.5
+"""
+
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+
+from pipeline_log import SUCCESS, get_logger
+
+HISTORY_FILE = 'data/history/scraper_history.sqlite'
+
+# Runs kept per scraper; older rows are pruned on every write
+HISTORY_RUNS_PER_SCRAPER = 200
+
+# Report defaults: the last RECENT_RUNS runs are compared with the
+# BASELINE_RUNS runs before them
+RECENT_RUNS = 5
+BASELINE_RUNS = 30
+REGRESSION_THRESHOLD = 1.5
+
+# Minimum baseline runs before a scraper is judged
+MIN_BASELINE_RUNS = 3
+
+# Latency increases smaller than this are treated as noise
+MIN_LATENCY_INCREASE = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scraper_runs (
+    run_id TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    scraper TEXT NOT NULL,
+    source_type TEXT,
+    country TEXT,
+    duration_seconds REAL,
+    records INTEGER,
+    bytes INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS scraper_runs_by_scraper ON scraper_runs (scraper, started_at);
+"""
+
+log = get_logger('scraper_history')
+
+def log_info(msg):
+    log.info(msg)
+
+def log_success(msg):
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def connect(path=HISTORY_FILE):
+    """Open (and create if needed) the history store"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def record_run(scraper_stats, run_id, started_at, path=HISTORY_FILE):
+    """
+    Append one sweep's per-scraper results and prune old runs.
+
+    Args:
+        scraper_stats (list): Stat dicts from scrape_all.run_single_scraper
+                              (scraper, source_type, country, duration_seconds,
+                              opportunities_found, bytes, error)
+        run_id (str): Sweep identifier
+        started_at (str): ISO timestamp of the sweep
+
+    Returns:
+        int: Rows written
+    """
+    rows = [
+        (run_id, started_at, stat['scraper'], stat.get('source_type'), stat.get('country'),
+         stat.get('duration_seconds'), stat.get('opportunities_found', 0), stat.get('bytes', 0),
+         stat.get('error'))
+        for stat in scraper_stats
+    ]
+
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO scraper_runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("""
+            DELETE FROM scraper_runs WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid, ROW_NUMBER() OVER (PARTITION BY scraper ORDER BY started_at DESC) AS age
+                    FROM scraper_runs
+                ) WHERE age > ?
+            )
+        """, (HISTORY_RUNS_PER_SCRAPER,))
+    conn.close()
+    return len(rows)
+
+def load_history(path=HISTORY_FILE, limit=BASELINE_RUNS + RECENT_RUNS):
+    """
+    Load the most recent runs of every scraper.
+
+    Returns:
+        dict: scraper -> list of (duration_seconds, records, error), newest first
+    """
+    if not os.path.exists(path):
+        return {}
+
+    conn = connect(path)
+    try:
+        rows = conn.execute("""
+            SELECT scraper, duration_seconds, records, error FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY scraper ORDER BY started_at DESC) AS age
+                FROM scraper_runs
+            ) WHERE age <= ? ORDER BY scraper, age
+        """, (limit,)).fetchall()
+    finally:
+        conn.close()
+
+    history = {}
+    for scraper, duration, records, error in rows:
+        history.setdefault(scraper, []).append((duration, records, error))
+    return history
+
+def percentile(values, q):
+    """
+    Linear-interpolated percentile.
+
+    Args:
+        values (list): Numbers (need not be sorted)
+        q (float): Percentile in [0, 100]
+
+    Returns:
+        float: The percentile, or None for no values
+    """
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def expected_durations(path=HISTORY_FILE, window=BASELINE_RUNS):
+    """
+    Estimate each scraper's runtime as the p95 of its recent successful runs.
+
+    Returns:
+        dict: scraper -> seconds (scrapers without history are absent)
+    """
+    estimates = {}
+    for scraper, runs in load_history(path, window).items():
+        p95 = percentile([duration for duration, _records, error in runs if not error], 95)
+        if p95 is not None:
+            estimates[scraper] = p95
+    return estimates
+
+def regression_report(path=HISTORY_FILE, recent=RECENT_RUNS, window=BASELINE_RUNS,
+                      threshold=REGRESSION_THRESHOLD):
+    """
+    Compare each scraper's recent runs with its baseline.
+
+    A scraper is flagged when its recent p95 latency exceeds the baseline
+    p95 by more than `threshold` times (and by at least
+    MIN_LATENCY_INCREASE seconds), or its recent median yield (records
+    per run) moves outside [baseline / threshold, baseline * threshold].
+
+    Returns:
+        list: One dict per scraper with recent/baseline p50 and p95 latency,
+              median yield, error counts and a list of 'flags'
+    """
+    report = []
+    for scraper, runs in sorted(load_history(path, recent + window).items()):
+        recent_runs, baseline_runs = runs[:recent], runs[recent:]
+        entry = {
+            'scraper': scraper,
+            'runs': len(runs),
+            'recent_p50': percentile([r[0] for r in recent_runs], 50),
+            'recent_p95': percentile([r[0] for r in recent_runs], 95),
+            'baseline_p50': percentile([r[0] for r in baseline_runs], 50),
+            'baseline_p95': percentile([r[0] for r in baseline_runs], 95),
+            'recent_yield': percentile([r[1] for r in recent_runs], 50),
+            'baseline_yield': percentile([r[1] for r in baseline_runs], 50),
+            'recent_errors': sum(1 for r in recent_runs if r[2]),
+            'flags': [],
+        }
+
+        if len(baseline_runs) >= MIN_BASELINE_RUNS:
+            if entry['baseline_p95'] is not None and entry['recent_p95'] is not None and \
+                    entry['recent_p95'] > entry['baseline_p95'] * threshold and \
+                    entry['recent_p95'] - entry['baseline_p95'] >= MIN_LATENCY_INCREASE:
+                entry['flags'].append('latency')
+            if entry['baseline_yield'] is not None and entry['recent_yield'] is not None:
+                if entry['recent_yield'] * threshold < entry['baseline_yield'] or \
+                        entry['recent_yield'] > entry['baseline_yield'] * threshold:
+                    entry['flags'].append('yield')
+        if entry['recent_errors']:
+            entry['flags'].append('errors')
+
+        report.append(entry)
+    return report
+
+def _fmt(value, spec='.3f'):
+    return '-' if value is None else format(value, spec)
+
+def print_report(report, threshold):
+    """Log the regression report as a table (flagged rows as warnings)"""
+    log_info(f"{'scraper':<32} {'runs':>5} {'p95 s':>9} {'base p95':>9} {'yield':>7} {'base':>7}  flags")
+    for entry in report:
+        line = (f"{entry['scraper']:<32} {entry['runs']:>5} {_fmt(entry['recent_p95']):>9} "
+                f"{_fmt(entry['baseline_p95']):>9} {_fmt(entry['recent_yield'], '.0f'):>7} "
+                f"{_fmt(entry['baseline_yield'], '.0f'):>7}  {', '.join(entry['flags'])}")
+        if entry['flags']:
+            log_warning(line)
+        else:
+            log_info(line)
+
+    flagged = [e for e in report if e['flags']]
+    log_info("")
+    if flagged:
+        log_warning(f"{len(flagged)} of {len(report)} scrapers deviate beyond {threshold}x of their baseline")
+    else:
+        log_success(f"No scraper deviates beyond {threshold}x of its baseline ({len(report)} scrapers)")
+
+def main(argv=None):
+    """Print the per-scraper regression report"""
+    parser = argparse.ArgumentParser(description='Scraper latency and yield history')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    report_parser = subparsers.add_parser('report', help='Flag scrapers whose latency or yield regressed')
+    report_parser.add_argument('--history', default=HISTORY_FILE, help='History store path')
+    report_parser.add_argument('--recent', type=int, default=RECENT_RUNS, help='Recent runs compared')
+    report_parser.add_argument('--window', type=int, default=BASELINE_RUNS, help='Baseline runs before them')
+    report_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                               help='Deviation factor that flags a scraper')
+    report_parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.history):
+        log_info(f"No history yet at {args.history}")
+        return 0
+
+    report = regression_report(args.history, args.recent, args.window, args.threshold)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.threshold)
+    return 1 if any(e['flags'] for e in report) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@ Orchestrates all 68 specialized scrapers for topographic/LiDAR opportunities
 Focus: Space-based LiDAR for large-area topographic collections (bare-earth/DEM/DSM)
 """
 
+import argparse
 import json
 import os
 import sys
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
@@ -14,6 +16,28 @@ from datetime import datetime, timezone
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, os.path.dirname(__file__))
 
+import memory_profile
+import profiling
+from change_feed import compute_changes, load_previous_opportunities, summarize_changes, write_changes
+from memory_profile import checkpoint, memory_profiled
+from metrics import (
+    SCRAPER_BYTES,
+    SCRAPER_DURATION,
+    SCRAPER_ERRORS,
+    SCRAPER_METRICS,
+    SCRAPER_RECORDS,
+    SWEEP_DURATION,
+    SWEEP_LAST_SUCCESS,
+    SWEEP_OPPORTUNITIES,
+    write_textfile,
+)
+from pipeline_log import SUCCESS, get_logger
+from profiling import profiled
+from scraper_history import expected_durations, record_run
+from tracing import annotate, span, traced
+
+log = get_logger('scrape_all')
+
 # Import all scraper modules
 try:
     from scrapers.additional_international_scrapers import (
@@ -96,24 +120,75 @@ try:
     )
     SCRAPERS_AVAILABLE = True
 except ImportError as e:
-    print(f"⚠️  Warning: Could not import scrapers: {e}")
-    print("⚠️  Falling back to basic mode")
+    log.warning(f"Could not import scrapers: {e}")
+    log.warning("Falling back to basic mode")
     SCRAPERS_AVAILABLE = False
 
 OUTPUT_FILE = "data/opportunities.json"
 FORECAST_FILE = "data/forecast.json"
 
-# Color codes for console output
-COLOR_GREEN = '\033[92m'
-COLOR_BLUE = '\033[94m'
-COLOR_RESET = '\033[0m'
+# Thread pool size for the sweep
+MAX_WORKERS = 10
+
+# Scheduling priority classes (lower starts earlier); scrapers not listed
+# are DEFAULT_PRIORITY. Within a class the longest expected runs start first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+DEFAULT_PRIORITY = PRIORITY_NORMAL
+SCRAPER_PRIORITIES = {
+    'USGS 3DEP': PRIORITY_HIGH,
+    'NASA Space LiDAR': PRIORITY_HIGH,
+    'NOAA Coastal': PRIORITY_HIGH,
+    'NGA Geoint': PRIORITY_HIGH,
+}
 
 def log_info(msg):
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg):
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
+
+def log_warning(msg):
+    log.warning(msg)
+
+def schedule_scrapers(scrapers, estimates, priorities=SCRAPER_PRIORITIES):
+    """
+    Order scrapers for submission: by priority class, then longest first.
 
+    Submitting the longest jobs first (LPT scheduling) keeps a slow source
+    from starting late and running alone at the end of the sweep. Scrapers
+    without timing history are treated as longest in their class.
+
+    Args:
+        scrapers (list): Scraper instances
+        estimates (dict): scraper name -> expected seconds (from run history)
+        priorities (dict): scraper name -> priority class
+
+    Returns:
+        list: Scrapers in submission order
+    """
+    def key(scraper):
+        return (priorities.get(scraper.name, DEFAULT_PRIORITY), -estimates.get(scraper.name, float('inf')))
+    return sorted(scrapers, key=key)
+
+def estimate_makespan(durations, workers=MAX_WORKERS):
+    """
+    Expected sweep wall time when jobs are started in the given order.
+
+    Args:
+        durations (list): Expected seconds per job, in submission order
+        workers (int): Thread pool size
+
+    Returns:
+        float: Time the last job finishes
+    """
+    finish_times = [0.0] * workers
+    for duration in durations:
+        slot = finish_times.index(min(finish_times))
+        finish_times[slot] += duration
+    return max(finish_times) if durations else 0.0
+
+@traced('scrape_all.run_single_scraper')
 def run_single_scraper(scraper, index, total):
     """
     Run a single scraper and return its results.
@@ -126,33 +201,50 @@ def run_single_scraper(scraper, index, total):
     Returns:
         tuple: (opportunities, stat_dict)
     """
+    started = time.perf_counter()
     try:
         log_info(f"[{index}/{total}] Running {scraper.name}...")
+        annotate(scraper=scraper.name)
         opportunities = scraper.scrape()
         count = len(opportunities)
+        duration = time.perf_counter() - started
+        # Size of the records as they are written to opportunities.json
+        nbytes = len(json.dumps(opportunities, ensure_ascii=False, default=str).encode('utf-8'))
+        annotate(records=count, bytes=nbytes)
+        SCRAPER_DURATION.observe(duration, scraper=scraper.name)
+        SCRAPER_RECORDS.inc(count, scraper=scraper.name)
+        SCRAPER_BYTES.inc(nbytes, scraper=scraper.name)
 
         stat = {
             "scraper": scraper.name,
             "source_type": scraper.source_type,
             "country": scraper.country,
-            "opportunities_found": count
+            "opportunities_found": count,
+            "duration_seconds": round(duration, 4),
+            "bytes": nbytes
         }
 
         log_success(f"  {scraper.name}: {count} opportunities collected")
         return opportunities, stat
 
     except Exception as e:
-        log_info(f"  ⚠️  {scraper.name}: Error - {str(e)}")
+        log_warning(f"  {scraper.name}: Error - {str(e)}")
+        duration = time.perf_counter() - started
+        SCRAPER_DURATION.observe(duration, scraper=scraper.name)
+        SCRAPER_ERRORS.inc(scraper=scraper.name)
         stat = {
             "scraper": scraper.name,
             "source_type": scraper.source_type,
             "country": scraper.country,
             "opportunities_found": 0,
+            "duration_seconds": round(duration, 4),
+            "bytes": 0,
             "error": str(e)
         }
         return [], stat
 
 
+@traced('scrape_all.run_all_scrapers')
 def run_all_scrapers():
     """
     Run all 34 specialized scrapers and collect opportunities.
@@ -258,7 +350,17 @@ def run_all_scrapers():
     log_info(f"Running {total_scrapers} specialized scrapers in parallel...")
     log_info("")
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    # High-priority sources first, then the historically slowest scrapers
+    # so they do not end up alone at the tail of the sweep
+    estimates = expected_durations()
+    scrapers = schedule_scrapers(scrapers, estimates)
+    if estimates and all(s.name in estimates for s in scrapers):
+        makespan = estimate_makespan([estimates[s.name] for s in scrapers])
+        log_info(f"Scheduling by priority and run history (expected sweep time {makespan:.1f}s)")
+    elif estimates:
+        log_info(f"Scheduling by priority and run history: {len(estimates)} scrapers with timing data")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         # Submit all scraper tasks
         future_to_scraper = {
             executor.submit(run_single_scraper, scraper, i, total_scrapers): scraper
@@ -276,14 +378,32 @@ def run_all_scrapers():
 
     return all_opportunities, scraper_stats
 
-def run_pipeline():
-    """Main pipeline execution"""
-    print("=" * 80)
+@traced('daily_sweep', run=True)
+@memory_profiled('daily_sweep')
+@profiled('daily_sweep')
+def run_pipeline(profile_memory=False, profile=None):
+    """
+    Main pipeline execution
+
+    Args:
+        profile_memory (bool): Write a tracemalloc report of each stage (see memory_profile.py)
+        profile (str): Profiling mode ('cpu') for a .pstats and collapsed-stack profile (see profiling.py)
+
+    Returns:
+        dict: The opportunities.json document that was written
+    """
+    if profile_memory:
+        memory_profile.start('daily_sweep')
+    if profile:
+        profiling.start('daily_sweep', profile)
+    log_info("=" * 80)
     log_info("🕷️  NUVIEW STRATEGIC PIPELINE - DAILY GLOBAL TOPOGRAPHIC SWEEP")
-    print("=" * 80)
+    log_info("=" * 80)
     log_info("")
 
-    current_time = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    sweep_time = datetime.now(timezone.utc)
+    sweep_started = time.perf_counter()
+    current_time = sweep_time.isoformat().replace('+00:00', 'Z')
 
     # Ensure data directory exists
     os.makedirs('data', exist_ok=True)
@@ -296,6 +416,7 @@ def run_pipeline():
         log_info("Using basic test data...")
         opportunities = []
         scraper_stats = []
+    checkpoint('run_all_scrapers')
 
     # If no opportunities from scrapers, use minimal test data
     if len(opportunities) == 0:
@@ -333,10 +454,25 @@ def run_pipeline():
         "opportunities": opportunities
     }
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(final_opps_json, f, indent=2, ensure_ascii=False, sort_keys=True)
+    # Diff against the previous sweep before it is overwritten
+    with span('scrape_all.compute_changes'):
+        previous_opportunities = load_previous_opportunities(OUTPUT_FILE)
+        changes = compute_changes(previous_opportunities, opportunities)
+        del previous_opportunities
+    checkpoint('compute_changes')
+
+    with span('scrape_all.write_opportunities', records=len(opportunities)) as write_span:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(final_opps_json, f, indent=2, ensure_ascii=False, sort_keys=True)
+        write_span.set(bytes=os.path.getsize(OUTPUT_FILE))
 
     log_success(f"Saved {len(opportunities)} opportunities to {OUTPUT_FILE}")
+    checkpoint('write_opportunities')
+
+    changes_file = write_changes(changes, sweep_time)
+    summary = summarize_changes(changes)
+    log_success(f"Saved change feed to {changes_file}: {summary['added']} added, "
+                f"{summary['removed']} removed, {summary['modified']} modified")
 
     # Save scraper statistics if available
     if scraper_stats:
@@ -350,6 +486,13 @@ def run_pipeline():
             }, f, indent=2, ensure_ascii=False, sort_keys=True)
         log_success(f"Saved scraper statistics to {stats_file}")
 
+        # Append to the per-scraper latency/yield history
+        try:
+            rows = record_run(scraper_stats, run_id=current_time, started_at=current_time)
+            log_success(f"Appended {rows} scraper runs to the run history")
+        except Exception as e:
+            log_warning(f"Could not update scraper run history: {e}")
+
     # Generate market forecast (forecast.json)
     forecast_data = {
         "current_year": 2025,
@@ -367,10 +510,27 @@ def run_pipeline():
 
     log_success(f"Saved market forecast to {FORECAST_FILE}")
 
+    # Export fleet metrics for the node exporter textfile collector
+    SWEEP_DURATION.set(time.perf_counter() - sweep_started)
+    SWEEP_OPPORTUNITIES.set(len(opportunities))
+    SWEEP_LAST_SUCCESS.set(time.time())
+    try:
+        metrics_file = write_textfile(SCRAPER_METRICS, 'scraper_fleet')
+        log_success(f"Saved scraper metrics to {metrics_file}")
+    except OSError as e:
+        log_warning(f"Could not write scraper metrics: {e}")
+
     log_info("")
-    print("=" * 80)
+    log_info("=" * 80)
     log_success("🎯 DAILY GLOBAL TOPOGRAPHIC SWEEP COMPLETE")
-    print("=" * 80)
+    log_info("=" * 80)
+
+    return final_opps_json
 
 if __name__ == "__main__":
-    run_pipeline()
+    parser = argparse.ArgumentParser(description='NUVIEW daily global topographic sweep')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Write per-stage tracemalloc snapshots and peak RSS to data/metrics')
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args()
+    run_pipeline(profile_memory=args.profile_memory, profile=args.profile)
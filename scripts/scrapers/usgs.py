@@ -1,12 +1,13 @@
-import logging
+import os
 import re
+import sys
 
-import pdfplumber
-import requests
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-# Configure logging for NUVIEW
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from domain_classifier import classify_text
+from pipeline_log import get_logger
+
+logger = get_logger('usgs')
 
 # NUVIEW-specific headers for requests
 def get_nuview_headers():
@@ -19,6 +20,10 @@ def get_nuview_headers():
 # Function to scrape USGS data for topographic features
 
 def scrape_usgs_data(url):
+    # Imported on use: importing the module should not load the HTTP and PDF stacks
+    import pdfplumber
+    import requests
+
     logger.info(f"Starting scrape for URL: {url}")
     headers = get_nuview_headers()
     try:
@@ -32,9 +37,9 @@ def scrape_usgs_data(url):
     with pdfplumber.open(response.content) as pdf:
         for page in pdf.pages:
             text = page.extract_text()
-            if 'bathymetry' in text.lower():
+            if classify_text(text)['out_of_scope']:
                 logger.warning('Excluded bathymetry data.')
-                continue  # Exclude bathymetry data
+                continue  # Exclude bathymetry-only pages
             process_text(text)
     return {}  # Return structured data to be defined
 
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+NUVIEW Strategic Pipeline - Stage Tracing
+Nested timing spans for pipeline stages, written per run to data/metrics
+
+Stages are wrapped in spans (a context manager or the @traced decorator).
+Each span records its name, start time, duration, parent span and any
+attributes set on it (record counts, bytes written). Spans nest per thread;
+spans opened on worker threads are recorded with their thread id.
+
+The outermost traced entry point of a process is the run: when it finishes,
+every span recorded during it is written to data/metrics/trace-<run>.json.
+Entry points called from another traced entry point (qc_validator.main inside
+full_qc_audit) become ordinary spans of the outer run.
+
+Tracing is on by default; set NUVIEW_TRACE=0 to disable it. Only the newest
+MAX_TRACES trace files are kept; older ones are deleted when a run is written.
+
+Usage:
+    from tracing import annotate, span, traced
+
+    @traced(run=True)
+    def main():
+        with span('load', records=len(rows)):
+            ...
+        annotate(bytes=os.path.getsize(path))
+
+    python scripts/tracing.py summary data/metrics/trace-<run>.json
+    python scripts/tracing.py chrome data/metrics/trace-<run>.json
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+TRACE_DIR = 'data/metrics'
+TRACE_ENV = 'NUVIEW_TRACE'
+TRACE_FORMAT_VERSION = 1
+
+# Spans kept while waiting for a run to finish; beyond this they are dropped
+MAX_PENDING_SPANS = 100000
+
+# Trace files kept in the trace directory; older ones are pruned on write
+MAX_TRACES = 50
+
+_local = threading.local()
+_lock = threading.Lock()
+_ids = itertools.count(1)
+_finished = []
+_run = None
+_collectors = 0
+
+def tracing_enabled():
+    """Tracing is on unless NUVIEW_TRACE is set to 0/false/off"""
+    return os.environ.get(TRACE_ENV, '1').lower() not in ('0', 'false', 'off', 'no')
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+class Span:
+    """One timed stage; attributes are set with set() while it is open"""
+
+    def __init__(self, name, parent, attrs):
+        self.id = f"{os.getpid()}-{next(_ids)}"
+        self.name = name
+        self.parent = parent
+        self.attrs = dict(attrs)
+        self.start = time.time()
+        self._start_counter = time.perf_counter()
+        self.duration = None
+
+    def set(self, **attrs):
+        """Set span attributes (e.g. records=120, bytes=40960)"""
+        self.attrs.update(attrs)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'parent': self.parent,
+            'name': self.name,
+            'start': self.start,
+            'duration': self.duration,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'attrs': self.attrs,
+        }
+
+class _NullSpan:
+    """Stand-in yielded when tracing is disabled"""
+
+    def set(self, **attrs):
+        pass
+
+@contextmanager
+def span(name, run=False, **attrs):
+    """
+    Time a block as a span nested under the current one.
+
+    Args:
+        name (str): Span name (e.g. 'qc.validate_opportunities')
+        run (bool): Treat this span as a run: if no run is active, the trace
+                    is written to data/metrics when it finishes
+        attrs: Initial attributes (records, bytes, ...)
+
+    Yields:
+        Span: Call .set(...) to add attributes before the block ends
+    """
+    global _run
+
+    if not tracing_enabled():
+        yield _NullSpan()
+        return
+
+    stack = _stack()
+    current = Span(name, stack[-1].id if stack else None, attrs)
+
+    starts_run = False
+    if run:
+        with _lock:
+            if _run is None:
+                _run = current
+                starts_run = True
+
+    stack.append(current)
+    try:
+        yield current
+    finally:
+        current.duration = time.perf_counter() - current._start_counter
+        stack.pop()
+        with _lock:
+            # Spans finished outside a run (or collect()) are not kept
+            if (_run is not None or _collectors) and len(_finished) < MAX_PENDING_SPANS:
+                _finished.append(current.to_dict())
+            if starts_run:
+                _run = None
+                spans = list(_finished)
+                _finished.clear()
+        if starts_run:
+            write_trace(current, spans)
+
+def traced(name=None, run=False):
+    """
+    Decorate a function so each call is recorded as a span.
+
+    Args:
+        name (str): Span name (defaults to module.function)
+        run (bool): Entry point: write the trace when an outermost call finishes
+    """
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, run=run):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def annotate(**attrs):
+    """Set attributes on this thread's innermost open span (no-op if none)"""
+    stack = _stack()
+    if stack:
+        stack[-1].set(**attrs)
+
+@contextmanager
+def collect():
+    """
+    Keep spans finished inside this block even when no run is active.
+
+    Used by worker processes, whose spans are handed back to the parent's
+    run with take_spans() / add_spans().
+    """
+    global _collectors
+
+    with _lock:
+        _collectors += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _collectors -= 1
+
+def take_spans(pid=None):
+    """
+    Remove and return the spans finished so far.
+
+    Args:
+        pid (int): Only spans recorded by this process (e.g. a worker that
+                   inherited its parent's spans when forked)
+    """
+    with _lock:
+        taken = [s for s in _finished if pid is None or s['pid'] == pid]
+        _finished[:] = [s for s in _finished if not (pid is None or s['pid'] == pid)]
+    return taken
+
+def add_spans(spans):
+    """Add spans recorded elsewhere (e.g. in worker processes) to the current run"""
+    with _lock:
+        _finished.extend(spans)
+
+def write_trace(run_span, spans, trace_dir=None):
+    """
+    Write a finished run's spans to trace_dir/trace-<run>.json.
+
+    Returns:
+        str: Path of the trace file, or None if it could not be written
+    """
+    trace_dir = trace_dir or TRACE_DIR
+    started = datetime.fromtimestamp(run_span.start, timezone.utc)
+    run_id = f"{run_span.name}-{started.strftime('%Y%m%dT%H%M%SZ')}-{os.getpid()}"
+    path = os.path.join(trace_dir, f"trace-{run_id}.json")
+
+    try:
+        os.makedirs(trace_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': TRACE_FORMAT_VERSION,
+                'run': run_id,
+                'started': started.isoformat().replace('+00:00', 'Z'),
+                'duration': run_span.duration,
+                'spans': sorted(spans, key=lambda s: s['start']),
+            }, f, indent=2, default=str)
+    except OSError:
+        return None
+
+    prune_traces(trace_dir)
+    return path
+
+def prune_traces(trace_dir=None, keep=None):
+    """
+    Delete all but the newest `keep` trace files.
+
+    Returns:
+        int: Number of trace files removed
+    """
+    trace_dir = trace_dir or TRACE_DIR
+    keep = MAX_TRACES if keep is None else keep
+    try:
+        traces = [entry for entry in os.scandir(trace_dir)
+                  if entry.name.startswith('trace-') and entry.name.endswith('.json')]
+    except OSError:
+        return 0
+
+    traces.sort(key=lambda entry: (entry.stat().st_mtime_ns, entry.name))
+    removed = 0
+    for entry in traces[:max(len(traces) - keep, 0)]:
+        try:
+            os.remove(entry.path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def to_chrome_trace(trace):
+    """
+    Convert a trace to Chrome trace event format (chrome://tracing, Perfetto).
+
+    Args:
+        trace (dict): Contents of a trace-<run>.json file
+
+    Returns:
+        dict: {'traceEvents': [...]} with one complete ('X') event per span
+    """
+    events = []
+    for s in trace['spans']:
+        events.append({
+            'name': s['name'],
+            'cat': 'pipeline',
+            'ph': 'X',
+            'ts': int(s['start'] * 1e6),
+            'dur': int((s['duration'] or 0) * 1e6),
+            'pid': s['pid'],
+            'tid': s['tid'],
+            'args': s['attrs'],
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'run': trace.get('run')}}
+
+def summarize(trace):
+    """
+    Aggregate span durations by name.
+
+    Returns:
+        list: (name, calls, total seconds, max seconds), longest total first
+    """
+    totals = {}
+    for s in trace['spans']:
+        calls, total, longest = totals.get(s['name'], (0, 0.0, 0.0))
+        duration = s['duration'] or 0.0
+        totals[s['name']] = (calls + 1, total + duration, max(longest, duration))
+    return sorted(((name, *stats) for name, stats in totals.items()), key=lambda row: -row[2])
+
+def main(argv=None):
+    """Summarize a trace or export it to Chrome trace format"""
+    parser = argparse.ArgumentParser(description='Inspect pipeline stage traces')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    summary_parser = subparsers.add_parser('summary', help='Print time per span name')
+    summary_parser.add_argument('trace', help='Path to a trace-<run>.json file')
+
+    chrome_parser = subparsers.add_parser('chrome', help='Export to Chrome trace event format')
+    chrome_parser.add_argument('trace', help='Path to a trace-<run>.json file')
+    chrome_parser.add_argument('-o', '--output', help='Output path (default: <trace>.chrome.json)')
+
+    args = parser.parse_args(argv)
+
+    with open(args.trace, 'r', encoding='utf-8') as f:
+        trace = json.load(f)
+
+    if args.command == 'summary':
+        print(f"Run {trace['run']}: {trace['duration']:.3f}s")
+        print(f"{'span':<50} {'calls':>6} {'total s':>10} {'max s':>10}")
+        for name, calls, total, longest in summarize(trace):
+            print(f"{name:<50} {calls:>6} {total:>10.3f} {longest:>10.3f}")
+        return 0
+
+    output = args.output or f"{os.path.splitext(args.trace)[0]}.chrome.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(to_chrome_trace(trace), f)
+    print(f"Wrote {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
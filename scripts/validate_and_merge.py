@@ -4,39 +4,47 @@ Validates scraped data and merges it with existing opportunities
 Handles deduplication, priority scoring, and data quality checks
 """
 
+import argparse
 import json
 import os
+import re
 import sys
 from datetime import datetime, timezone
 
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
+import memory_profile
+import profiling
+from memory_profile import checkpoint, memory_profiled
+from opportunity_stream import iter_opportunities, load_document
+from pipeline_log import SUCCESS, flush_repeated, get_logger, log_repeated
+from profiling import profiled
+from tracing import annotate, traced
+
+log = get_logger('validate_and_merge')
+
 try:
     from global_keywords import calculate_keyword_score, is_topographic_relevant
     KEYWORDS_AVAILABLE = True
 except ImportError:
-    print("Warning: global_keywords module not found. Priority scoring will be limited.")
+    log.warning("global_keywords module not found. Priority scoring will be limited.")
     KEYWORDS_AVAILABLE = False
 
-# Color codes for console output
-COLOR_GREEN = '\033[92m'
-COLOR_ORANGE = '\033[93m'
-COLOR_RED = '\033[91m'
-COLOR_BLUE = '\033[94m'
-COLOR_RESET = '\033[0m'
+# Per-record messages start with "Opportunity <idx> (<id>): "
+RECORD_PREFIX = re.compile(r'^Opportunity [^:]*: ')
 
 def log_info(msg):
-    print(f"{COLOR_BLUE}ℹ️  {msg}{COLOR_RESET}")
+    log.info(msg)
 
 def log_success(msg):
-    print(f"{COLOR_GREEN}✅ {msg}{COLOR_RESET}")
+    log.log(SUCCESS, msg)
 
 def log_warning(msg):
-    print(f"{COLOR_ORANGE}⚠️  {msg}{COLOR_RESET}")
+    log.warning(msg)
 
 def log_error(msg):
-    print(f"{COLOR_RED}❌ {msg}{COLOR_RESET}")
+    log.error(msg)
 
 def calculate_priority_score(opportunity):
     """
@@ -147,8 +155,10 @@ def deduplicate_opportunities(opportunities):
             seen.add(key)
             unique.append(opp)
         else:
-            log_warning(f"Duplicate removed: {opp.get('title', 'Unknown')} ({opp.get('agency', 'Unknown')})")
+            log_repeated(log, "Duplicate removed",
+                         f"Duplicate removed: {opp.get('title', 'Unknown')} ({opp.get('agency', 'Unknown')})")
 
+    flush_repeated()
     return unique
 
 def validate_opportunity(opp, index):
@@ -193,43 +203,48 @@ def validate_opportunity(opp, index):
     is_valid = len(errors) == 0
     return is_valid, errors, warnings
 
-def merge_opportunities(existing_file, new_opportunities):
+@traced('merge_opportunities')
+def merge_opportunities(existing_file, new_opportunities, existing_data=None):
     """
     Merge new opportunities with existing data file.
 
     Args:
         existing_file (str): Path to existing opportunities.json
         new_opportunities (list): List of new opportunities to merge
+        existing_data (dict): Already parsed contents of existing_file (read from disk if omitted)
 
     Returns:
         dict: Merged data structure
     """
     log_info(f"Merging {len(new_opportunities)} new opportunities...")
 
-    # Load existing data if file exists
-    existing_data = {
-        "meta": {
-            "market_val": "14.13",
-            "cagr": "19.43",
-            "updated": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            "totalCount": 0
-        },
-        "opportunities": []
-    }
-
-    if os.path.exists(existing_file):
+    # Use the caller's parsed data, else load the existing file if there is one
+    if existing_data is not None:
+        log_info(f"Using {len(existing_data.get('opportunities', []))} existing opportunities already loaded")
+    elif os.path.exists(existing_file):
         try:
-            with open(existing_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
+            existing_data = load_document(existing_file)
             log_info(f"Loaded {len(existing_data.get('opportunities', []))} existing opportunities")
         except Exception as e:
             log_warning(f"Could not load existing data: {e}")
 
+    if existing_data is None:
+        existing_data = {
+            "meta": {
+                "market_val": "14.13",
+                "cagr": "19.43",
+                "updated": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                "totalCount": 0
+            },
+            "opportunities": []
+        }
+
     # Combine opportunities
     all_opportunities = existing_data.get('opportunities', []) + new_opportunities
 
     # Deduplicate
     unique_opportunities = deduplicate_opportunities(all_opportunities)
+    checkpoint('merge.deduplicate')
 
     # Calculate priority scores and add priority labels
     for opp in unique_opportunities:
@@ -259,11 +274,36 @@ def merge_opportunities(existing_file, new_opportunities):
     existing_data['meta']['updated'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
     log_success(f"Merged data contains {len(unique_opportunities)} unique opportunities")
+    annotate(records=len(unique_opportunities), new_records=len(new_opportunities))
 
     return existing_data
 
-def main():
-    """Main validation and merge logic"""
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="NUVIEW topographic pipeline validation and merge")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Write per-stage tracemalloc snapshots and peak RSS to data/metrics')
+    profiling.add_profile_argument(parser)
+    return parser.parse_args(argv)
+
+@traced('validate_and_merge', run=True)
+@memory_profiled('validate_and_merge')
+@profiled('validate_and_merge')
+def main(argv=None, ctx=None):
+    """
+    Main validation and merge logic
+
+    Args:
+        argv (list): Command line arguments (defaults to sys.argv)
+        ctx (QCContext): Shared datasets when run in-process by the pipeline runner;
+                         records are taken from it and the merged data handed back
+    """
+    args = parse_args(argv)
+    if args.profile_memory:
+        memory_profile.start('validate_and_merge')
+    if args.profile:
+        profiling.start('validate_and_merge', args.profile)
+
     log_info("=" * 70)
     log_info("NUVIEW TOPOGRAPHIC PIPELINE - VALIDATE AND MERGE")
     log_info("=" * 70)
@@ -277,46 +317,51 @@ def main():
         log_info("Run scrape_all.py first to generate initial data.")
         return 1
 
-    # Load opportunities
+    # Validate each opportunity while streaming the file
+    all_errors = []
+    all_warnings = []
+    valid_count = 0
+    total_count = 0
+    needs_scoring = False
+
     try:
-        with open(opportunities_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        records = ctx.opportunities if ctx is not None else iter_opportunities(opportunities_file)
+        for idx, opp in enumerate(records):
+            is_valid, errors, warnings = validate_opportunity(opp, idx)
+            if is_valid:
+                valid_count += 1
+            all_errors.extend(errors)
+            all_warnings.extend(warnings)
+            total_count += 1
+
+            # Add priority scores if not present
+            if 'priorityScore' not in opp:
+                needs_scoring = True
     except Exception as e:
         log_error(f"Failed to load opportunities file: {e}")
         return 1
 
-    opportunities = data.get('opportunities', [])
-    log_info(f"Loaded {len(opportunities)} opportunities for validation")
+    log_info(f"Loaded {total_count} opportunities for validation")
+    checkpoint('validate')
     log_info("")
 
-    # Validate each opportunity
-    all_errors = []
-    all_warnings = []
-    valid_count = 0
-
-    for idx, opp in enumerate(opportunities):
-        is_valid, errors, warnings = validate_opportunity(opp, idx)
-        if is_valid:
-            valid_count += 1
-        all_errors.extend(errors)
-        all_warnings.extend(warnings)
-
-    # Add priority scores if not present
-    needs_scoring = False
-    for opp in opportunities:
-        if 'priorityScore' not in opp:
-            needs_scoring = True
-            break
-
     if needs_scoring:
         log_info("Calculating priority scores...")
-        merged_data = merge_opportunities(opportunities_file, [])
+        existing_data = None
+        if ctx is not None:
+            existing_data = {'meta': dict(ctx.meta), 'opportunities': list(ctx.opportunities)}
+        merged_data = merge_opportunities(opportunities_file, [], existing_data)
+        checkpoint('merge')
 
         # Save updated data
         with open(opportunities_file, 'w', encoding='utf-8') as f:
             json.dump(merged_data, f, indent=2, ensure_ascii=False)
 
         log_success("Priority scores added and data saved")
+        checkpoint('save')
+
+        if ctx is not None:
+            ctx.provide(meta=merged_data['meta'], opportunities=merged_data['opportunities'])
 
     # Display validation results
     log_info("")
@@ -336,12 +381,13 @@ def main():
     if all_warnings:
         log_warning(f"Found {len(all_warnings)} warning(s):")
         for warn in all_warnings:
-            log_warning(f"  • {warn}")
+            log_repeated(log, RECORD_PREFIX.sub('', warn, count=1), f"  • {warn}")
+        flush_repeated()
     else:
         log_success("No warnings")
 
     log_info("")
-    log_success(f"Valid opportunities: {valid_count}/{len(opportunities)}")
+    log_success(f"Valid opportunities: {valid_count}/{total_count}")
     log_info("=" * 70)
 
     return 0 if len(all_errors) == 0 else 1
@@ -0,0 +1,21 @@
+"""
+Shared pytest configuration
+Keeps test runs from writing stage traces to data/metrics
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import tracing  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _no_tracing():
+    """Disable tracing for the whole run, including scripts the tests start as subprocesses"""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(tracing.TRACE_ENV, '0')
+        yield
@@ -0,0 +1,103 @@
+"""
+Unit tests for the audit file manifest and verdict cache
+Tests the single-walk manifest and reuse of verdicts for unchanged files
+"""
+
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import audit_manifest  # noqa: E402
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+class TestManifest:
+    """Tests for build_manifest"""
+
+    def test_files_grouped_by_kind(self, tmp_path):
+        """Test that one walk sorts files by kind and skips excluded directories"""
+        _write(tmp_path / 'index.html', '<html></html>')
+        _write(tmp_path / 'scripts' / 'a.py', 'x = 1\n')
+        _write(tmp_path / 'data' / 'b.csv', 'a\n1\n')
+        _write(tmp_path / '.git' / 'hooks' / 'c.sh', '#!/bin/sh\n')
+        _write(tmp_path / 'data' / 'cache' / 'd.json', '{}')
+        _write(tmp_path / 'notes.txt', 'ignored')
+
+        manifest = audit_manifest.build_manifest(str(tmp_path), excluded_dirs=['data/cache'])
+
+        assert [e['path'] for e in manifest['html']] == ['index.html']
+        assert [e['path'] for e in manifest['python']] == [os.path.join('scripts', 'a.py')]
+        assert [e['path'] for e in manifest['csv']] == [os.path.join('data', 'b.csv')]
+        assert manifest['shell'] == []
+        assert manifest['json'] == []
+        assert manifest['python'][0]['size'] == 6
+
+
+class TestAuditCache:
+    """Tests for AuditCache"""
+
+    def _entry(self, path):
+        stat = os.stat(path)
+        return {'path': str(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def test_unchanged_file_reuses_verdict(self, tmp_path):
+        """Test that a verdict is reused until the file content changes"""
+        target = tmp_path / 'doc.md'
+        target.write_text('# Title\n')
+        cache_path = str(tmp_path / 'cache.json')
+        calls = []
+
+        def check(path):
+            calls.append(path)
+            return [], [f"{path}: warning"]
+
+        cache = audit_manifest.AuditCache(cache_path, rules='r1')
+        assert cache.run(self._entry(target), 'markdown', check)[2] is False
+        cache.save()
+
+        cache = audit_manifest.AuditCache(cache_path, rules='r1')
+        errors, warnings, cached = cache.run(self._entry(target), 'markdown', check)
+        assert cached is True
+        assert warnings == [f"{target}: warning"]
+        assert len(calls) == 1
+        cache.save()
+
+        target.write_text('# Changed title\n')
+        cache = audit_manifest.AuditCache(cache_path, rules='r1')
+        assert cache.run(self._entry(target), 'markdown', check)[2] is False
+        assert len(calls) == 2
+
+    def test_rule_change_drops_verdicts(self, tmp_path):
+        """Test that verdicts recorded under other audit rules are not reused"""
+        target = tmp_path / 'a.json'
+        target.write_text('{"a": 1}')
+        cache_path = str(tmp_path / 'cache.json')
+
+        cache = audit_manifest.AuditCache(cache_path, rules='r1')
+        cache.run(self._entry(target), 'json', lambda path: ([], []))
+        cache.save()
+
+        cache = audit_manifest.AuditCache(cache_path, rules='r2')
+        assert cache.lookup(self._entry(target), 'json') is None
+
+    def test_merge_worker_copy(self, tmp_path):
+        """Test that verdicts recorded on a worker's copy are saved by the parent"""
+        target = tmp_path / 'a.csv'
+        target.write_text('a\n1\n')
+        cache_path = str(tmp_path / 'cache.json')
+
+        cache = audit_manifest.AuditCache(cache_path, rules='r1')
+        worker = copy.deepcopy(cache)
+        worker.run(self._entry(target), 'csv', lambda path: ([], ['note']))
+        cache.merge(worker)
+        cache.save()
+
+        assert cache.checked == 1
+        reloaded = audit_manifest.AuditCache(cache_path, rules='r1')
+        assert reloaded.lookup(self._entry(target), 'csv') == ([], ['note'])
@@ -0,0 +1,125 @@
+"""
+Unit tests for the content-addressed backup store
+Tests chunking, deduplication, diffing and single-file restore
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import backup_store  # noqa: E402
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class TestChunking:
+    """Tests for content-defined chunk boundaries"""
+
+    def test_boundaries_cover_input(self):
+        """Test that chunks are contiguous and cover the whole input"""
+        data = random.Random(1).randbytes(300_000)
+        boundaries = backup_store.chunk_boundaries(data)
+
+        assert boundaries[0][0] == 0
+        assert boundaries[-1][1] == len(data)
+        for (_, end), (start, _) in zip(boundaries, boundaries[1:]):
+            assert end == start
+        for start, end in boundaries:
+            assert end - start <= backup_store.MAX_CHUNK_SIZE
+
+    def test_insertion_only_changes_nearby_chunks(self):
+        """Test that an insertion keeps most chunks identical"""
+        data = random.Random(2).randbytes(400_000)
+        edited = data[:200_000] + b'inserted bytes' + data[200_000:]
+
+        original = {data[s:e] for s, e in backup_store.chunk_boundaries(data)}
+        changed = {edited[s:e] for s, e in backup_store.chunk_boundaries(edited)}
+
+        assert len(original & changed) >= len(original) - 3
+
+
+class TestSnapshots:
+    """Tests for snapshot creation, diffing and restore"""
+
+    def test_unchanged_files_store_no_new_chunks(self, tmp_path):
+        """Test that a second snapshot of the same data is free"""
+        store = str(tmp_path / 'store')
+        data_dir = tmp_path / 'data'
+        _write(str(data_dir / 'opportunities.json'), random.Random(3).randbytes(50_000))
+
+        first = backup_store.create_snapshot([str(data_dir)], 'day1', store)
+        second = backup_store.create_snapshot([str(data_dir)], 'day2', store)
+
+        assert first['stats']['chunks_new'] > 0
+        assert second['stats']['chunks_new'] == 0
+        assert backup_store.list_snapshots(store) == ['day1', 'day2']
+
+    def test_failed_manifest_write_keeps_previous(self, tmp_path, monkeypatch):
+        """Test that a crash while writing a manifest leaves no partial snapshot behind"""
+        store = str(tmp_path / 'store')
+        data_dir = tmp_path / 'data'
+        _write(str(data_dir / 'opportunities.json'), random.Random(4).randbytes(20_000))
+        backup_store.create_snapshot([str(data_dir)], 'day1', store)
+
+        def crash(*args, **kwargs):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(backup_store.json, 'dump', crash)
+        with pytest.raises(OSError):
+            backup_store.create_snapshot([str(data_dir)], 'day1', store)
+
+        monkeypatch.undo()
+        assert backup_store.list_snapshots(store) == ['day1']
+        assert backup_store.load_manifest('day1', store)['snapshot'] == 'day1'
+
+    def test_diff_and_restore(self, tmp_path):
+        """Test diffing two snapshots and restoring a single file"""
+        store = str(tmp_path / 'store')
+        data_dir = tmp_path / 'data'
+        kept = str(data_dir / 'forecast.json')
+        edited = str(data_dir / 'opportunities.json')
+        _write(kept, b'{"current_year": 2025}')
+        _write(edited, b'{"opportunities": []}')
+        backup_store.create_snapshot([str(data_dir)], 'day1', store)
+
+        original = random.Random(4).randbytes(80_000)
+        _write(edited, original)
+        _write(str(data_dir / 'new.csv'), b'a,b\n1,2\n')
+        backup_store.create_snapshot([str(data_dir)], 'day2', store)
+
+        changes = backup_store.diff_snapshots('day1', 'day2', store)
+        rel_edited = os.path.normpath(edited).replace(os.sep, '/')
+        assert changes['modified'] == [rel_edited]
+        assert len(changes['added']) == 1
+        assert changes['removed'] == []
+
+        output = str(tmp_path / 'restored.json')
+        backup_store.restore_file('day2', edited, output, store)
+        with open(output, 'rb') as f:
+            assert f.read() == original
+
+        assert backup_store.verify_snapshot('day2', store) == []
+
+    def test_prune_removes_unreferenced_chunks(self, tmp_path):
+        """Test that pruning keeps only chunks of retained snapshots"""
+        store = str(tmp_path / 'store')
+        target = str(tmp_path / 'data' / 'opportunities.json')
+
+        for day in range(3):
+            _write(target, random.Random(day).randbytes(20_000))
+            backup_store.create_snapshot([target], f'day{day}', store)
+
+        removed, chunks_removed = backup_store.prune_snapshots(1, store)
+
+        assert removed == 2
+        assert chunks_removed > 0
+        assert backup_store.list_snapshots(store) == ['day2']
+        assert backup_store.verify_snapshot('day2', store) == []
@@ -0,0 +1,93 @@
+"""
+Unit tests for the benchmark suite
+Tests the synthetic corpus generator, result comparison and start-up measurement
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import run_benchmarks  # noqa: E402
+import synthetic_corpus  # noqa: E402
+from validate_and_merge import deduplicate_opportunities  # noqa: E402
+
+
+class TestSyntheticCorpus:
+    """Tests for the deterministic corpus generator"""
+
+    def test_deterministic(self):
+        """Test that the same size and seed give the same records"""
+        first = synthetic_corpus.generate_corpus(200, seed=7)
+        second = synthetic_corpus.generate_corpus(200, seed=7)
+
+        assert first == second
+        assert first != synthetic_corpus.generate_corpus(200, seed=8)
+
+    def test_record_shape(self):
+        """Test that records carry the generate_opportunity fields and include duplicates"""
+        records = synthetic_corpus.generate_corpus(500)
+
+        expected = {'id', 'title', 'agency', 'pillar', 'category', 'description', 'amountUSD',
+                    'daysUntilDeadline', 'deadline', 'next_action', 'scrapedAt', 'forecast_value',
+                    'link', 'budgetSourceLink', 'agencyLink', 'timeline', 'funding', 'valueUSD', 'urgency'}
+        assert all(set(opp) == expected for opp in records)
+        assert len(deduplicate_opportunities(records)) < len(records)
+
+
+class TestBenchmarkRunner:
+    """Tests for running and comparing benchmark results"""
+
+    def test_run_small_corpus(self):
+        """Test that a run returns one timing per case and size"""
+        document = run_benchmarks.run_benchmarks(sizes=[50], cases=['dedupe', 'keyword_scoring'], repeat=1)
+
+        assert [(r['case'], r['size']) for r in document['results']] == [('dedupe', 50), ('keyword_scoring', 50)]
+        assert all(r['min'] > 0 for r in document['results'])
+        assert document['calibration'] > 0
+        assert all(r['relative'] == r['min'] / document['calibration'] for r in document['results'])
+
+    def test_compare_flags_regressions(self):
+        """Test that slowdowns beyond the threshold are flagged"""
+        base = {'results': [{'case': 'dedupe', 'size': 1000, 'min': 1.0},
+                            {'case': 'merge', 'size': 1000, 'min': 2.0}]}
+        new = {'results': [{'case': 'dedupe', 'size': 1000, 'min': 1.1},
+                           {'case': 'merge', 'size': 1000, 'min': 3.0},
+                           {'case': 'source_matrix', 'size': 1000, 'min': 1.0}]}
+
+        rows = run_benchmarks.compare_results(base, new, threshold=1.2)
+
+        assert [(name, regressed) for name, _size, _b, _n, _ratio, regressed in rows] == \
+            [('dedupe', False), ('merge', True)]
+
+
+class TestStartup:
+    """Tests for the entry point import-time measurement"""
+
+    def test_parse_importtime(self):
+        """Test that the module's cumulative time and its direct imports are read"""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 | site",
+            "import time:       500 |       9000 |     numpy",
+            "import time:      2000 |      20000 |   pandas",
+            "import time:       300 |        300 |   json",
+            "import time:      1000 |      21300 | qc_validator",
+        ])
+
+        seconds, children = run_benchmarks.parse_importtime(output, 'qc_validator')
+
+        assert seconds == 0.0213
+        assert children == [('pandas', 0.02), ('json', 0.0003)]
+
+    def test_entry_points_do_not_import_heavy_dependencies(self):
+        """Test that starting the QC and generation entry points loads neither pandas nor jsonschema"""
+        modules = ['qc_validator', 'generate_programs', 'comprehensive_qc_check', 'full_qc_audit']
+        code = f"import sys; import {', '.join(modules)}; print(sorted({{'pandas', 'jsonschema'}} & set(sys.modules)))"
+
+        result = subprocess.run([sys.executable, '-c', code], cwd=run_benchmarks.SCRIPTS_DIR,
+                                capture_output=True, text=True, timeout=120)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == '[]'
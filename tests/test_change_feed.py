@@ -0,0 +1,101 @@
+"""
+Unit tests for the change data capture feed
+Tests hash-join matching, field-level diffs and NDJSON output
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'scrapers'))
+
+import base_scraper  # noqa: E402
+import change_feed  # noqa: E402
+from federal_scrapers import USGSScraper  # noqa: E402
+
+
+def _sweep_on(monkeypatch, day):
+    """Run a real scraper as if the sweep happened on the given day"""
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 11, day, 3, 0, tzinfo=tz)
+
+    monkeypatch.setattr(base_scraper, 'datetime', FixedDatetime)
+    return USGSScraper().scrape()
+
+
+def _opp(opp_id, title, agency='USGS', amount=1000000, urgency='near'):
+    return {
+        "id": opp_id,
+        "title": title,
+        "agency": agency,
+        "scrapedAt": "2025-11-21T00:00:00Z",
+        "funding": {"amountUSD": amount},
+        "timeline": {"daysUntil": 45, "urgency": urgency}
+    }
+
+
+class TestComputeChanges:
+    """Tests for delta computation between sweeps"""
+
+    def test_regenerated_ids_are_not_changes(self):
+        """Test that a new random id and scrape time do not count as a modification"""
+        previous = [_opp('usgs-101', 'USGS 3DEP LiDAR')]
+        current = [dict(_opp('usgs-555', 'USGS 3DEP LiDAR'), scrapedAt="2025-11-22T00:00:00Z")]
+
+        assert change_feed.compute_changes(previous, current) == []
+
+    def test_consecutive_days_identical_output(self, monkeypatch):
+        """Test that unchanged scraper output on the next day gives an empty delta"""
+        previous = _sweep_on(monkeypatch, 21)
+        current = _sweep_on(monkeypatch, 22)
+
+        assert previous[0]['deadline'] != current[0]['deadline']
+        assert change_feed.compute_changes(previous, current) == []
+
+    def test_added_removed_modified(self):
+        """Test classification of each kind of change"""
+        previous = [
+            _opp('usgs-101', 'USGS 3DEP LiDAR'),
+            _opp('nasa-202', 'NASA ICESat-2 Science'),
+        ]
+        current = [
+            _opp('usgs-102', 'usgs 3dep lidar ', amount=2000000, urgency='urgent'),
+            _opp('esa-303', 'ESA Copernicus DEM', agency='ESA'),
+        ]
+
+        changes = change_feed.compute_changes(previous, current)
+        by_op = {change['op']: change for change in changes}
+
+        assert change_feed.summarize_changes(changes) == {'added': 1, 'removed': 1, 'modified': 1}
+        assert by_op['added']['id'] == 'esa-303'
+        assert by_op['removed']['id'] == 'nasa-202'
+
+        modified = by_op['modified']
+        assert modified['previous_id'] == 'usgs-101'
+        assert modified['fields']['funding.amountUSD'] == {"old": 1000000, "new": 2000000}
+        assert modified['fields']['timeline.urgency'] == {"old": 'near', "new": 'urgent'}
+        assert modified['fields']['title'] == {"old": 'USGS 3DEP LiDAR', "new": 'usgs 3dep lidar '}
+        assert 'id' not in modified['fields']
+
+    def test_ndjson_round_trip(self, tmp_path):
+        """Test that written deltas can be read back line by line"""
+        changes = change_feed.compute_changes([], [_opp('usgs-101', 'USGS 3DEP LiDAR')])
+        timestamp = datetime(2025, 11, 22, 3, 0, tzinfo=timezone.utc)
+
+        path = change_feed.write_changes(changes, timestamp, str(tmp_path))
+
+        assert os.path.basename(path) == '20251122T030000Z.ndjson'
+        assert list(change_feed.read_changes(path)) == changes
+        assert change_feed.latest_changes_file(str(tmp_path)) == path
+
+    def test_old_deltas_pruned_on_write(self, tmp_path, monkeypatch):
+        """Test that only the newest MAX_CHANGE_FILES deltas are kept"""
+        monkeypatch.setattr(change_feed, 'MAX_CHANGE_FILES', 2)
+
+        for day in (20, 21, 22):
+            change_feed.write_changes([], datetime(2025, 11, day, 3, 0, tzinfo=timezone.utc), str(tmp_path))
+
+        assert sorted(os.listdir(tmp_path)) == ['20251121T030000Z.ndjson', '20251122T030000Z.ndjson']
@@ -0,0 +1,58 @@
+"""
+Unit tests for columnar matrix I/O
+Tests explicit dtypes and the CSV fallback of read_matrix
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import columnar_io  # noqa: E402
+
+
+def _matrix():
+    return pd.DataFrame({
+        'rank': [1, 2],
+        'title': ['USGS 3DEP', 'ESA DEM'],
+        'valueUSD': [217000000, 'TBD'],
+        'funding': [{'amountUSD': 217000000}, {'amountUSD': 0}],
+    })
+
+
+class TestColumnarIO:
+    """Tests for write_matrix/read_matrix"""
+
+    def test_apply_dtypes(self):
+        """Test that numeric columns are coerced and nested objects become JSON text"""
+        typed = columnar_io.apply_dtypes(_matrix(), columnar_io.PRIORITY_MATRIX_DTYPES)
+
+        assert str(typed['rank'].dtype) == 'Int64'
+        assert typed['valueUSD'].dtype == 'float64'
+        assert pd.isna(typed['valueUSD'][1])
+        assert typed['funding'][0] == '{"amountUSD": 217000000}'
+
+    def test_csv_fallback(self, tmp_path, monkeypatch):
+        """Test that read_matrix parses the CSV with explicit dtypes when no binary copy exists"""
+        monkeypatch.setattr(columnar_io, 'ARROW_AVAILABLE', False)
+        path = str(tmp_path / 'priority_matrix.csv')
+
+        assert columnar_io.write_matrix(_matrix(), path, columnar_io.PRIORITY_MATRIX_DTYPES) == []
+        df = columnar_io.read_matrix(path, columnar_io.PRIORITY_MATRIX_DTYPES)
+
+        assert list(df['title']) == ['USGS 3DEP', 'ESA DEM']
+        assert df['valueUSD'][0] == 217000000.0
+
+    def test_binary_round_trip(self, tmp_path):
+        """Test that Parquet and Arrow copies are written and preferred"""
+        pytest.importorskip('pyarrow')
+        path = str(tmp_path / 'priority_matrix.csv')
+
+        written = columnar_io.write_matrix(_matrix(), path, columnar_io.PRIORITY_MATRIX_DTYPES)
+        df = columnar_io.read_matrix(path)
+
+        assert sorted(written) == sorted(columnar_io.columnar_paths(path).values())
+        assert str(df['rank'].dtype) == 'Int64'
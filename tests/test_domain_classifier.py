@@ -0,0 +1,54 @@
+"""
+Unit tests for the shared domain classifier
+Tests single-scan flags against plain substring checks
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import domain_classifier  # noqa: E402
+
+
+def _substring_flags(text):
+    text = text.lower()
+    topographic = any(k in text for k in domain_classifier.TOPOGRAPHIC_KEYWORDS)
+    bathymetric = any(k in text for k in domain_classifier.BATHYMETRIC_KEYWORDS)
+    return {
+        'topographic': topographic,
+        'bathymetric': bathymetric,
+        'relevant': any(k in text for k in domain_classifier.RELEVANCE_KEYWORDS),
+        'out_of_scope': bathymetric and not topographic,
+    }
+
+
+class TestClassify:
+    """Tests for classify and classify_batch"""
+
+    def test_bathymetry_only_is_out_of_scope(self):
+        """Test that seafloor work without a topographic keyword is flagged"""
+        flags = domain_classifier.classify('Seabed Survey', 'Hydrographic charting of the harbour')
+
+        assert flags['bathymetric']
+        assert flags['out_of_scope']
+        assert not flags['relevant']
+
+    def test_topobathy_stays_in_scope(self):
+        """Test that a topographic keyword keeps bathymetric work in scope"""
+        flags = domain_classifier.classify('Coastal Topobathy LiDAR', 'Bathymetric and elevation mapping')
+
+        assert flags == {'topographic': True, 'bathymetric': True, 'relevant': True, 'out_of_scope': False}
+
+    def test_matches_substring_semantics(self):
+        """Test overlapping and prefix keywords against the per-list substring checks"""
+        texts = [
+            'UNDERWATER MAPPINGDEM',
+            'seabedem',
+            'bathymetric lidarmapping',
+            'hydrographic demo',
+            'dsm',
+            '',
+        ]
+
+        assert domain_classifier.classify_batch(texts) == [_substring_flags(t) for t in texts]
@@ -0,0 +1,66 @@
+"""
+Unit tests for the memory profiling mode
+Tests stage checkpoints, report writing and nesting of profiled entry points
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import memory_profile  # noqa: E402
+
+
+class TestMemoryProfile:
+    """Tests for start/checkpoint/stop and @memory_profiled"""
+
+    def test_checkpoint_is_noop_when_off(self, monkeypatch):
+        """Test that checkpoints do nothing without an active profile"""
+        monkeypatch.delenv(memory_profile.MEMORY_PROFILE_ENV, raising=False)
+
+        memory_profile.checkpoint('stage')
+
+        assert memory_profile._active is None
+
+    def test_stage_allocations_reported(self, tmp_path, monkeypatch):
+        """Test that a stage's large allocation is attributed to it and the report is written"""
+        monkeypatch.setattr(memory_profile, 'MEMORY_REPORT_DIR', str(tmp_path))
+
+        @memory_profile.memory_profiled('unit')
+        def entry_point():
+            memory_profile.start('unit')
+            held = [bytes(1000) for _ in range(2000)]
+            memory_profile.checkpoint('allocate')
+            return len(held)
+
+        assert entry_point() == 2000
+
+        [path] = list(tmp_path.glob('memory-unit-*.json'))
+        report = json.loads(path.read_text(encoding='utf-8'))
+        stages = {stage['stage']: stage for stage in report['stages']}
+        assert list(stages) == ['allocate', 'end']
+        assert stages['allocate']['traced_peak_bytes'] >= 2000 * 1000
+        assert stages['allocate']['top_allocations'][0]['size_diff'] >= 2000 * 1000
+        assert memory_profile._active is None
+
+    def test_nested_entry_point_joins_outer_profile(self, tmp_path, monkeypatch):
+        """Test that an entry point called while profiling adds to the outer report"""
+        monkeypatch.setattr(memory_profile, 'MEMORY_REPORT_DIR', str(tmp_path))
+        monkeypatch.setenv(memory_profile.MEMORY_PROFILE_ENV, '1')
+
+        @memory_profile.memory_profiled('inner')
+        def inner():
+            memory_profile.checkpoint('inner.stage')
+
+        @memory_profile.memory_profiled('outer')
+        def outer():
+            inner()
+            memory_profile.checkpoint('outer.stage')
+
+        outer()
+
+        [path] = list(tmp_path.glob('memory-*.json'))
+        report = json.loads(path.read_text(encoding='utf-8'))
+        assert report['run'] == 'outer'
+        assert [stage['stage'] for stage in report['stages']] == ['inner.stage', 'outer.stage', 'end']
@@ -0,0 +1,72 @@
+"""
+Unit tests for the Prometheus metrics registry
+Tests text exposition output and atomic textfile writes
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import metrics  # noqa: E402
+
+
+class TestRegistry:
+    """Tests for counters, gauges, histograms and rendering"""
+
+    def test_render_text_format(self):
+        """Test the exposition format of each metric type"""
+        registry = metrics.MetricsRegistry()
+        fetched = registry.counter('fetched_total', 'Bytes fetched', ['scraper'])
+        pending = registry.gauge('pending', 'Pending triggers')
+        latency = registry.histogram('latency_seconds', 'Latency', ['scraper'], buckets=(0.5, 1.0))
+
+        fetched.inc(100, scraper='USGS')
+        fetched.inc(20, scraper='USGS')
+        fetched.inc(5, scraper='Say "hi"')
+        pending.set(2.5)
+        latency.observe(0.25, scraper='USGS')
+        latency.observe(0.5, scraper='USGS')
+
+        assert registry.render().splitlines() == [
+            '# HELP fetched_total Bytes fetched',
+            '# TYPE fetched_total counter',
+            'fetched_total{scraper="Say \\"hi\\""} 5',
+            'fetched_total{scraper="USGS"} 120',
+            '# HELP latency_seconds Latency',
+            '# TYPE latency_seconds histogram',
+            'latency_seconds_bucket{scraper="USGS",le="0.5"} 2',
+            'latency_seconds_bucket{scraper="USGS",le="1"} 2',
+            'latency_seconds_bucket{scraper="USGS",le="+Inf"} 2',
+            'latency_seconds_sum{scraper="USGS"} 0.75',
+            'latency_seconds_count{scraper="USGS"} 2',
+            '# HELP pending Pending triggers',
+            '# TYPE pending gauge',
+            'pending 2.5',
+        ]
+
+    def test_label_and_value_checks(self):
+        """Test that wrong labels and negative counter increments are rejected"""
+        registry = metrics.MetricsRegistry()
+        counter = registry.counter('runs_total', 'Runs', ['result'])
+
+        with pytest.raises(ValueError):
+            counter.inc(scraper='x')
+        with pytest.raises(ValueError):
+            counter.inc(-1, result='ok')
+        with pytest.raises(ValueError):
+            registry.gauge('runs_total', 'Duplicate')
+
+    def test_write_textfile(self, tmp_path, monkeypatch):
+        """Test that the .prom file lands in NUVIEW_METRICS_DIR with no temp file left"""
+        monkeypatch.setenv(metrics.METRICS_DIR_ENV, str(tmp_path))
+        registry = metrics.MetricsRegistry()
+        registry.gauge('up', 'Up').set(1)
+
+        path = metrics.write_textfile(registry, 'test')
+
+        assert path == os.path.join(str(tmp_path), 'test.prom')
+        assert os.listdir(tmp_path) == ['test.prom']
+        assert 'up 1\n' in open(path).read()
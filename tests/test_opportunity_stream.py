@@ -0,0 +1,84 @@
+"""
+Unit tests for the streaming opportunities reader
+Tests incremental decoding against json.load
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import opportunity_stream  # noqa: E402
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+OPPORTUNITIES_FILE = os.path.join(REPO_ROOT, 'data', 'opportunities.json')
+
+
+class TestStreaming:
+    """Tests for iter_opportunities and read_meta"""
+
+    def test_stream_matches_json_load(self):
+        """Test that tiny read chunks still decode every record exactly"""
+        with open(OPPORTUNITIES_FILE, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+
+        streamed = list(opportunity_stream.iter_opportunities(OPPORTUNITIES_FILE, chunk_size=7))
+
+        assert streamed == expected['opportunities']
+        assert opportunity_stream.read_meta(OPPORTUNITIES_FILE, chunk_size=7) == expected['meta']
+
+    def test_meta_after_array(self, tmp_path):
+        """Test that field order does not matter"""
+        path = tmp_path / 'opportunities.json'
+        path.write_text('{"opportunities": [{"id": "a-1"}, {"id": "b-2", "n": 12345}], "meta": {"totalCount": 2}}')
+
+        assert list(opportunity_stream.OpportunityStream(str(path), chunk_size=4)) == [
+            {"id": "a-1"}, {"id": "b-2", "n": 12345}
+        ]
+        assert opportunity_stream.read_meta(str(path)) == {"totalCount": 2}
+
+    @pytest.mark.parametrize('text', [
+        '{"opportunities": [{"id": "a"} {"id": "b"}]}',
+        '{"opportunities": [{"id": "a"}',
+        '{"meta": {}} trailing',
+    ])
+    def test_malformed_input_raises(self, tmp_path, text):
+        """Test that invalid JSON is reported like json.load would"""
+        path = tmp_path / 'opportunities.json'
+        path.write_text(text)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(opportunity_stream.iter_document(str(path)))
+
+    def test_truncated_record_stops_at_cap(self, tmp_path):
+        """Test that an unterminated record fails once it outgrows the cap, before reaching EOF"""
+        path = tmp_path / 'opportunities.json'
+        path.write_text('{"opportunities": [{"id": "a"}, {"description": "' + 'x' * 10_000)
+
+        items = []
+        with pytest.raises(json.JSONDecodeError, match='longer than 1000'):
+            for event, _key, value in opportunity_stream.iter_document(str(path), chunk_size=100,
+                                                                       max_record_size=1000):
+                items.append(value)
+
+        assert items == [None, {"id": "a"}]
+
+    def test_large_field_is_not_capped(self, tmp_path):
+        """Test that a top-level field far larger than the record cap is skipped or decoded whole"""
+        history = [{"day": i, "note": 'say "hi" \\ [' + 'x' * 50, "n": i * 1.5} for i in range(2000)]
+        document = {"meta": {"totalCount": 2}, "history": history,
+                    "opportunities": [{"id": "a-1"}, {"id": "b-2", "n": 12345}], "tail": 7}
+        path = tmp_path / 'opportunities.json'
+        path.write_text(json.dumps(document))
+
+        records = list(opportunity_stream.iter_opportunities(str(path), chunk_size=64))
+        fields = {key: value for event, key, value in opportunity_stream.iter_document(
+                      str(path), chunk_size=64, max_record_size=1000) if event == opportunity_stream.EVENT_FIELD}
+
+        assert records == document['opportunities']
+        assert opportunity_stream.read_meta(str(path), chunk_size=64) == {"totalCount": 2}
+        assert fields == {"meta": {"totalCount": 2}, "history": history, "tail": 7}
+        assert opportunity_stream.load_document(str(path), chunk_size=64) == document
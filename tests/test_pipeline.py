@@ -0,0 +1,201 @@
+"""
+Unit tests for the pipeline runner
+Tests --from/--until selection, DAG scheduling, failure handling, stage output and the real data stages
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(REPO_ROOT, 'scripts'))
+
+import generate_programs  # noqa: E402
+import memory_profile  # noqa: E402
+import pipeline  # noqa: E402
+import validate_and_merge  # noqa: E402
+from qc.validate_and_merge import validate_and_merge as build_priority_matrix  # noqa: E402
+from qc_context import QCContext  # noqa: E402
+
+
+def _stages(calls, fail=(), barrier=None):
+    """Fake stages for every pipeline stage name, recording their calls"""
+    def make(name):
+        def stage(ctx):
+            if barrier is not None and name in ('qc_validator', 'qc_validate_and_merge'):
+                barrier.wait(timeout=5)
+            calls.append(name)
+            return name not in fail
+        return stage
+    return {name: make(name) for name in pipeline.STAGES}
+
+
+class TestSelectStages:
+    """Tests for --from/--until stage selection"""
+
+    def test_all_stages_by_default(self):
+        """Test that no bounds select every stage in chain order"""
+        assert pipeline.select_stages() == list(pipeline.STAGES)
+
+    def test_from_and_until(self):
+        """Test that --from keeps downstream stages and --until upstream ones"""
+        assert pipeline.select_stages(start='qc_validator') == \
+            ['qc_validator', 'comprehensive_qc_check', 'full_qc_audit']
+        assert pipeline.select_stages(until='generate_programs') == \
+            ['scrape_all', 'validate_and_merge', 'qc_validate_and_merge', 'generate_programs']
+        assert pipeline.select_stages(start='validate_and_merge', until='comprehensive_qc_check') == \
+            ['validate_and_merge', 'qc_validator', 'comprehensive_qc_check']
+        assert pipeline.select_stages(start='generate_programs', until='qc_validator') == []
+
+
+class TestRunStages:
+    """Tests for running stages as a DAG"""
+
+    def test_sequential_runs_in_chain_order(self):
+        """Test that --jobs 1 runs every stage in chain order"""
+        calls = []
+
+        results = pipeline.run_stages(_stages(calls), ctx=None, jobs=1)
+
+        assert calls == list(pipeline.STAGES)
+        assert all(result['status'] == pipeline.PASSED for result in results.values())
+
+    def test_independent_stages_run_concurrently(self):
+        """Test that the QC and priority-matrix branches run at the same time, after their dependency"""
+        calls = []
+        # Both branch stages must be running at once to pass the barrier
+        barrier = threading.Barrier(2)
+
+        results = pipeline.run_stages(_stages(calls, barrier=barrier), ctx=None, jobs=4)
+
+        assert list(results) == list(pipeline.STAGES)
+        assert all(result['status'] == pipeline.PASSED for result in results.values())
+        for name, deps in pipeline.STAGE_DEPENDENCIES.items():
+            assert all(calls.index(dep) < calls.index(name) for dep in deps)
+
+    def test_failure_skips_dependents_only(self):
+        """Test that a failed stage skips what depends on it while other branches run"""
+        calls = []
+
+        results = pipeline.run_stages(_stages(calls, fail=('qc_validate_and_merge',)), ctx=None, jobs=4)
+
+        statuses = {name: result['status'] for name, result in results.items()}
+        assert statuses['qc_validate_and_merge'] == pipeline.FAILED
+        assert statuses['generate_programs'] == pipeline.SKIPPED
+        assert statuses['full_qc_audit'] == pipeline.SKIPPED
+        assert statuses['comprehensive_qc_check'] == pipeline.PASSED
+        assert 'generate_programs' not in calls
+
+    def test_advisory_failure_does_not_block(self):
+        """Test that a failed advisory stage still lets later stages run"""
+        calls = []
+
+        results = pipeline.run_stages(_stages(calls, fail=('comprehensive_qc_check',)), ctx=None, jobs=1)
+
+        assert results['comprehensive_qc_check']['status'] == pipeline.FAILED
+        assert results['full_qc_audit']['status'] == pipeline.PASSED
+
+    def test_exception_counts_as_failure(self):
+        """Test that a stage raising an exception fails without stopping the runner"""
+        def broken(ctx):
+            raise RuntimeError('boom')
+
+        stages = {'scrape_all': broken, 'validate_and_merge': lambda ctx: True}
+
+        results = pipeline.run_stages(stages, ctx=None, jobs=1)
+
+        assert results['scrape_all']['status'] == pipeline.FAILED
+        assert results['validate_and_merge']['status'] == pipeline.SKIPPED
+
+    def test_profiling_runs_stages_one_at_a_time(self, tmp_path, monkeypatch):
+        """Test that --profile-memory runs every stage on the main thread despite --jobs"""
+        monkeypatch.setattr(memory_profile, 'MEMORY_REPORT_DIR', str(tmp_path))
+        threads = []
+
+        def stage(ctx):
+            threads.append(threading.current_thread())
+            return True
+
+        monkeypatch.setattr(pipeline, 'STAGES', {name: stage for name in pipeline.STAGES})
+
+        assert pipeline.main(['--profile-memory', '--jobs', '4']) == 0
+        assert threads == [threading.main_thread()] * len(pipeline.STAGES)
+
+
+class TestRealStages:
+    """Tests running the real data stages on a small fixture"""
+
+    DATA_STAGES = ('validate_and_merge', 'qc_validate_and_merge', 'generate_programs')
+
+    @staticmethod
+    def _fixture():
+        """A sweep-like document: a few repo records without priority scores"""
+        with open(os.path.join(REPO_ROOT, 'data', 'opportunities.json'), encoding='utf-8') as f:
+            data = json.load(f)
+        opportunities = [{k: v for k, v in opp.items() if k != 'priorityScore'}
+                         for opp in data['opportunities'][:8]]
+        return {'meta': dict(data['meta'], totalCount=len(opportunities)), 'opportunities': opportunities}
+
+    @staticmethod
+    def _outputs(root):
+        """Stage outputs under root, with generation timestamps dropped"""
+        outputs = {}
+        for name in ('opportunities.json', 'processed/programs.json'):
+            with open(root / 'data' / name, encoding='utf-8') as f:
+                data = json.load(f)
+            data['meta'].pop('updated')
+            outputs[name] = data
+        outputs['processed/priority_matrix.csv'] = (root / 'data' / 'processed' / 'priority_matrix.csv').read_text()
+        return outputs
+
+    def test_shared_context_matches_script_path(self, tmp_path, monkeypatch):
+        """Test that the in-process stages produce what the standalone scripts do"""
+        document = self._fixture()
+        for root in (tmp_path / 'script', tmp_path / 'pipeline'):
+            (root / 'data').mkdir(parents=True)
+            (root / 'data' / 'opportunities.json').write_text(json.dumps(document, indent=2))
+
+        monkeypatch.chdir(tmp_path / 'script')
+        assert validate_and_merge.main([]) == 0
+        build_priority_matrix()
+        assert generate_programs.generate_programs_json()
+
+        # The in-process run must work from the context alone, never re-reading opportunities.json
+        def reread(*args, **kwargs):
+            raise AssertionError('opportunities.json re-read')
+
+        monkeypatch.chdir(tmp_path / 'pipeline')
+        monkeypatch.setattr(validate_and_merge, 'iter_opportunities', reread)
+        monkeypatch.setattr(generate_programs, 'iter_opportunities', reread)
+        monkeypatch.setattr(json, 'load', reread)
+        ctx = QCContext()
+        # As the scrape_all stage hands over the sweep's document
+        ctx.provide(meta=document['meta'], opportunities=document['opportunities'])
+        stages = {name: pipeline.STAGES[name] for name in self.DATA_STAGES}
+
+        results = pipeline.run_stages(stages, ctx=ctx, jobs=1)
+        monkeypatch.undo()
+
+        assert all(result['status'] == pipeline.PASSED for result in results.values())
+        assert all('priorityScore' in opp for opp in ctx.opportunities)
+        assert self._outputs(tmp_path / 'pipeline') == self._outputs(tmp_path / 'script')
+
+
+class TestStageOutput:
+    """Tests for per-stage output prefixing"""
+
+    def test_lines_prefixed_per_thread(self):
+        """Test that registered threads get prefixed lines and others write through"""
+        stream = io.StringIO()
+        output = pipeline._StageOutput(stream)
+
+        output.register('qc_validator')
+        output.write('first line\nsecond ')
+        output.write('line\npartial')
+        output.unregister()
+        output.write('runner line\n')
+
+        assert stream.getvalue() == ('[qc_validator] first line\n[qc_validator] second line\n'
+                                     '[qc_validator] partial\nrunner line\n')
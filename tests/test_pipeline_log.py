@@ -0,0 +1,73 @@
+"""
+Unit tests for the shared pipeline logging
+Tests console/JSON output and aggregation of repeated messages
+"""
+
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import pipeline_log  # noqa: E402
+
+
+class TestPipelineLog:
+    """Tests for formatters, level filtering and log_repeated"""
+
+    def setup_method(self):
+        pipeline_log.configure(level='INFO', fmt='console')
+        pipeline_log.flush_repeated()
+
+    def test_console_format(self, capsys):
+        """Test the colored console line and level filtering"""
+        log = pipeline_log.get_logger('test')
+        log.log(pipeline_log.SUCCESS, "done")
+        log.debug("hidden")
+
+        out = capsys.readouterr().out
+        assert out == f"{pipeline_log.COLOR_GREEN}✅ done{pipeline_log.COLOR_RESET}\n"
+
+    def test_repeated_messages_aggregated(self, capsys):
+        """Test that only a sample of a repeated message is written, plus a summary"""
+        log = pipeline_log.get_logger('test')
+        for i in range(pipeline_log.AGGREGATE_SAMPLE + 3):
+            pipeline_log.log_repeated(log, 'Duplicate removed', f"Duplicate removed: {i}")
+        pipeline_log.log_repeated(log, 'Other', "Other: 1")
+
+        totals = pipeline_log.flush_repeated()
+        lines = capsys.readouterr().out.splitlines()
+
+        assert totals == {'Duplicate removed': pipeline_log.AGGREGATE_SAMPLE + 3, 'Other': 1}
+        assert len(lines) == pipeline_log.AGGREGATE_SAMPLE + 2
+        assert "Duplicate removed: ... and 3 more" in lines[-1]
+
+    def test_json_formatter(self):
+        """Test that JSON lines carry level, logger, message and fields"""
+        record = logging.LogRecord('nuview.test', logging.WARNING, __file__, 1, "Found %d", (3,), None)
+        record.fields = {'kind': 'duplicate'}
+
+        entry = json.loads(pipeline_log.JSONFormatter().format(record))
+
+        assert entry['level'] == 'warning'
+        assert entry['logger'] == 'nuview.test'
+        assert entry['msg'] == "Found 3"
+        assert entry['kind'] == 'duplicate'
+        assert entry['ts'].endswith('Z')
+
+    def test_json_lines_written_in_background(self, tmp_path, monkeypatch):
+        """Test that JSON mode writes every record to NUVIEW_LOG_FILE once drained"""
+        path = tmp_path / 'pipeline.jsonl'
+        monkeypatch.setenv(pipeline_log.LOG_FILE_ENV, str(path))
+        log = pipeline_log.get_logger('test')
+        try:
+            pipeline_log.configure(level='INFO', fmt='json')
+            for i in range(100):
+                log.info("record %d", i)
+        finally:
+            pipeline_log.configure(level='INFO', fmt='console')
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 100
+        assert json.loads(lines[-1])['msg'] == "record 99"
@@ -0,0 +1,93 @@
+"""
+Unit tests for the CPU profiling hook
+Tests the --profile option, profile files and sampling of worker threads
+"""
+
+import argparse
+import os
+import pstats
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import profiling  # noqa: E402
+
+
+def _busy(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+class TestProfiling:
+    """Tests for start/stop, @profiled and the --profile option"""
+
+    def test_profile_option(self):
+        """Test that --profile accepts cpu and defaults to off"""
+        parser = argparse.ArgumentParser()
+        profiling.add_profile_argument(parser)
+
+        assert parser.parse_args([]).profile is None
+        assert parser.parse_args(['--profile', 'cpu']).profile == 'cpu'
+
+    def test_no_profile_unless_requested(self, tmp_path, monkeypatch):
+        """Test that a decorated entry point writes nothing when profiling is off"""
+        monkeypatch.setattr(profiling, 'PROFILE_DIR', str(tmp_path))
+        monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+
+        @profiling.profiled('unit')
+        def entry_point():
+            return 'done'
+
+        assert entry_point() == 'done'
+        assert list(tmp_path.iterdir()) == []
+
+    def test_env_writes_pstats_and_collapsed_stacks(self, tmp_path, monkeypatch):
+        """Test that NUVIEW_PROFILE=cpu writes both files, with worker threads in the stacks"""
+        monkeypatch.setattr(profiling, 'PROFILE_DIR', str(tmp_path))
+        monkeypatch.setenv(profiling.PROFILE_ENV, 'cpu')
+
+        @profiling.profiled('unit')
+        def entry_point():
+            worker = threading.Thread(target=_busy, args=(0.2,), name='scraper-worker')
+            worker.start()
+            _busy(0.2)
+            worker.join()
+
+        entry_point()
+
+        [pstats_path] = list(tmp_path.glob('unit-*.pstats'))
+        [collapsed_path] = list(tmp_path.glob('unit-*.collapsed'))
+        functions = {func[2] for func in pstats.Stats(str(pstats_path)).stats}
+        assert 'entry_point' in functions
+
+        lines = collapsed_path.read_text(encoding='utf-8').splitlines()
+        stacks = [line.rsplit(' ', 1)[0] for line in lines]
+        assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        assert any(stack.startswith('MainThread;') and 'entry_point (' in stack for stack in stacks)
+        assert any(stack.startswith('scraper-worker;') and '_busy (' in stack for stack in stacks)
+        assert not any(stack.startswith('nuview-profiler') for stack in stacks)
+        assert profiling._active is None
+
+    def test_nested_entry_point_joins_outer_profile(self, tmp_path, monkeypatch):
+        """Test that an entry point called while profiling is part of the outer profile"""
+        monkeypatch.setattr(profiling, 'PROFILE_DIR', str(tmp_path))
+        monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+
+        @profiling.profiled('inner')
+        def inner():
+            profiling.start('inner')
+
+        @profiling.profiled('outer')
+        def outer():
+            profiling.start('outer')
+            inner()
+
+        outer()
+
+        assert sorted(path.suffix for path in tmp_path.iterdir()) == ['.collapsed', '.pstats']
+        assert all(path.name.startswith('outer-') for path in tmp_path.iterdir())
@@ -5,8 +5,13 @@ Tests validation functions and report generation
 
 import json
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import full_qc_audit  # noqa: E402
+
 
 class TestQCAuditReport:
     """Tests for QC audit report generation and validation"""
@@ -148,6 +153,145 @@ class TestFileValidation:
             assert '#' in content, f"{doc_file}: Missing markdown headers"
 
 
+class TestHTMLStructure:
+    """Tests for the single-pass HTML structure checker"""
+
+    def _check(self, tmp_path, html):
+        path = tmp_path / 'page.html'
+        path.write_text(html)
+        return full_qc_audit._check_html_file(str(path))
+
+    def test_well_formed_page_passes(self, tmp_path):
+        """Test that optional end tags, void and self-closing elements are accepted"""
+        errors, warnings = self._check(tmp_path, (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>T</title></head>\n'
+            '<body><ul><li>a<li>b</ul><p>text<div><br><svg><path d="M0"/></svg></div></body></html>\n'
+        ))
+        assert errors == []
+        assert warnings == []
+
+    def test_misnested_and_unclosed_tags_reported(self, tmp_path):
+        """Test that nesting errors are reported with line numbers"""
+        errors, warnings = self._check(tmp_path, (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8"></head><body>\n'
+            '<div><span></div>\n'
+            '</section>\n'
+            '<main>\n'
+            '</body></html>\n'
+        ))
+        assert errors == []
+        assert any('line 3: </div> closes <span> opened at line 3' in w for w in warnings)
+        assert any('line 4: </section> has no matching open tag' in w for w in warnings)
+        assert any('line 6: </body> closes <main> opened at line 5' in w for w in warnings)
+
+    def test_missing_document_features(self, tmp_path):
+        """Test that missing DOCTYPE, <html> and charset are still reported"""
+        errors, warnings = self._check(tmp_path, '<div>content</div>\n')
+        assert any('Missing <html> tag' in e for e in errors)
+        assert any('Missing DOCTYPE' in w for w in warnings)
+        assert any('Missing charset' in w for w in warnings)
+
+
+class TestCSVValidation:
+    """Tests for the chunked CSV checker"""
+
+    def test_statistics_accumulate_across_chunks(self, tmp_path, monkeypatch):
+        """Test that nulls, duplicate headers and type drift are found across chunks"""
+        monkeypatch.setattr(full_qc_audit, 'CSV_CHUNK_ROWS', 2)
+        path = tmp_path / 'matrix.csv'
+        path.write_text('rank,name,rank\n1,a,1\n2,,2\n3,c,3\nx,d,4\n5,,5\n')
+
+        errors, warnings = full_qc_audit._check_csv_file(str(path))
+
+        assert errors == [f"{path}: Contains duplicate column headers"]
+        assert f"{path}: Contains 2 null values" in warnings
+        assert f"{path}: Column 'rank' has inconsistent types (numeric, text)" in warnings
+
+    def test_header_only_file(self, tmp_path):
+        """Test that a CSV with a header and no rows is reported as empty"""
+        path = tmp_path / 'empty.csv'
+        path.write_text('a,b\n')
+
+        assert full_qc_audit._check_csv_file(str(path)) == ([], [f"{path}: File is empty"])
+
+
+class TestPerformanceGate:
+    """Tests for the --perf baseline comparison"""
+
+    def _measured(self, monkeypatch, timings, calibration=0.5):
+        results = [{'case': name, 'size': 2000, 'min': seconds, 'relative': seconds / calibration,
+                    'peak_bytes': 1000000}
+                   for name, seconds in timings.items()]
+        monkeypatch.setattr(full_qc_audit, 'measure_performance', lambda: {'results': results})
+
+    def _baseline(self, tmp_path, cases=('keyword_scoring', 'merge', 'schema_validation')):
+        baseline = tmp_path / 'baseline.json'
+        baseline.write_text(json.dumps({'results': [
+            {'case': name, 'size': 2000, 'min': 0.5, 'relative': 1.0, 'peak_bytes': 1000000}
+            for name in cases
+        ]}))
+        return str(baseline)
+
+    def test_regressions_classified_by_tolerance(self, tmp_path, monkeypatch):
+        """Test that mild slowdowns warn, large ones error and missing cases warn"""
+        baseline = self._baseline(tmp_path)
+        self._measured(monkeypatch, {'keyword_scoring': 0.55, 'merge': 0.65, 'schema_validation': 1.0,
+                                     'source_matrix': 0.5})
+
+        errors, warnings = full_qc_audit.check_performance(baseline)
+
+        assert errors == ["schema_validation time: 2.00 calibration loops vs baseline 1.00 calibration loops (2.00x)"]
+        assert warnings == ["merge time: 1.30 calibration loops vs baseline 1.00 calibration loops (1.30x)",
+                            "source_matrix: no baseline for 2000 records"]
+
+    def test_slower_host_is_not_a_regression(self, tmp_path, monkeypatch):
+        """Test that a uniformly slower machine passes, since times are relative to the calibration loop"""
+        baseline = self._baseline(tmp_path)
+        self._measured(monkeypatch, {'keyword_scoring': 1.5, 'merge': 1.5, 'schema_validation': 1.5},
+                       calibration=1.5)
+
+        assert full_qc_audit.check_performance(baseline) == ([], [])
+
+    def test_performance_errors_fail_the_audit(self):
+        """Test that a single performance error fails the audit, unlike other categories"""
+        other = {'Python Files': {'errors': ['x'], 'warnings': [], 'files_checked': 1}}
+        perf = {'Performance': {'errors': ['merge time: ...'], 'warnings': [], 'files_checked': 0}}
+
+        assert full_qc_audit.print_summary(other, 'report.json') == 0
+        assert full_qc_audit.print_summary(perf, 'report.json') == 1
+
+
+class TestDataIntegrity:
+    """Tests for the in-process data integrity stage"""
+
+    def test_crashing_validator_fails_the_audit(self, monkeypatch):
+        """Test that an exception from qc_validator is an error that fails the audit"""
+        def crash(argv=None, ctx=None):
+            raise KeyError('opportunities')
+
+        monkeypatch.setattr(full_qc_audit.qc_validator, 'main', crash)
+        monkeypatch.setattr(full_qc_audit.comprehensive_qc_check, 'main', lambda ctx=None: 0)
+
+        errors, warnings = full_qc_audit.check_data_integrity()
+        results = {'Data Integrity': {'errors': errors, 'warnings': warnings, 'files_checked': 0}}
+
+        assert errors == ["QC validator crashed: KeyError: 'opportunities'"]
+        assert full_qc_audit.print_summary(results, 'report.json') == 1
+
+    def test_known_verdicts_are_not_rerun(self, monkeypatch):
+        """Test that verdicts passed in from the pipeline are used instead of running the checks"""
+        def rerun(*args, **kwargs):
+            raise AssertionError('check ran again')
+
+        monkeypatch.setattr(full_qc_audit.qc_validator, 'main', rerun)
+        monkeypatch.setattr(full_qc_audit.comprehensive_qc_check, 'main', rerun)
+
+        errors, warnings = full_qc_audit.check_data_integrity(
+            verdicts={'qc_validator': 0, 'comprehensive_qc_check': 1})
+
+        assert errors == []
+        assert len(warnings) == 1
+
 class TestQCAuditCoverage:
     """Tests for QC audit coverage and completeness"""
 
@@ -0,0 +1,72 @@
+"""
+Unit tests for the shared QC context
+Tests that artifacts are parsed once, re-read after invalidation and replaced by provide()
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import qc_context  # noqa: E402
+
+
+def _context(tmp_path):
+    path = tmp_path / 'opportunities.json'
+    path.write_text(json.dumps({"meta": {"totalCount": 1}, "opportunities": [{"id": "usgs-1"}]}))
+    return qc_context.QCContext(opportunities_path=str(path)), path
+
+
+class TestQCContext:
+    """Tests for QCContext caching"""
+
+    def test_artifacts_loaded_once(self, tmp_path, monkeypatch):
+        """Test that records are parsed on first use only"""
+        ctx, _path = _context(tmp_path)
+        calls = []
+        original = qc_context.iter_opportunities
+
+        def counting_iter(path):
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(qc_context, 'iter_opportunities', counting_iter)
+
+        assert ctx.opportunities == [{"id": "usgs-1"}]
+        assert ctx.opportunities is ctx.opportunities
+        assert ctx.meta == {"totalCount": 1}
+        assert len(calls) == 1
+
+    def test_views_and_invalidate(self, tmp_path):
+        """Test that derived views are memoized and dropped on invalidate"""
+        ctx, path = _context(tmp_path)
+        builds = []
+
+        def build(context):
+            builds.append(1)
+            return [opp['id'] for opp in context.opportunities]
+
+        assert ctx.view('ids', build) == ['usgs-1']
+        assert ctx.view('ids', build) == ['usgs-1']
+        assert len(builds) == 1
+
+        path.write_text(json.dumps({"meta": {"totalCount": 1}, "opportunities": [{"id": "nasa-2"}]}))
+        ctx.invalidate('opportunities')
+
+        assert ctx.view('ids', build) == ['nasa-2']
+        assert len(builds) == 2
+
+    def test_provide_replaces_artifacts(self, tmp_path, monkeypatch):
+        """Test that provided artifacts are used without reading the file"""
+        ctx, _path = _context(tmp_path)
+        ctx.view('ids', lambda context: [opp['id'] for opp in context.opportunities])
+        monkeypatch.setattr(qc_context, 'iter_opportunities', lambda path: pytest.fail('file re-read'))
+
+        ctx.provide(opportunities=[{"id": "jaxa-3"}])
+
+        assert ctx.view('ids', lambda context: [opp['id'] for opp in context.opportunities]) == ['jaxa-3']
+        with pytest.raises(ValueError):
+            ctx.provide(programs=[])
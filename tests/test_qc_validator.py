@@ -0,0 +1,168 @@
+"""
+Unit tests for qc_validator
+Tests incremental validation with the per-record QC cache
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'scrapers'))
+
+import qc_validator  # noqa: E402
+from federal_scrapers import NASAScraper, USGSScraper  # noqa: E402
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def _load_opportunities():
+    with open(os.path.join(REPO_ROOT, 'data', 'opportunities.json'), 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    return str(path)
+
+
+class TestIncrementalQC:
+    """Tests for the QC result cache"""
+
+    def test_cached_results_match_fresh_results(self, tmp_path, monkeypatch):
+        """Test that a cached run reports exactly what a full run reports"""
+        monkeypatch.chdir(REPO_ROOT)
+        data = _load_opportunities()
+        data['opportunities'][2]['timeline']['urgency'] = 'someday'
+        data['opportunities'][4]['category'] = 'Unknown'
+        data['opportunities'].append(dict(data['opportunities'][2]))
+        path = _write_json(tmp_path / 'opportunities.json', data)
+        cache = str(tmp_path / 'qc_cache.json')
+
+        uncached = qc_validator.validate_opportunities_file(path, cache_path=None)
+        first = qc_validator.validate_opportunities_file(path, cache_path=cache)
+        second = qc_validator.validate_opportunities_file(path, cache_path=cache)
+
+        assert uncached[:2] == first[:2] == second[:2]
+        assert any("Opportunity 2 " in e and 'someday' in e for e in second[0])
+        assert any("Opportunity 128 " in e and 'someday' in e for e in second[0])
+
+    def test_only_changed_records_are_validated(self, tmp_path, monkeypatch):
+        """Test that unchanged records reuse their cached verdict"""
+        monkeypatch.chdir(REPO_ROOT)
+        data = _load_opportunities()
+        path = _write_json(tmp_path / 'opportunities.json', data)
+        cache = str(tmp_path / 'qc_cache.json')
+        qc_validator.validate_opportunities_file(path, cache_path=cache)
+
+        calls = []
+        original = qc_validator.check_opportunity
+
+        def counting_check(opp, item_validator=None):
+            calls.append(opp.get('id'))
+            return original(opp, item_validator)
+
+        monkeypatch.setattr(qc_validator, 'check_opportunity', counting_check)
+        data['opportunities'][0]['funding']['amountUSD'] = 'unknown'
+        _write_json(tmp_path / 'opportunities.json', data)
+
+        errors, _warnings, _data = qc_validator.validate_opportunities_file(path, cache_path=cache)
+
+        assert calls == [data['opportunities'][0]['id']]
+        assert any('funding.amountUSD must be numeric' in e for e in errors)
+
+    def test_consecutive_sweeps_reuse_verdicts(self, tmp_path, monkeypatch):
+        """Test that re-scraped records (new ids and scrape times) reuse their verdicts"""
+        monkeypatch.chdir(REPO_ROOT)
+        cache = str(tmp_path / 'qc_cache.json')
+        path = str(tmp_path / 'opportunities.json')
+
+        def sweep():
+            opportunities = USGSScraper().scrape() + NASAScraper().scrape()
+            opportunities[0]['category'] = 'Unknown'
+            return _write_json(path, {'meta': {}, 'opportunities': opportunities}), opportunities
+
+        path, first = sweep()
+        qc_validator.validate_opportunities_file(path, cache_path=cache)
+
+        calls = []
+        monkeypatch.setattr(qc_validator, 'check_opportunity', lambda *args: calls.append(args))
+        path, second = sweep()
+        _errors, warnings, _data = qc_validator.validate_opportunities_file(path, cache_path=cache)
+
+        assert [opp['id'] for opp in first] != [opp['id'] for opp in second]
+        assert calls == []
+        assert f"Opportunity 0 ({second[0]['id']}): Invalid category 'Unknown'" in warnings[0]
+
+    def test_schema_change_invalidates_cache(self, tmp_path):
+        """Test that verdicts are not reused across schema versions"""
+        cache = str(tmp_path / 'qc_cache.json')
+        version = qc_validator.schema_version({"type": "object"})
+        qc_validator.save_qc_cache(cache, version, {"abc": [[], []]})
+
+        assert qc_validator.load_qc_cache(cache, version) == {"abc": [[], []]}
+        assert qc_validator.load_qc_cache(cache, qc_validator.schema_version({"type": "array"})) == {}
+
+
+class TestSchemaValidation:
+    """Tests for the compiled schema validator and error cap"""
+
+    def test_validators_are_compiled_once(self, monkeypatch):
+        """Test that the schema and its validators are reused between calls"""
+        monkeypatch.chdir(REPO_ROOT)
+        schema = qc_validator.load_schema()
+
+        assert qc_validator.load_schema() is schema
+        assert qc_validator.get_schema_validators(schema) == qc_validator.get_schema_validators(schema)
+
+    def test_error_cap_stops_early(self, monkeypatch):
+        """Test that validation stops after max_errors and says so"""
+        monkeypatch.chdir(REPO_ROOT)
+        schema = qc_validator.load_schema()
+        consumed = []
+
+        def stream():
+            for i in range(1000):
+                consumed.append(i)
+                yield {"id": "BAD ID"}
+
+        data = {"meta": _load_opportunities()['meta'], "opportunities": stream()}
+        errors = qc_validator.validate_with_schema(data, schema, max_errors=5)
+
+        assert len(errors) == 6
+        assert errors[-1] == qc_validator.schema_cap_message(5)
+        assert len(consumed) < 10
+
+    def test_file_validation_respects_cap(self, tmp_path, monkeypatch):
+        """Test that validate_opportunities_file caps schema errors but keeps field checks"""
+        monkeypatch.chdir(REPO_ROOT)
+        data = _load_opportunities()
+        for opp in data['opportunities']:
+            opp['id'] = 'BAD ID'
+        path = _write_json(tmp_path / 'opportunities.json', data)
+
+        errors, _warnings, _data = qc_validator.validate_opportunities_file(
+            path, cache_path=str(tmp_path / 'qc_cache.json'), max_schema_errors=3)
+
+        schema_errors = [e for e in errors if e.startswith('Schema validation')]
+        assert len(schema_errors) == 4
+        assert schema_errors[-1] == qc_validator.schema_cap_message(3)
+
+    def test_file_validation_exactly_at_cap_is_not_truncated(self, tmp_path, monkeypatch):
+        """Test that exactly max_schema_errors errors are reported without the cap message"""
+        monkeypatch.chdir(REPO_ROOT)
+        data = _load_opportunities()
+        for opp in data['opportunities'][:3]:
+            opp['id'] = 'BAD ID'
+        path = _write_json(tmp_path / 'opportunities.json', data)
+
+        errors, _warnings, _data = qc_validator.validate_opportunities_file(
+            path, cache_path=None, max_schema_errors=3)
+        schema = qc_validator.load_schema()
+        in_memory = qc_validator.validate_with_schema(data, schema, max_errors=3)
+
+        schema_errors = [e for e in errors if e.startswith('Schema validation')]
+        assert len(schema_errors) == 3
+        assert qc_validator.schema_cap_message(3) not in errors
+        assert schema_errors == in_memory
@@ -0,0 +1,110 @@
+"""
+Unit tests for the scraper run history
+Tests the SQLite store, percentiles and regression flags
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'scrapers'))
+
+import scrape_all  # noqa: E402
+import scraper_history  # noqa: E402
+
+
+def _stat(name, duration, records, error=None):
+    stat = {'scraper': name, 'source_type': 'Federal', 'country': 'USA',
+            'duration_seconds': duration, 'opportunities_found': records, 'bytes': 0}
+    if error:
+        stat['error'] = error
+    return stat
+
+
+def _record_sweeps(path, sweeps):
+    for i, stats in enumerate(sweeps):
+        stamp = f"2026-01-{i + 1:02d}T00:00:00Z"
+        scraper_history.record_run(stats, run_id=stamp, started_at=stamp, path=path)
+
+
+class TestScraperHistory:
+    """Tests for recording, estimates and the regression report"""
+
+    def test_percentile(self):
+        """Test linear-interpolated percentiles"""
+        assert scraper_history.percentile([4, 1, 3, 2], 50) == 2.5
+        assert scraper_history.percentile([1, 2, 3, 4, 5], 95) == 4.8
+        assert scraper_history.percentile([], 95) is None
+
+    def test_regressions_flagged(self, tmp_path):
+        """Test that slower and lower-yield scrapers are flagged against their baseline"""
+        path = str(tmp_path / 'history.sqlite')
+        baseline = [[_stat('steady', 1.0, 10), _stat('slower', 1.0, 10), _stat('fewer', 1.0, 10)]] * 6
+        recent = [[_stat('steady', 1.1, 10), _stat('slower', 4.0, 10), _stat('fewer', 1.0, 2)]] * 2
+        _record_sweeps(path, baseline + recent)
+
+        report = {e['scraper']: e for e in scraper_history.regression_report(path, recent=2, window=10)}
+
+        assert report['steady']['flags'] == []
+        assert report['slower']['flags'] == ['latency']
+        assert report['fewer']['flags'] == ['yield']
+        assert report['slower']['recent_p95'] == 4.0
+
+    def test_expected_durations_skip_errors(self, tmp_path):
+        """Test that estimates use successful runs and history is pruned per scraper"""
+        path = str(tmp_path / 'history.sqlite')
+        sweeps = [[_stat('a', 2.0, 5), _stat('b', 9.0, 0, error='timeout')]] * 3 + [[_stat('b', 0.5, 5)]]
+        _record_sweeps(path, sweeps)
+
+        assert scraper_history.expected_durations(path) == {'a': 2.0, 'b': 0.5}
+
+        original = scraper_history.HISTORY_RUNS_PER_SCRAPER
+        scraper_history.HISTORY_RUNS_PER_SCRAPER = 2
+        try:
+            _record_sweeps(path, [[_stat('a', 2.0, 5)]])
+        finally:
+            scraper_history.HISTORY_RUNS_PER_SCRAPER = original
+        assert len(scraper_history.load_history(path)['a']) == 2
+
+    def test_sweep_records_bytes(self, tmp_path):
+        """Test that a real scraper run stores the size of the records it emitted"""
+        path = str(tmp_path / 'history.sqlite')
+        opportunities, stat = scrape_all.run_single_scraper(scrape_all.USGSScraper(), 1, 1)
+
+        scraper_history.record_run([stat], run_id='sweep', started_at='2026-01-01T00:00:00Z', path=path)
+
+        conn = scraper_history.connect(path)
+        try:
+            [(stored,)] = conn.execute("SELECT bytes FROM scraper_runs WHERE scraper = ?",
+                                       (stat['scraper'],)).fetchall()
+        finally:
+            conn.close()
+        assert stored > 0
+        assert stored == len(json.dumps(opportunities, ensure_ascii=False, default=str).encode('utf-8'))
+
+
+class _Job:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestScheduling:
+    """Tests for priority classes and longest-first submission order"""
+
+    def test_priority_then_longest_first(self):
+        """Test that priority classes come first and unknown durations lead their class"""
+        jobs = [_Job(n) for n in ('short', 'long', 'new', 'key')]
+        estimates = {'short': 1.0, 'long': 9.0, 'key': 0.5}
+
+        ordered = scrape_all.schedule_scrapers(jobs, estimates, priorities={'key': scrape_all.PRIORITY_HIGH})
+
+        assert [j.name for j in ordered] == ['key', 'new', 'long', 'short']
+
+    def test_longest_first_shortens_makespan(self):
+        """Test that LPT order beats submitting the long job last"""
+        durations = [1.0, 1.0, 1.0, 1.0, 4.0]
+
+        assert scrape_all.estimate_makespan(durations, workers=2) == 6.0
+        assert scrape_all.estimate_makespan(sorted(durations, reverse=True), workers=2) == 4.0
+        assert scrape_all.estimate_makespan([], workers=2) == 0.0
@@ -0,0 +1,96 @@
+"""
+Unit tests for stage tracing
+Tests span nesting, run trace files and Chrome trace export
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import tracing  # noqa: E402
+
+
+class TestTracing:
+    """Tests for spans, runs and trace export"""
+
+    def test_run_writes_nested_spans(self, tmp_path, monkeypatch):
+        """Test that a run writes its nested spans with attributes"""
+        monkeypatch.setattr(tracing, 'TRACE_DIR', str(tmp_path))
+        monkeypatch.setenv(tracing.TRACE_ENV, '1')
+
+        @tracing.traced('inner')
+        def inner():
+            tracing.annotate(records=3)
+
+        @tracing.traced('outer', run=True)
+        def outer():
+            with tracing.span('load', bytes=10):
+                inner()
+
+        outer()
+
+        files = list(tmp_path.glob('trace-outer-*.json'))
+        assert len(files) == 1
+        trace = json.loads(files[0].read_text())
+        spans = {s['name']: s for s in trace['spans']}
+        assert set(spans) == {'outer', 'load', 'inner'}
+        assert spans['load']['parent'] == spans['outer']['id']
+        assert spans['inner']['parent'] == spans['load']['id']
+        assert spans['inner']['attrs'] == {'records': 3}
+        assert spans['load']['attrs'] == {'bytes': 10}
+        assert spans['outer']['duration'] >= spans['inner']['duration']
+
+    def test_nested_run_joins_outer_run(self, tmp_path, monkeypatch):
+        """Test that an entry point called inside another run writes no file of its own"""
+        monkeypatch.setattr(tracing, 'TRACE_DIR', str(tmp_path))
+        monkeypatch.setenv(tracing.TRACE_ENV, '1')
+
+        with tracing.span('outer', run=True):
+            with tracing.span('nested', run=True):
+                pass
+
+        assert [f.name.split('-')[1] for f in tmp_path.glob('trace-*.json')] == ['outer']
+
+    def test_disabled(self, tmp_path, monkeypatch):
+        """Test that NUVIEW_TRACE=0 records nothing"""
+        monkeypatch.setattr(tracing, 'TRACE_DIR', str(tmp_path))
+        monkeypatch.setenv(tracing.TRACE_ENV, '0')
+
+        with tracing.span('outer', run=True) as s:
+            s.set(records=1)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_old_traces_pruned_on_write(self, tmp_path, monkeypatch):
+        """Test that writing a run keeps only the newest MAX_TRACES trace files"""
+        monkeypatch.setattr(tracing, 'TRACE_DIR', str(tmp_path))
+        monkeypatch.setattr(tracing, 'MAX_TRACES', 3)
+        monkeypatch.setenv(tracing.TRACE_ENV, '1')
+        for day in range(1, 6):
+            old = tmp_path / f'trace-old-202511{day:02d}T000000Z-1.json'
+            old.write_text('{}')
+            os.utime(old, (day, day))
+        (tmp_path / 'scraper_fleet.prom').write_text('')
+
+        with tracing.span('outer', run=True):
+            pass
+
+        remaining = sorted(f.name for f in tmp_path.iterdir())
+        assert len(remaining) == 4
+        assert remaining[:3] == ['scraper_fleet.prom', 'trace-old-20251104T000000Z-1.json',
+                                 'trace-old-20251105T000000Z-1.json']
+        assert remaining[3].startswith('trace-outer-')
+
+    def test_chrome_export(self):
+        """Test conversion to Chrome complete events in microseconds"""
+        trace = {'run': 'r', 'spans': [
+            {'id': '1-1', 'parent': None, 'name': 'stage', 'start': 2.0, 'duration': 0.5,
+             'pid': 1, 'tid': 7, 'attrs': {'records': 4}},
+        ]}
+
+        events = tracing.to_chrome_trace(trace)['traceEvents']
+
+        assert events == [{'name': 'stage', 'cat': 'pipeline', 'ph': 'X', 'ts': 2000000, 'dur': 500000,
+                           'pid': 1, 'tid': 7, 'args': {'records': 4}}]